@@ -1,8 +1,29 @@
 // calendar-events.js
 
+// Month shards are generated by aws/build-calendar-feeds.py (one file per YYYY-MM,
+// empty months included). A missing shard means a month past the generated range,
+// which has no events; only other failures fall back to the full event list.
+function currentMonthShardUrl() {
+    const now = new Date();
+    const monthText = String(now.getMonth() + 1).padStart(2, '0');
+    return `/assets/json-data/calendar-events/${now.getFullYear()}-${monthText}.json`;
+}
+
+function fetchEventsJson(url) {
+    return fetch(url).then(response => {
+        if (response.status === 404) {
+            return [];
+        }
+        if (!response.ok) {
+            throw new Error(`HTTP ${response.status} for ${url}`);
+        }
+        return response.json();
+    });
+}
+
 document.addEventListener("DOMContentLoaded", function() {
-    fetch('/assets/json-data/calendar-events.json')
-        .then(response => response.json())
+    fetchEventsJson(currentMonthShardUrl())
+        .catch(() => fetchEventsJson('/assets/json-data/calendar-events.json'))
         .then(data => {
             populateCalendar(data);
         })
@@ -2,6 +2,7 @@
 
 /* Begin configuration */
 const detailJsonBasePath = "/assets/json-data/";
+const detailBundleUrl = "/assets/json-data/flame-colorant-chemicals-bundle.json";
 const detailContainerElementId = "colorant-detail-container";
 /* End configuration */
 
@@ -587,6 +588,35 @@ function renderDetailError(messageText) {
 /* End error handling */
 
 /* Begin data loading */
+/*
+   The bundle (built by aws/build-chemical-bundle.py) holds every chemical
+   record keyed by file name, so moving between chemicals reuses one cached
+   response. If the bundle is missing or lacks the file, fall back to the
+   individual per-chemical JSON file.
+*/
+function fetchJson(jsonUrl, fetchOptions) {
+    return fetch(jsonUrl, fetchOptions).then(function (responseObject) {
+        if (!responseObject.ok) {
+            throw new Error("HTTP " + responseObject.status);
+        }
+        return responseObject.json();
+    });
+}
+
+function loadChemicalFromBundle(fileName) {
+    return fetchJson(detailBundleUrl, {}).then(function (bundleData) {
+        const chemicalMap = bundleData && bundleData.chemicals;
+        if (!chemicalMap || !Object.prototype.hasOwnProperty.call(chemicalMap, fileName)) {
+            throw new Error("Not in bundle: " + fileName);
+        }
+        return chemicalMap[fileName];
+    });
+}
+
+function loadChemicalFromFile(fileName) {
+    return fetchJson(detailJsonBasePath + fileName, { cache: "no-cache" });
+}
+
 function loadChemicalDetail() {
     const fileName = getQueryParameter("file");
     
@@ -602,14 +632,13 @@ function loadChemicalDetail() {
         return;
     }
     
-    const jsonUrl = detailJsonBasePath + fileName;
-    
-    fetch(jsonUrl, { cache: "no-cache" })
-        .then(function (responseObject) {
-            if (!responseObject.ok) {
-                throw new Error("HTTP " + responseObject.status);
-            }
-            return responseObject.json();
+    loadChemicalFromBundle(fileName)
+        .catch(function (bundleErrorObject) {
+            console.warn(
+                "motor-color-chemical-details.js: Bundle lookup failed, loading file:",
+                bundleErrorObject
+            );
+            return loadChemicalFromFile(fileName);
         })
         .then(function (chemicalData) {
             renderChemicalDetails(chemicalData);
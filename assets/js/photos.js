@@ -1,6 +1,33 @@
 // photos.js
 
 
+// Build the card image markup. Entries processed by aws/build-photo-variants.py
+// carry a "responsive" object with AVIF/WebP srcsets and a blur placeholder;
+// older entries fall back to the full-size image.
+function buildCardImageHtml(image) {
+    const responsive = image.responsive;
+    if (!responsive || !responsive.srcset) {
+        return `<img src="${image.fullsize}" class="card-img-top" alt="${image.title}" data-fullsize="${image.fullsize}">`;
+    }
+    
+    const sizes = '(min-width: 768px) 33vw, 100vw';
+    let sourcesHtml = '';
+    ['avif', 'webp'].forEach(function(format) {
+        if (responsive.srcset[format]) {
+            sourcesHtml += `<source type="image/${format}" srcset="${responsive.srcset[format]}" sizes="${sizes}">`;
+        }
+    });
+    
+    return `
+        <picture>
+            ${sourcesHtml}
+            <img src="${responsive.fallback}" class="card-img-top" alt="${image.title}" data-fullsize="${image.fullsize}"
+                 width="${responsive.width}" height="${responsive.height}" loading="lazy" decoding="async"
+                 style="height: auto; background-size: cover; background-image: url('${responsive.placeholder}');">
+        </picture>
+    `;
+}
+
 $(document).ready(function() {
     // Fetch images from a JSON file
     $.getJSON('/assets/json-data/photos.json', function(data) {
@@ -13,7 +40,7 @@ $(document).ready(function() {
             // Create a card for each image
             let card = $(`
                 <div class="card">
-                    <img src="${image.fullsize}" class="card-img-top" alt="${image.title}" data-fullsize="${image.fullsize}">
+                    ${buildCardImageHtml(image)}
                     <div class="card-body">
                         <h5 class="card-title custom-title">${image.title}</h5>
                         <p class="card-text"><strong>Club:</strong> <span class="custom-text">${image.club}</span></p>
@@ -19,8 +19,16 @@ document.addEventListener("DOMContentLoaded", function () {
         .then((data) => {
             if (data.images && Array.isArray(data.images) && data.images.length > 0) {
                 function rotateImage() {
-                    const { title, club, date, fullsize } = data.images[index];
-                    imageElement.src = fullsize;
+                    const { title, club, date, fullsize, responsive } = data.images[index];
+                    // Prefer the generated WebP variants when the manifest has them
+                    if (responsive && responsive.srcset && responsive.srcset.webp) {
+                        imageElement.srcset = responsive.srcset.webp;
+                        imageElement.sizes = "100vw";
+                        imageElement.src = responsive.fallback;
+                    } else {
+                        imageElement.removeAttribute("srcset");
+                        imageElement.src = fullsize;
+                    }
                     imageElement.alt = title;
                     titleElement.textContent = title;
                     clubElement.textContent = `Club: ${club}`;
@@ -0,0 +1,45 @@
+// upcoming-events.js
+
+// upcoming.json is generated by aws/build-calendar-feeds.py. Events that ended
+// since the last build are skipped here so the list stays current between builds.
+document.addEventListener("DOMContentLoaded", function() {
+    fetch('/assets/json-data/calendar-events/upcoming.json')
+        .then(response => {
+            if (!response.ok) {
+                throw new Error(`HTTP ${response.status} for upcoming.json`);
+            }
+            return response.json();
+        })
+        .then(digest => {
+            populateUpcomingEvents(digest.events || []);
+        })
+        .catch(error => {
+            console.error('Error loading upcoming events:', error);
+            populateUpcomingEvents([]);
+        });
+});
+
+function populateUpcomingEvents(events) {
+    const listElement = document.getElementById('upcoming-event-list');
+    const now = new Date();
+    const monthText = String(now.getMonth() + 1).padStart(2, '0');
+    const dayText = String(now.getDate()).padStart(2, '0');
+    const todayText = `${now.getFullYear()}-${monthText}-${dayText}`;
+
+    const currentEvents = events.filter(event => event.end_date >= todayText);
+    if (currentEvents.length === 0) {
+        listElement.innerHTML = '<li class="list-group-item">No upcoming events.</li>';
+        return;
+    }
+
+    let listHTML = '';
+    currentEvents.forEach(event => {
+        const dateText = event.start_date === event.end_date
+            ? event.start_date
+            : `${event.start_date} to ${event.end_date}`;
+        const timeText = event.start_time ? ` ${event.start_time} - ${event.end_time}` : '';
+        const locationText = event.location_name ? ` - ${event.location_name}` : '';
+        listHTML += `<li class="list-group-item"><strong>${event.name}</strong><br>${dateText}${timeText}${locationText}</li>`;
+    });
+    listElement.innerHTML = listHTML;
+}
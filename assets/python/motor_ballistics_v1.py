@@ -0,0 +1,537 @@
+"""
+motor_ballistics_v1.py
+
+Vectorized internal-ballistics estimates for BATES reloads.
+
+Given a reload's GrainGeometry, the assembly's NozzleGeometry and a
+propellant's burn-rate coefficients, this module steps the grains through
+web regression and computes, at every step:
+    - burning surface area
+    - Kn (burning area / throat area)
+    - steady-state chamber pressure, Pc = (Kn * a * rho * c* / g)^(1 / (1 - n))
+    - thrust, F = Cf * Pc * At (ideal Cf from the nozzle expansion ratio,
+      scaled by a nozzle efficiency)
+
+and reduces them to the fields of PerformanceEstimates (initial/maximum Kn,
+peak/average pressure, Isp, total impulse, chamber residence time).
+
+Grains are assumed to be standard BATES: outer surface inhibited by the
+liner, core and both ends burning. All math runs on NumPy arrays shaped
+(configurations, web steps), so simulate_bates_batch() evaluates thousands
+of geometry/nozzle combinations in a single call with no Python loop per
+configuration.
+
+Example:
+    estimates = estimate_performance(reload.grain_geometry, nozzle, propellant)
+    reload = fill_performance_estimates(reload, nozzle, propellant)
+
+Usage as a script:
+    python3 motor_ballistics_v1.py ../json-data/motor-data \\
+        motor_reload_magenta_red_54mm_amw_long_v1 --burn-rate-coefficient 0.027
+
+Depends on:
+    numpy
+    motor_common_v1.py
+    motor_parts_v1.py
+    motor_reloads_v1.py
+    motor_store_v1.py
+    motor_resolve_v1.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from motor_common_v1 import NozzleGeometry, PartRole
+from motor_parts_v1 import NozzlePart
+from motor_reloads_v1 import GrainGeometry, MotorReload, PerformanceEstimates
+from motor_store_v1 import LocalJsonFileStore, save_motor_reload
+from motor_resolve_v1 import ResolutionSession, ResolvedAssembly
+
+
+# Bumped whenever a change alters simulation results for the same inputs.
+SOLVER_VERSION = "bates-2"
+
+DEFAULT_WEB_STEPS = 200
+STANDARD_GRAVITY_FT_PER_S2 = 32.174
+AMBIENT_PRESSURE_PSI = 14.696
+NEWTON_SECONDS_PER_POUND_SECOND = 4.448222
+GRAMS_PER_POUND = 453.59237
+INCHES_PER_FOOT = 12.0
+EXIT_MACH_ITERATIONS = 60
+
+NOZZLE_ROLES = (PartRole.AFT_CLOSURE_NOZZLE, PartRole.NOZZLE)
+
+
+# ---------------------------------------------------------------------------
+# Propellant description
+# ---------------------------------------------------------------------------
+
+
+class PropellantProperties(BaseModel):
+    """
+    Propellant parameters needed by the burnback simulation.
+
+    Burn rate follows Saint Robert's law, r = a * Pc^n, with r in inches per
+    second and Pc in psi.
+    """
+
+    propellant_id: Optional[str] = Field(
+        None,
+        description="ID of the propellant formulation these values describe.",
+    )
+    burn_rate_coefficient: float = Field(
+        ...,
+        gt=0,
+        description="Burn-rate coefficient a, in in/s/psi^n.",
+    )
+    burn_rate_exponent: float = Field(
+        ...,
+        ge=0,
+        lt=1,
+        description="Burn-rate pressure exponent n (dimensionless).",
+    )
+    density_lb_per_cubic_inch: float = Field(
+        0.0600,
+        gt=0,
+        description="Propellant density in lb/in^3.",
+    )
+    characteristic_velocity_ft_per_s: float = Field(
+        4900.0,
+        gt=0,
+        description="Delivered characteristic velocity c* in ft/s.",
+    )
+    specific_heat_ratio: float = Field(
+        1.21,
+        gt=1,
+        description="Ratio of specific heats of the exhaust (dimensionless).",
+    )
+    nozzle_efficiency: float = Field(
+        0.90,
+        gt=0,
+        le=1,
+        description="Multiplier applied to the ideal thrust coefficient.",
+    )
+
+
+# Typical hobby APCP; used by the CLI when no coefficients are given.
+GENERIC_APCP = PropellantProperties(
+    propellant_id="generic_apcp",
+    burn_rate_coefficient=0.030,
+    burn_rate_exponent=0.35,
+)
+
+
+# ---------------------------------------------------------------------------
+# Results
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class BatesBatchResult:
+    """Summary values for a batch of configurations, one array entry each."""
+
+    initial_kn: np.ndarray
+    maximum_kn: np.ndarray
+    peak_pressure_psi: np.ndarray
+    average_pressure_psi: np.ndarray
+    total_impulse_newton_second: np.ndarray
+    isp_seconds: np.ndarray
+    burn_time_seconds: np.ndarray
+    propellant_mass_grams: np.ndarray
+    residence_time_milliseconds: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.initial_kn.shape[0])
+
+    def performance_estimates(self, index: int) -> PerformanceEstimates:
+        """PerformanceEstimates for configuration index."""
+        return PerformanceEstimates(
+            initial_kn=round(float(self.initial_kn[index]), 1),
+            maximum_kn=round(float(self.maximum_kn[index]), 1),
+            estimated_peak_pressure_psi=round(float(self.peak_pressure_psi[index]), 1),
+            estimated_average_pressure_psi=round(float(self.average_pressure_psi[index]), 1),
+            estimated_isp_seconds=round(float(self.isp_seconds[index]), 1),
+            estimated_total_impulse_newton_second=round(
+                float(self.total_impulse_newton_second[index]), 1
+            ),
+            chamber_residence_time_milliseconds=round(
+                float(self.residence_time_milliseconds[index]), 3
+            ),
+        )
+
+
+@dataclass(frozen=True)
+class BatesTrace:
+    """Per-step curves for a single configuration (web regression order)."""
+
+    web_regression_inch: np.ndarray
+    time_seconds: np.ndarray
+    burning_area_square_inch: np.ndarray
+    kn: np.ndarray
+    chamber_pressure_psi: np.ndarray
+    thrust_pound_force: np.ndarray
+
+
+# ---------------------------------------------------------------------------
+# Core vectorized solver
+# ---------------------------------------------------------------------------
+
+
+def _ideal_thrust_coefficient(
+    expansion_ratio: np.ndarray,
+    chamber_pressure_psi: np.ndarray,
+    specific_heat_ratio: float,
+) -> np.ndarray:
+    """
+    Ideal thrust coefficient for each (configuration, step).
+
+    The supersonic exit Mach number for each expansion ratio is found by
+    bisection on the area-Mach relation (vectorized, fixed iteration count).
+    """
+    k = specific_heat_ratio
+    exponent = (k + 1.0) / (2.0 * (k - 1.0))
+
+    def area_ratio(mach: np.ndarray) -> np.ndarray:
+        return (1.0 / mach) * ((2.0 / (k + 1.0)) * (1.0 + 0.5 * (k - 1.0) * mach**2)) ** exponent
+
+    low = np.ones_like(expansion_ratio)
+    high = np.full_like(expansion_ratio, 25.0)
+    for _ in range(EXIT_MACH_ITERATIONS):
+        middle = 0.5 * (low + high)
+        too_small = area_ratio(middle) < expansion_ratio
+        low = np.where(too_small, middle, low)
+        high = np.where(too_small, high, middle)
+    exit_mach = 0.5 * (low + high)
+    exit_pressure_ratio = (1.0 + 0.5 * (k - 1.0) * exit_mach**2) ** (-k / (k - 1.0))
+
+    momentum_term = np.sqrt(
+        (2.0 * k * k / (k - 1.0))
+        * (2.0 / (k + 1.0)) ** ((k + 1.0) / (k - 1.0))
+        * (1.0 - exit_pressure_ratio ** ((k - 1.0) / k))
+    )
+    pressure_term = (
+        exit_pressure_ratio[:, None] - AMBIENT_PRESSURE_PSI / chamber_pressure_psi
+    ) * expansion_ratio[:, None]
+    return momentum_term[:, None] + pressure_term
+
+
+def _simulate(
+    outer_diameter_inch: np.ndarray,
+    core_diameter_inch: np.ndarray,
+    grain_length_inch: np.ndarray,
+    grain_count: np.ndarray,
+    throat_diameter_inch: np.ndarray,
+    expansion_ratio: np.ndarray,
+    propellant: PropellantProperties,
+    steps: int,
+) -> dict:
+    """Run the burnback for every configuration; arrays are (configs, steps + 1)."""
+    a = propellant.burn_rate_coefficient
+    n = propellant.burn_rate_exponent
+    rho = propellant.density_lb_per_cubic_inch
+    c_star = propellant.characteristic_velocity_ft_per_s
+
+    # Web burns out at the first of: core reaching the outer wall, or the
+    # two ends meeting.
+    web_inch = np.minimum(
+        (outer_diameter_inch - core_diameter_inch) / 2.0,
+        grain_length_inch / 2.0,
+    )
+    fraction = np.linspace(0.0, 1.0, steps + 1)
+    x = web_inch[:, None] * fraction[None, :]
+
+    outer = outer_diameter_inch[:, None]
+    core = core_diameter_inch[:, None] + 2.0 * x
+    length = np.maximum(grain_length_inch[:, None] - 2.0 * x, 0.0)
+    count = grain_count[:, None]
+
+    core_area = np.pi * core * length
+    end_area = 2.0 * (np.pi / 4.0) * np.maximum(outer**2 - core**2, 0.0)
+    burning_area = count * (core_area + end_area)
+
+    throat_area = (np.pi / 4.0) * throat_diameter_inch**2
+    kn = burning_area / throat_area[:, None]
+
+    pressure_psi = (kn * a * rho * c_star / STANDARD_GRAVITY_FT_PER_S2) ** (1.0 / (1.0 - n))
+    pressure_psi = np.maximum(pressure_psi, AMBIENT_PRESSURE_PSI)
+
+    thrust_coefficient = _ideal_thrust_coefficient(
+        expansion_ratio, pressure_psi, propellant.specific_heat_ratio
+    )
+    thrust_lbf = np.maximum(
+        propellant.nozzle_efficiency * thrust_coefficient * pressure_psi * throat_area[:, None],
+        0.0,
+    )
+
+    # Time from regression: dt = dx / r, using the mean burn rate of each step.
+    burn_rate = a * pressure_psi**n
+    step_rate = 0.5 * (burn_rate[:, 1:] + burn_rate[:, :-1])
+    step_dt = (web_inch / steps)[:, None] / step_rate
+    time_seconds = np.concatenate(
+        [np.zeros((x.shape[0], 1)), np.cumsum(step_dt, axis=1)], axis=1
+    )
+
+    # Free chamber volume is the grain-stack envelope minus unburned propellant.
+    envelope_volume = (np.pi / 4.0) * outer**2 * grain_length_inch[:, None] * count
+    propellant_volume = count * (np.pi / 4.0) * np.maximum(outer**2 - core**2, 0.0) * length
+    free_volume = envelope_volume - propellant_volume
+
+    return {
+        "web_inch": web_inch,
+        "x": x,
+        "burning_area": burning_area,
+        "kn": kn,
+        "pressure_psi": pressure_psi,
+        "thrust_lbf": thrust_lbf,
+        "step_dt": step_dt,
+        "time_seconds": time_seconds,
+        "throat_area": throat_area,
+        "free_volume": free_volume,
+        "initial_propellant_volume": propellant_volume[:, 0],
+    }
+
+
+def _step_mean(values: np.ndarray) -> np.ndarray:
+    """Trapezoid value of each step (configs, steps)."""
+    return 0.5 * (values[:, 1:] + values[:, :-1])
+
+
+def simulate_bates_batch(
+    outer_diameter_inch: np.ndarray,
+    core_diameter_inch: np.ndarray,
+    grain_length_inch: np.ndarray,
+    grain_count: np.ndarray,
+    throat_diameter_inch: np.ndarray,
+    expansion_ratio: np.ndarray,
+    propellant: PropellantProperties,
+    steps: int = DEFAULT_WEB_STEPS,
+) -> BatesBatchResult:
+    """
+    Simulate many BATES configurations at once.
+
+    Every geometry argument is broadcast to a common 1-D shape, so scalars
+    can be mixed with arrays (for example one nozzle across many grain
+    geometries). All lengths are in inches.
+    """
+    arrays = np.broadcast_arrays(
+        *(
+            np.atleast_1d(np.asarray(value, dtype=float))
+            for value in (
+                outer_diameter_inch,
+                core_diameter_inch,
+                grain_length_inch,
+                grain_count,
+                throat_diameter_inch,
+                expansion_ratio,
+            )
+        )
+    )
+    outer, core, length, count, throat, expansion = (np.ravel(value) for value in arrays)
+    if np.any(core >= outer) or np.any(core < 0):
+        raise ValueError("Grain core diameter must be non-negative and smaller than the outer diameter.")
+    if np.any(length <= 0) or np.any(count < 1) or np.any(throat <= 0) or np.any(expansion < 1):
+        raise ValueError("Grain length, grain count, throat diameter and expansion ratio must be positive.")
+
+    run = _simulate(outer, core, length, count, throat, expansion, propellant, steps)
+    step_dt = run["step_dt"]
+    burn_time = step_dt.sum(axis=1)
+
+    impulse_lbf_s = (_step_mean(run["thrust_lbf"]) * step_dt).sum(axis=1)
+    average_pressure = (_step_mean(run["pressure_psi"]) * step_dt).sum(axis=1) / burn_time
+
+    propellant_mass_lb = run["initial_propellant_volume"] * propellant.density_lb_per_cubic_inch
+
+    # Residence time = L* / (c* * Gamma^2), averaged over the burn.
+    k = propellant.specific_heat_ratio
+    gamma_squared = k * (2.0 / (k + 1.0)) ** ((k + 1.0) / (k - 1.0))
+    c_star_inch_per_s = propellant.characteristic_velocity_ft_per_s * INCHES_PER_FOOT
+    characteristic_length = run["free_volume"] / run["throat_area"][:, None]
+    residence_seconds = characteristic_length / (c_star_inch_per_s * gamma_squared)
+    average_residence = (_step_mean(residence_seconds) * step_dt).sum(axis=1) / burn_time
+
+    return BatesBatchResult(
+        initial_kn=run["kn"][:, 0],
+        maximum_kn=run["kn"].max(axis=1),
+        peak_pressure_psi=run["pressure_psi"].max(axis=1),
+        average_pressure_psi=average_pressure,
+        total_impulse_newton_second=impulse_lbf_s * NEWTON_SECONDS_PER_POUND_SECOND,
+        isp_seconds=impulse_lbf_s / propellant_mass_lb,
+        burn_time_seconds=burn_time,
+        propellant_mass_grams=propellant_mass_lb * GRAMS_PER_POUND,
+        residence_time_milliseconds=average_residence * 1000.0,
+    )
+
+
+def simulate_bates(
+    grain_geometry: GrainGeometry,
+    nozzle_geometry: NozzleGeometry,
+    propellant: PropellantProperties,
+    steps: int = DEFAULT_WEB_STEPS,
+) -> BatesTrace:
+    """Full burnback curves for one reload, for plotting or inspection."""
+    run = _simulate(
+        np.array([grain_geometry.grain_outer_diameter_inch]),
+        np.array([grain_geometry.grain_core_diameter_inch]),
+        np.array([grain_geometry.grain_length_inch]),
+        np.array([float(grain_geometry.grain_count)]),
+        np.array([nozzle_geometry.throat_diameter_inch]),
+        np.array([nozzle_geometry.expansion_ratio]),
+        propellant,
+        steps,
+    )
+    return BatesTrace(
+        web_regression_inch=run["x"][0],
+        time_seconds=run["time_seconds"][0],
+        burning_area_square_inch=run["burning_area"][0],
+        kn=run["kn"][0],
+        chamber_pressure_psi=run["pressure_psi"][0],
+        thrust_pound_force=run["thrust_lbf"][0],
+    )
+
+
+# ---------------------------------------------------------------------------
+# Model-level helpers
+# ---------------------------------------------------------------------------
+
+
+def estimate_performance(
+    grain_geometry: GrainGeometry,
+    nozzle_geometry: NozzleGeometry,
+    propellant: PropellantProperties,
+    steps: int = DEFAULT_WEB_STEPS,
+) -> PerformanceEstimates:
+    """PerformanceEstimates for one grain geometry and nozzle."""
+    result = simulate_bates_batch(
+        grain_geometry.grain_outer_diameter_inch,
+        grain_geometry.grain_core_diameter_inch,
+        grain_geometry.grain_length_inch,
+        grain_geometry.grain_count,
+        nozzle_geometry.throat_diameter_inch,
+        nozzle_geometry.expansion_ratio,
+        propellant,
+        steps,
+    )
+    return result.performance_estimates(0)
+
+
+def fill_performance_estimates(
+    motor_reload: MotorReload,
+    nozzle_geometry: NozzleGeometry,
+    propellant: PropellantProperties,
+    steps: int = DEFAULT_WEB_STEPS,
+) -> MotorReload:
+    """Copy of motor_reload with performance_estimates computed from its geometry."""
+    estimates = estimate_performance(
+        motor_reload.grain_geometry, nozzle_geometry, propellant, steps
+    )
+    return motor_reload.model_copy(update={"performance_estimates": estimates})
+
+
+def assembly_nozzle_geometry(resolved_assembly: ResolvedAssembly) -> Optional[NozzleGeometry]:
+    """
+    Nozzle geometry of the first nozzle part in the assembly, if any.
+
+    Only parts in a nozzle role are loaded, so a missing closure or case
+    record does not prevent a performance estimate.
+    """
+    for part_ref in resolved_assembly.assembly.parts:
+        if part_ref.role not in NOZZLE_ROLES:
+            continue
+        part = resolved_assembly.session.part(part_ref.part_id)
+        if isinstance(part, NozzlePart):
+            return part.nozzle_geometry
+    return None
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Estimate BATES reload performance from grain and nozzle geometry.",
+    )
+    parser.add_argument("motor_data_directory", help="Path to the motor-data root.")
+    parser.add_argument("motor_reload_ids", nargs="+", help="Reload IDs to simulate.")
+    parser.add_argument(
+        "--burn-rate-coefficient",
+        type=float,
+        default=GENERIC_APCP.burn_rate_coefficient,
+        help="Burn-rate coefficient a, in in/s/psi^n.",
+    )
+    parser.add_argument(
+        "--burn-rate-exponent",
+        type=float,
+        default=GENERIC_APCP.burn_rate_exponent,
+        help="Burn-rate pressure exponent n.",
+    )
+    parser.add_argument(
+        "--density",
+        type=float,
+        default=GENERIC_APCP.density_lb_per_cubic_inch,
+        help="Propellant density in lb/in^3.",
+    )
+    parser.add_argument(
+        "--c-star",
+        type=float,
+        default=GENERIC_APCP.characteristic_velocity_ft_per_s,
+        help="Characteristic velocity in ft/s.",
+    )
+    parser.add_argument(
+        "--write",
+        action="store_true",
+        help="Save the computed performance_estimates back to each reload.",
+    )
+    args = parser.parse_args(argv)
+
+    base_directory = Path(args.motor_data_directory).resolve()
+    if not base_directory.is_dir():
+        print(f"Not a directory: {base_directory}", file=sys.stderr)
+        return 2
+
+    propellant = PropellantProperties(
+        burn_rate_coefficient=args.burn_rate_coefficient,
+        burn_rate_exponent=args.burn_rate_exponent,
+        density_lb_per_cubic_inch=args.density,
+        characteristic_velocity_ft_per_s=args.c_star,
+    )
+    store = LocalJsonFileStore(base_directory)
+    session = ResolutionSession(store)
+
+    failures = 0
+    for motor_reload_id in args.motor_reload_ids:
+        try:
+            resolved = session.resolve_reload(motor_reload_id)
+            nozzle_geometry = assembly_nozzle_geometry(resolved.assembly)
+        except FileNotFoundError as error:
+            print(f"{motor_reload_id}: {error}", file=sys.stderr)
+            failures += 1
+            continue
+        if nozzle_geometry is None:
+            print(f"{motor_reload_id}: assembly has no nozzle part.", file=sys.stderr)
+            failures += 1
+            continue
+
+        updated = fill_performance_estimates(resolved.motor_reload, nozzle_geometry, propellant)
+        print(
+            f"{motor_reload_id}: "
+            + json.dumps(updated.performance_estimates.model_dump(), sort_keys=True)
+        )
+        if args.write:
+            save_motor_reload(store, updated)
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
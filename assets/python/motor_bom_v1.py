@@ -0,0 +1,376 @@
+"""
+motor_bom_v1.py
+
+Bill of materials for a reload production run.
+
+Given a build plan ({reload_id: motor count}, the same format that
+motor_cutting_stock_v1 reads), this module totals everything the run
+consumes:
+    - O-rings, grouped by part number and material
+    - inhibitors, grouped by type and thickness
+    - insulation disks, grouped by material and thickness
+    - igniters, grouped by type and lead length
+    - liner and casting tube length per casting supply, in inches
+    - stock pieces per casting supply, from motor_cutting_stock_v1.plan_cuts
+      (so kerf, end trim and per-piece offcuts are accounted for)
+    - propellant mass per propellant_id, in grams (from mass_breakdown, or
+      from the grain geometry and a density when a reload has none)
+
+and nets the totals against on-hand inventory. Each reload's per-motor bill
+is built once and then scaled by its count, so the cost depends on the
+number of distinct reloads in the plan, not the number of motors.
+
+Every line has a stable line_id such as 'o_ring:AS568-222:Viton' or
+'stock:liner_54mm_truecore_stock_v1'. Inventory files are JSON objects
+mapping line_id to the quantity on hand. Casting supplies are netted only
+on their stock lines, in whole stock pieces; when a stock line has no
+inventory entry, the supply's pieces_in_inventory is used instead. The
+liner and casting tube length lines are informational and are only netted
+when the inventory file lists them explicitly.
+
+Usage as a script:
+    python3 motor_bom_v1.py ../json-data/motor-data plan.json
+    python3 motor_bom_v1.py ../json-data/motor-data plan.json --inventory on-hand.json
+
+Depends on:
+    motor_ballistics_v1.py (default propellant density)
+    motor_casting_supplies_v1.py
+    motor_reloads_v1.py
+    motor_catalog_v1.py
+    motor_cutting_stock_v1.py (build plan loading, stock piece counts)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from motor_ballistics_v1 import GENERIC_APCP, GRAMS_PER_POUND
+from motor_casting_supplies_v1 import CastingSupply
+from motor_reloads_v1 import MotorReload
+from motor_catalog_v1 import MotorCatalog
+from motor_cutting_stock_v1 import (
+    DEFAULT_END_TRIM_INCH,
+    DEFAULT_KERF_INCH,
+    load_build_plan,
+    plan_cuts,
+)
+
+
+UNIT_EACH = "each"
+UNIT_INCH = "inch"
+UNIT_GRAM = "gram"
+UNIT_PIECE = "piece"
+
+UNITS_BY_CATEGORY: Dict[str, str] = {
+    "o_ring": UNIT_EACH,
+    "inhibitor": UNIT_EACH,
+    "insulation_disk": UNIT_EACH,
+    "igniter": UNIT_EACH,
+    "liner": UNIT_INCH,
+    "casting_tube": UNIT_INCH,
+    "stock": UNIT_PIECE,
+    "propellant": UNIT_GRAM,
+}
+
+UNSPECIFIED_PROPELLANT_ID = "unspecified"
+
+
+# ---------------------------------------------------------------------------
+# Per-reload bill
+# ---------------------------------------------------------------------------
+
+
+def _line_id(category: str, *attributes: object) -> str:
+    return ":".join([category] + [str(value) for value in attributes if value not in (None, "")])
+
+
+def _size_label(value_inch: float) -> str:
+    return f"{value_inch:g}in"
+
+
+def propellant_mass_grams(
+    motor_reload: MotorReload,
+    density_lb_per_cubic_inch: float = GENERIC_APCP.density_lb_per_cubic_inch,
+) -> float:
+    """Propellant mass for one motor: mass_breakdown if present, else from grain geometry."""
+    if motor_reload.mass_breakdown is not None:
+        return motor_reload.mass_breakdown.propellant_mass_grams
+    grain = motor_reload.grain_geometry
+    volume_cubic_inch = (
+        grain.grain_count
+        * (math.pi / 4.0)
+        * (grain.grain_outer_diameter_inch**2 - grain.grain_core_diameter_inch**2)
+        * grain.grain_length_inch
+    )
+    return volume_cubic_inch * density_lb_per_cubic_inch * GRAMS_PER_POUND
+
+
+def reload_bill(
+    motor_reload: MotorReload,
+    density_lb_per_cubic_inch: float = GENERIC_APCP.density_lb_per_cubic_inch,
+) -> Tuple[Counter, Dict[str, str]]:
+    """
+    Quantities for one motor as (Counter of line_id -> quantity,
+    line_id -> description).
+    """
+    quantities: Counter = Counter()
+    descriptions: Dict[str, str] = {}
+
+    def add(line_id: str, quantity: float, description: str) -> None:
+        quantities[line_id] += quantity
+        descriptions.setdefault(line_id, description)
+
+    consumables = motor_reload.consumables
+    for o_ring in consumables.o_rings_single_use:
+        add(
+            _line_id("o_ring", o_ring.part_number, o_ring.material),
+            o_ring.quantity_per_motor,
+            f"O-ring {o_ring.part_number}" + (f" {o_ring.material}" if o_ring.material else ""),
+        )
+    for inhibitor in consumables.inhibitors:
+        add(
+            _line_id("inhibitor", inhibitor.inhibitor_type, _size_label(inhibitor.thickness_inch)),
+            inhibitor.quantity_per_motor,
+            f"Inhibitor {inhibitor.inhibitor_type}, {inhibitor.thickness_inch:g} in",
+        )
+    for disk in consumables.insulation_disks:
+        add(
+            _line_id("insulation_disk", disk.material, _size_label(disk.thickness_inch)),
+            disk.quantity_per_motor,
+            f"Insulation disk {disk.material}, {disk.thickness_inch:g} in",
+        )
+    for igniter in consumables.igniters:
+        add(
+            _line_id("igniter", igniter.igniter_type, _size_label(igniter.lead_length_inch)),
+            igniter.quantity_per_motor,
+            f"Igniter {igniter.igniter_type}, {igniter.lead_length_inch:g} in leads",
+        )
+
+    liner = motor_reload.liner
+    add(
+        _line_id("liner", liner.casting_supply_id),
+        liner.cut_length_inch * liner.pieces_per_motor,
+        f"Liner from {liner.casting_supply_id}",
+    )
+    tubes = motor_reload.casting_tubes
+    add(
+        _line_id("casting_tube", tubes.casting_supply_id),
+        tubes.total_casting_tube_length_inch,
+        f"Casting tube from {tubes.casting_supply_id}",
+    )
+    propellant_id = motor_reload.propellant_id or UNSPECIFIED_PROPELLANT_ID
+    add(
+        _line_id("propellant", propellant_id),
+        propellant_mass_grams(motor_reload, density_lb_per_cubic_inch),
+        f"Propellant {propellant_id}",
+    )
+    return quantities, descriptions
+
+
+# ---------------------------------------------------------------------------
+# Aggregated bill
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class BomLine:
+    """Total requirement for one item across the run."""
+
+    line_id: str
+    category: str
+    description: str
+    unit: str
+    required: float
+    on_hand: Optional[float] = None
+
+    @property
+    def shortfall(self) -> Optional[float]:
+        """Quantity to buy, or None when there is no inventory figure."""
+        if self.on_hand is None:
+            return None
+        return max(0.0, self.required - self.on_hand)
+
+
+@dataclass
+class BillOfMaterials:
+    """Every BomLine for a build plan, sorted by line_id."""
+
+    motor_count: int = 0
+    lines: List[BomLine] = field(default_factory=list)
+    unknown_reloads: List[str] = field(default_factory=list)
+    cut_errors: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.unknown_reloads and not self.cut_errors
+
+    def shortfalls(self) -> List[BomLine]:
+        return [line for line in self.lines if line.shortfall]
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "motor_count": self.motor_count,
+            "unknown_reloads": list(self.unknown_reloads),
+            "cut_errors": list(self.cut_errors),
+            "lines": [dict(asdict(line), shortfall=line.shortfall) for line in self.lines],
+        }
+
+
+def build_bill_of_materials(
+    build_plan: Mapping[str, int],
+    reloads: Mapping[str, MotorReload],
+    casting_supplies: Optional[Mapping[str, CastingSupply]] = None,
+    inventory: Optional[Mapping[str, float]] = None,
+    density_lb_per_cubic_inch: float = GENERIC_APCP.density_lb_per_cubic_inch,
+    kerf_inch: float = DEFAULT_KERF_INCH,
+    end_trim_inch: float = DEFAULT_END_TRIM_INCH,
+) -> BillOfMaterials:
+    """
+    Total a {reload_id: count} build plan and net it against inventory.
+
+    Reload IDs missing from reloads are listed in unknown_reloads and
+    otherwise skipped. With casting_supplies, a stock line per supply gives
+    the stock pieces the cut plan needs; cut planning problems (unknown
+    supplies, pieces longer than the stock) are listed in cut_errors.
+    """
+    bill = BillOfMaterials()
+    totals: Counter = Counter()
+    descriptions: Dict[str, str] = {}
+    known_plan: Dict[str, int] = {}
+    for motor_reload_id, count in sorted(build_plan.items()):
+        motor_reload = reloads.get(motor_reload_id)
+        if motor_reload is None:
+            bill.unknown_reloads.append(motor_reload_id)
+            continue
+        known_plan[motor_reload_id] = count
+        bill.motor_count += count
+        per_motor, reload_descriptions = reload_bill(motor_reload, density_lb_per_cubic_inch)
+        for line_id, quantity in per_motor.items():
+            totals[line_id] += quantity * count
+        for line_id, description in reload_descriptions.items():
+            descriptions.setdefault(line_id, description)
+
+    on_hand_by_line: Dict[str, float] = dict(inventory or {})
+    if casting_supplies is not None:
+        cut_plan = plan_cuts(
+            known_plan,
+            reloads,
+            casting_supplies,
+            kerf_inch=kerf_inch,
+            end_trim_inch=end_trim_inch,
+        )
+        bill.cut_errors.extend(cut_plan.errors)
+        for casting_supply_id, schedule in cut_plan.schedules.items():
+            line_id = _line_id("stock", casting_supply_id)
+            totals[line_id] = schedule.stock_pieces_required
+            descriptions[line_id] = (
+                f"Stock {casting_supply_id}, {schedule.stock_length_inch:g} in pieces"
+            )
+            if schedule.pieces_in_inventory is not None:
+                on_hand_by_line.setdefault(line_id, schedule.pieces_in_inventory)
+
+    for line_id in sorted(totals):
+        category = line_id.split(":", 1)[0]
+        bill.lines.append(
+            BomLine(
+                line_id=line_id,
+                category=category,
+                description=descriptions[line_id],
+                unit=UNITS_BY_CATEGORY[category],
+                required=round(totals[line_id], 4),
+                on_hand=on_hand_by_line.get(line_id),
+            )
+        )
+    return bill
+
+
+def load_inventory(inventory_path: Path) -> Dict[str, float]:
+    """Read a {line_id: quantity on hand} JSON file."""
+    raw_inventory = json.loads(inventory_path.read_text(encoding="utf-8"))
+    if not isinstance(raw_inventory, dict):
+        raise ValueError(f"{inventory_path}: inventory must be a JSON object of line_id -> quantity.")
+    return {line_id: float(quantity) for line_id, quantity in raw_inventory.items()}
+
+
+# ---------------------------------------------------------------------------
+# Command line
+# ---------------------------------------------------------------------------
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Total the materials needed for a reload build plan.",
+    )
+    parser.add_argument("motor_data_directory", help="Path to the motor-data root.")
+    parser.add_argument("build_plan", help="JSON file mapping reload_id to motor count.")
+    parser.add_argument(
+        "--inventory",
+        default="",
+        help="Optional JSON file mapping line_id to quantity on hand.",
+    )
+    parser.add_argument(
+        "--kerf",
+        type=float,
+        default=DEFAULT_KERF_INCH,
+        help="Material lost per saw cut, in inches.",
+    )
+    parser.add_argument(
+        "--end-trim",
+        type=float,
+        default=DEFAULT_END_TRIM_INCH,
+        help="Length trimmed from each stock piece before cutting, in inches.",
+    )
+    parser.add_argument(
+        "--report",
+        default="",
+        help="Optional path for a JSON bill of materials.",
+    )
+    args = parser.parse_args(argv)
+
+    base_directory = Path(args.motor_data_directory).resolve()
+    if not base_directory.is_dir():
+        print(f"Not a directory: {base_directory}", file=sys.stderr)
+        return 2
+
+    build_plan = load_build_plan(Path(args.build_plan))
+    inventory = load_inventory(Path(args.inventory)) if args.inventory else None
+    catalog = MotorCatalog.from_directory(base_directory)
+    bill = build_bill_of_materials(
+        build_plan,
+        catalog.reloads.records,
+        catalog.casting_supplies.records,
+        inventory,
+        kerf_inch=args.kerf,
+        end_trim_inch=args.end_trim,
+    )
+
+    for motor_reload_id in bill.unknown_reloads:
+        print(f"error: Unknown reload '{motor_reload_id}'.", file=sys.stderr)
+    for error_text in bill.cut_errors:
+        print(f"error: {error_text}", file=sys.stderr)
+    print(f"Motors: {bill.motor_count}")
+    for line in bill.lines:
+        stock_text = ""
+        if line.on_hand is not None:
+            stock_text = f"  on hand {line.on_hand:g}"
+            if line.shortfall:
+                stock_text += f"  SHORT {line.shortfall:g}"
+        print(f"  {line.required:10g} {line.unit:<5} {line.description}{stock_text}")
+
+    if args.report:
+        report_path = Path(args.report)
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_text(json.dumps(bill.to_dict(), indent=2) + "\n", encoding="utf-8")
+
+    return 0 if bill.ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
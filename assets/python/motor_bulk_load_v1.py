@@ -0,0 +1,356 @@
+"""
+motor_bulk_load_v1.py
+
+Parallel bulk loader and validator for a motor-data directory tree:
+    motor-data/
+      motor-parts/
+      motor-assemblies/
+      casting-supplies/
+      motor-reloads/
+
+Serial load_model calls read and validate one file at a time, which becomes
+the bottleneck for CI validation and application start-up once there are
+thousands of parts and reloads. This module:
+    - discovers every JSON file under the motor-data root
+    - reads files concurrently with a thread pool (I/O bound)
+    - validates with model_validate_json, across a process pool only when a
+      measurement says the pool will be faster (see _pool_pays_off)
+    - returns the validated records plus one error report covering
+      file, model and field for every problem found
+
+Usage as a script:
+    python3 motor_bulk_load_v1.py ../json-data/motor-data
+    python3 motor_bulk_load_v1.py ../json-data/motor-data --report errors.json
+
+Depends on:
+    motor_parts_v1.py (MotorPartRecord for part subtype dispatch)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import pickle
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, RootModel, ValidationError
+
+from motor_assemblies_v1 import MotorAssembly
+from motor_casting_supplies_v1 import CastingSupply
+from motor_parts_v1 import MotorPartRecord
+from motor_reloads_v1 import MotorReload
+
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+# Directory name -> record kind understood by _model_class_for.
+RECORD_KIND_BY_DIRECTORY: Dict[str, str] = {
+    "motor-parts": "part",
+    "motor-assemblies": "assembly",
+    "casting-supplies": "casting_supply",
+    "motor-reloads": "reload",
+}
+
+DEFAULT_READ_WORKERS = 16
+
+# The first process_threshold files are always validated in-process, and
+# they double as the sample for deciding whether a pool pays off for the
+# rest. Validated records travel back from workers pickled, and for records
+# like the sample data unpickling one in the parent costs more than
+# validating it there (about 0.03 ms against 0.02 ms per file), so a pool
+# was 2.5x slower on 404 files at the old threshold of 64. The decision is
+# therefore measured per run rather than taken from a file count.
+DEFAULT_PROCESS_THRESHOLD = 256
+
+# Rough cost of starting a worker pool (fork plus first task round trip).
+POOL_STARTUP_SECONDS = 0.05
+
+
+# ---------------------------------------------------------------------------
+# Result types
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class BulkLoadError:
+    """One problem found while loading a file."""
+
+    file: str
+    model: str
+    field: str
+    message: str
+    error_type: str
+
+
+@dataclass
+class BulkLoadResult:
+    """Validated records keyed by store key (e.g. 'motor-parts/case_x'), plus errors."""
+
+    records: Dict[str, BaseModel] = field(default_factory=dict)
+    errors: List[BulkLoadError] = field(default_factory=list)
+    file_count: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def error_report(self) -> Dict[str, object]:
+        """Machine-readable report, suitable for json.dumps."""
+        return {
+            "file_count": self.file_count,
+            "valid_count": len(self.records),
+            "error_count": len(self.errors),
+            "errors": [asdict(error) for error in self.errors],
+        }
+
+
+# ---------------------------------------------------------------------------
+# Discovery and reading
+# ---------------------------------------------------------------------------
+
+
+def discover_motor_data_files(base_directory: Path) -> List[Path]:
+    """Every *.json file under base_directory, sorted for stable reports."""
+    return sorted(
+        file_path
+        for file_path in base_directory.rglob("*.json")
+        if file_path.is_file()
+    )
+
+
+def _read_file(file_path: Path) -> Tuple[Path, Optional[str], Optional[str]]:
+    try:
+        return file_path, file_path.read_text(encoding="utf-8"), None
+    except (OSError, UnicodeDecodeError) as error:
+        return file_path, None, str(error)
+
+
+# ---------------------------------------------------------------------------
+# Validation (runs inside worker processes)
+# ---------------------------------------------------------------------------
+
+
+def _model_class_for(record_kind: str) -> Type[BaseModel]:
+    if record_kind == "assembly":
+        return MotorAssembly
+    if record_kind == "casting_supply":
+        return CastingSupply
+    if record_kind == "reload":
+        return MotorReload
+    # Parts dispatch to CasePart/ClosurePart/NozzlePart on part_type.
+    return MotorPartRecord
+
+
+def _validate_text(
+    job: Tuple[str, str, str],
+) -> Tuple[str, Optional[BaseModel], List[BulkLoadError]]:
+    """
+    Validate one file's text. Must stay a module-level function so it can be
+    pickled into a process pool.
+    """
+    relative_path, record_kind, raw_text = job
+    model_name = record_kind
+    try:
+        model_class = _model_class_for(record_kind)
+        model_name = model_class.__name__
+        record = model_class.model_validate_json(raw_text)
+        if isinstance(record, RootModel):
+            record = record.root
+        return relative_path, record, []
+    except ValidationError as error:
+        return relative_path, None, [
+            BulkLoadError(
+                file=relative_path,
+                model=model_name,
+                field=".".join(str(part) for part in detail["loc"]),
+                message=detail["msg"],
+                error_type=detail["type"],
+            )
+            for detail in error.errors()
+        ]
+    except ValueError as error:
+        return relative_path, None, [
+            BulkLoadError(
+                file=relative_path,
+                model=model_name,
+                field="",
+                message=str(error),
+                error_type="json_invalid",
+            )
+        ]
+
+
+# ---------------------------------------------------------------------------
+# Bulk load API
+# ---------------------------------------------------------------------------
+
+
+def _pool_pays_off(
+    sample_outcomes: List[Tuple[str, Optional[BaseModel], List[BulkLoadError]]],
+    sample_seconds: float,
+    remaining_count: int,
+    worker_count: int,
+) -> bool:
+    """
+    Whether validating remaining_count more files across worker_count
+    processes beats doing it here, judged from the sample: its validation
+    time, and the time to pickle and unpickle its results (what a worker
+    hand-off costs the parent).
+    """
+    if not sample_outcomes:
+        return False
+    started = time.perf_counter()
+    pickle.loads(pickle.dumps(sample_outcomes, protocol=pickle.HIGHEST_PROTOCOL))
+    transfer_per_file = (time.perf_counter() - started) / len(sample_outcomes)
+    validate_per_file = sample_seconds / len(sample_outcomes)
+    serial_seconds = remaining_count * validate_per_file
+    pooled_seconds = (
+        POOL_STARTUP_SECONDS
+        + remaining_count * validate_per_file / worker_count
+        + remaining_count * transfer_per_file
+    )
+    return pooled_seconds < serial_seconds
+
+
+def bulk_load_motor_data(
+    base_directory: Path,
+    read_workers: int = DEFAULT_READ_WORKERS,
+    validate_workers: Optional[int] = None,
+    process_threshold: int = DEFAULT_PROCESS_THRESHOLD,
+) -> BulkLoadResult:
+    """
+    Read and validate every record under base_directory.
+
+    validate_workers defaults to os.cpu_count(). The first process_threshold
+    files are validated in the calling process; the rest go to a process
+    pool only if _pool_pays_off says so. Set validate_workers to 1 to never
+    use a pool.
+    """
+    result = BulkLoadResult()
+    file_paths = discover_motor_data_files(base_directory)
+    result.file_count = len(file_paths)
+
+    jobs: List[Tuple[str, str, str]] = []
+    with ThreadPoolExecutor(max_workers=max(1, read_workers)) as executor:
+        for file_path, raw_text, read_error in executor.map(_read_file, file_paths):
+            relative_path = file_path.relative_to(base_directory).as_posix()
+            if read_error is not None or raw_text is None:
+                result.errors.append(
+                    BulkLoadError(relative_path, "", "", read_error or "", "read_error")
+                )
+                continue
+            record_kind = RECORD_KIND_BY_DIRECTORY.get(relative_path.split("/", 1)[0])
+            if record_kind is None or "/" not in relative_path:
+                result.errors.append(
+                    BulkLoadError(
+                        relative_path,
+                        "",
+                        "",
+                        "File is not inside a known motor-data directory.",
+                        "unknown_directory",
+                    )
+                )
+                continue
+            jobs.append((relative_path, record_kind, raw_text))
+
+    worker_count = validate_workers or os.cpu_count() or 1
+    sample_jobs, remaining_jobs = jobs[:process_threshold], jobs[process_threshold:]
+    started = time.perf_counter()
+    outcomes = [_validate_text(job) for job in sample_jobs]
+    sample_seconds = time.perf_counter() - started
+    if remaining_jobs and worker_count > 1 and _pool_pays_off(
+        outcomes, sample_seconds, len(remaining_jobs), worker_count
+    ):
+        chunk_size = max(1, len(remaining_jobs) // (worker_count * 4))
+        with ProcessPoolExecutor(max_workers=worker_count) as executor:
+            outcomes.extend(executor.map(_validate_text, remaining_jobs, chunksize=chunk_size))
+    else:
+        outcomes.extend(_validate_text(job) for job in remaining_jobs)
+
+    for relative_path, record, errors in outcomes:
+        if record is not None:
+            result.records[relative_path[: -len(".json")]] = record
+        result.errors.extend(errors)
+
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Command line
+# ---------------------------------------------------------------------------
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Validate every JSON record under a motor-data directory.",
+    )
+    parser.add_argument("motor_data_directory", help="Path to the motor-data root.")
+    parser.add_argument(
+        "--report",
+        default="",
+        help="Optional path for a JSON error report.",
+    )
+    parser.add_argument(
+        "--read-workers",
+        type=int,
+        default=DEFAULT_READ_WORKERS,
+        help="Threads used to read files.",
+    )
+    parser.add_argument(
+        "--validate-workers",
+        type=int,
+        default=0,
+        help="Processes used to validate records. Defaults to the CPU count.",
+    )
+    parser.add_argument(
+        "--process-threshold",
+        type=int,
+        default=DEFAULT_PROCESS_THRESHOLD,
+        help="Files validated in-process before a process pool is considered.",
+    )
+    args = parser.parse_args(argv)
+
+    base_directory = Path(args.motor_data_directory).resolve()
+    if not base_directory.is_dir():
+        print(f"Not a directory: {base_directory}", file=sys.stderr)
+        return 2
+
+    result = bulk_load_motor_data(
+        base_directory,
+        read_workers=args.read_workers,
+        validate_workers=args.validate_workers or None,
+        process_threshold=args.process_threshold,
+    )
+
+    for error in result.errors:
+        location = f"{error.file} [{error.model}]"
+        if error.field:
+            location += f" {error.field}"
+        print(f"{location}: {error.message}", file=sys.stderr)
+
+    print(
+        f"Files: {result.file_count}  valid: {len(result.records)}  "
+        f"errors: {len(result.errors)}"
+    )
+
+    if args.report:
+        report_path = Path(args.report)
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_text(
+            json.dumps(result.error_report(), indent=2) + "\n",
+            encoding="utf-8",
+        )
+
+    return 0 if result.ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
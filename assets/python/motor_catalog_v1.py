@@ -0,0 +1,383 @@
+"""
+motor_catalog_v1.py
+
+In-memory, indexed catalog over the standard motor-data directory layout:
+    motor-data/
+      motor-parts/
+      motor-assemblies/
+      casting-supplies/
+      motor-reloads/
+
+MotorCatalog loads every record once and keeps secondary indexes so that
+questions such as "every reload that fits assembly X" or "all 54mm AMW
+parts" are answered from dictionaries instead of re-reading the directory.
+
+Indexed fields:
+    - motor_standard   (parts, assemblies, casting supplies, reloads)
+    - ecosystem        (parts, assemblies, casting supplies, reloads)
+    - role, part_type  (parts)
+    - part_id          (assemblies, via their part references)
+    - supply_type      (casting supplies)
+    - assembly_id      (reloads)
+    - casting_supply_id (reloads, liner and casting tube supplies)
+
+Depends on:
+    motor_store_v1.py
+"""
+
+from __future__ import annotations
+
+from enum import Enum
+from pathlib import Path
+from typing import Callable, Dict, Generic, Iterable, List, Optional, TypeVar
+
+from pydantic import BaseModel
+
+from motor_parts_v1 import MotorPartBase, MotorPartRecord
+from motor_assemblies_v1 import MotorAssembly
+from motor_casting_supplies_v1 import CastingSupply
+from motor_reloads_v1 import MotorReload
+from motor_store_v1 import LocalJsonFileStore, ModelStore
+
+
+RecordType = TypeVar("RecordType", bound=BaseModel)
+
+IndexValue = object
+
+
+# ---------------------------------------------------------------------------
+# Index helpers
+# ---------------------------------------------------------------------------
+
+
+def _index_key(value: IndexValue) -> str:
+    """Normalize enums and plain strings to the same index key."""
+    if isinstance(value, Enum):
+        return str(value.value)
+    return str(value)
+
+
+def _as_list(value: object) -> List[object]:
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple, set)):
+        return list(value)
+    return [value]
+
+
+class RecordIndex(Generic[RecordType]):
+    """
+    Records of one kind keyed by primary ID, plus secondary indexes.
+
+    Each secondary index maps a normalized field value to the list of primary
+    IDs having that value, in insertion order. Extractors may return a single
+    value or a list (for fields like ecosystem).
+    """
+
+    def __init__(
+        self,
+        id_getter: Callable[[RecordType], str],
+        extractors: Dict[str, Callable[[RecordType], object]],
+    ) -> None:
+        self._id_getter = id_getter
+        self._extractors = extractors
+        self.records: Dict[str, RecordType] = {}
+        self.indexes: Dict[str, Dict[str, List[str]]] = {
+            field_name: {} for field_name in extractors
+        }
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def add(self, record: RecordType) -> None:
+        record_id = self._id_getter(record)
+        if record_id in self.records:
+            self.remove(record_id)
+        self.records[record_id] = record
+        for field_name, extractor in self._extractors.items():
+            field_index = self.indexes[field_name]
+            for value in dict.fromkeys(_index_key(item) for item in _as_list(extractor(record))):
+                field_index.setdefault(value, []).append(record_id)
+
+    def remove(self, record_id: str) -> Optional[RecordType]:
+        record = self.records.pop(record_id, None)
+        if record is None:
+            return None
+        for field_name, extractor in self._extractors.items():
+            field_index = self.indexes[field_name]
+            for item in _as_list(extractor(record)):
+                value = _index_key(item)
+                record_ids = field_index.get(value)
+                if record_ids and record_id in record_ids:
+                    record_ids.remove(record_id)
+                    if not record_ids:
+                        del field_index[value]
+        return record
+
+    def get(self, record_id: str) -> Optional[RecordType]:
+        return self.records.get(record_id)
+
+    def values(self, field_name: str) -> List[str]:
+        """Distinct indexed values for a field, such as every motor_standard."""
+        return sorted(self.indexes[field_name])
+
+    def find(self, **criteria: IndexValue) -> List[RecordType]:
+        """
+        Return records matching every given field=value criterion.
+
+        Criteria set to None are ignored. With no criteria, all records are
+        returned. The smallest candidate list is used as the driver, so the
+        cost is proportional to the number of matches, not the catalog size.
+        """
+        active_criteria = {
+            field_name: _index_key(value)
+            for field_name, value in criteria.items()
+            if value is not None
+        }
+        if not active_criteria:
+            return list(self.records.values())
+
+        candidate_lists: List[List[str]] = []
+        for field_name, value in active_criteria.items():
+            if field_name not in self.indexes:
+                raise KeyError(f"Field '{field_name}' is not indexed.")
+            candidate_lists.append(self.indexes[field_name].get(value, []))
+
+        candidate_lists.sort(key=len)
+        driver_ids = candidate_lists[0]
+        other_sets = [set(record_ids) for record_ids in candidate_lists[1:]]
+        return [
+            self.records[record_id]
+            for record_id in driver_ids
+            if all(record_id in other_set for other_set in other_sets)
+        ]
+
+
+# ---------------------------------------------------------------------------
+# Catalog
+# ---------------------------------------------------------------------------
+
+
+class MotorCatalog:
+    """
+    Indexed, in-memory view of all motor data records.
+
+    Example:
+        catalog = MotorCatalog.from_directory(Path("motor-data"))
+
+        reloads = catalog.reloads_for_assembly("assembly_54mm_amw_long_snapring_v1")
+        parts = catalog.find_parts(motor_standard="54mm", ecosystem="AMW")
+
+    Records that fail validation are skipped and listed in load_errors
+    (keyed by relative path) unless strict=True is passed to from_directory.
+    """
+
+    PARTS_DIRECTORY = "motor-parts"
+    ASSEMBLIES_DIRECTORY = "motor-assemblies"
+    CASTING_SUPPLIES_DIRECTORY = "casting-supplies"
+    RELOADS_DIRECTORY = "motor-reloads"
+
+    def __init__(self) -> None:
+        self.parts: RecordIndex[MotorPartBase] = RecordIndex(
+            lambda part: part.part_id,
+            {
+                "motor_standard": lambda part: part.motor_standard,
+                "ecosystem": lambda part: part.ecosystem,
+                "role": lambda part: part.role,
+                "part_type": lambda part: part.part_type,
+            },
+        )
+        self.assemblies: RecordIndex[MotorAssembly] = RecordIndex(
+            lambda assembly: assembly.assembly_id,
+            {
+                "motor_standard": lambda assembly: assembly.motor_standard,
+                "ecosystem": lambda assembly: assembly.ecosystem,
+                "part_id": lambda assembly: [
+                    part_ref.part_id for part_ref in assembly.parts
+                ],
+            },
+        )
+        self.casting_supplies: RecordIndex[CastingSupply] = RecordIndex(
+            lambda supply: supply.casting_supply_id,
+            {
+                "motor_standard": lambda supply: supply.motor_standard,
+                "ecosystem": lambda supply: supply.ecosystem,
+                "supply_type": lambda supply: supply.supply_type,
+            },
+        )
+        self.reloads: RecordIndex[MotorReload] = RecordIndex(
+            lambda motor_reload: motor_reload.motor_reload_id,
+            {
+                "motor_standard": lambda motor_reload: motor_reload.motor_standard,
+                "ecosystem": lambda motor_reload: motor_reload.ecosystem,
+                "assembly_id": lambda motor_reload: motor_reload.assembly_id,
+                "casting_supply_id": lambda motor_reload: [
+                    motor_reload.liner.casting_supply_id,
+                    motor_reload.casting_tubes.casting_supply_id,
+                ],
+            },
+        )
+        self.load_errors: Dict[str, str] = {}
+
+    # --- loading -------------------------------------------------------------
+
+    @classmethod
+    def from_directory(
+        cls,
+        base_directory: Path,
+        store: Optional[ModelStore] = None,
+        strict: bool = False,
+    ) -> "MotorCatalog":
+        """
+        Build a catalog from every JSON file in the standard layout.
+
+        Files are discovered under base_directory; reading and validation go
+        through store (a LocalJsonFileStore over base_directory by default).
+        """
+        catalog = cls()
+        model_store: ModelStore = store or LocalJsonFileStore(base_directory)
+
+        def load_directory(
+            directory_name: str,
+            load_record: Callable[[str], BaseModel],
+            index: RecordIndex,
+        ) -> None:
+            directory_path = base_directory / directory_name
+            if not directory_path.is_dir():
+                return
+            for file_path in sorted(directory_path.glob("*.json")):
+                key = f"{directory_name}/{file_path.stem}"
+                try:
+                    record = load_record(key)
+                except Exception as error:
+                    if strict:
+                        raise
+                    catalog.load_errors[f"{key}.json"] = str(error)
+                    continue
+                index.add(record)
+
+        load_directory(
+            cls.PARTS_DIRECTORY,
+            lambda key: model_store.load_model(MotorPartRecord, key).root,
+            catalog.parts,
+        )
+        load_directory(
+            cls.ASSEMBLIES_DIRECTORY,
+            lambda key: model_store.load_model(MotorAssembly, key),
+            catalog.assemblies,
+        )
+        load_directory(
+            cls.CASTING_SUPPLIES_DIRECTORY,
+            lambda key: model_store.load_model(CastingSupply, key),
+            catalog.casting_supplies,
+        )
+        load_directory(
+            cls.RELOADS_DIRECTORY,
+            lambda key: model_store.load_model(MotorReload, key),
+            catalog.reloads,
+        )
+        return catalog
+
+    def add_records(self, records: Iterable[BaseModel]) -> None:
+        """Add or replace already-validated records, keeping indexes in sync."""
+        for record in records:
+            if isinstance(record, MotorPartBase):
+                self.parts.add(record)
+            elif isinstance(record, MotorAssembly):
+                self.assemblies.add(record)
+            elif isinstance(record, CastingSupply):
+                self.casting_supplies.add(record)
+            elif isinstance(record, MotorReload):
+                self.reloads.add(record)
+            else:
+                raise TypeError(f"Unsupported record type: {type(record).__name__}")
+
+    # --- direct lookups ------------------------------------------------------
+
+    def get_part(self, part_id: str) -> Optional[MotorPartBase]:
+        return self.parts.get(part_id)
+
+    def get_assembly(self, assembly_id: str) -> Optional[MotorAssembly]:
+        return self.assemblies.get(assembly_id)
+
+    def get_casting_supply(self, casting_supply_id: str) -> Optional[CastingSupply]:
+        return self.casting_supplies.get(casting_supply_id)
+
+    def get_reload(self, motor_reload_id: str) -> Optional[MotorReload]:
+        return self.reloads.get(motor_reload_id)
+
+    # --- indexed queries -----------------------------------------------------
+
+    def find_parts(
+        self,
+        motor_standard: Optional[IndexValue] = None,
+        ecosystem: Optional[IndexValue] = None,
+        role: Optional[IndexValue] = None,
+        part_type: Optional[IndexValue] = None,
+    ) -> List[MotorPartBase]:
+        return self.parts.find(
+            motor_standard=motor_standard,
+            ecosystem=ecosystem,
+            role=role,
+            part_type=part_type,
+        )
+
+    def find_assemblies(
+        self,
+        motor_standard: Optional[IndexValue] = None,
+        ecosystem: Optional[IndexValue] = None,
+        part_id: Optional[str] = None,
+    ) -> List[MotorAssembly]:
+        return self.assemblies.find(
+            motor_standard=motor_standard,
+            ecosystem=ecosystem,
+            part_id=part_id,
+        )
+
+    def find_casting_supplies(
+        self,
+        motor_standard: Optional[IndexValue] = None,
+        ecosystem: Optional[IndexValue] = None,
+        supply_type: Optional[IndexValue] = None,
+    ) -> List[CastingSupply]:
+        return self.casting_supplies.find(
+            motor_standard=motor_standard,
+            ecosystem=ecosystem,
+            supply_type=supply_type,
+        )
+
+    def find_reloads(
+        self,
+        motor_standard: Optional[IndexValue] = None,
+        ecosystem: Optional[IndexValue] = None,
+        assembly_id: Optional[str] = None,
+        casting_supply_id: Optional[str] = None,
+    ) -> List[MotorReload]:
+        return self.reloads.find(
+            motor_standard=motor_standard,
+            ecosystem=ecosystem,
+            assembly_id=assembly_id,
+            casting_supply_id=casting_supply_id,
+        )
+
+    def reloads_for_assembly(self, assembly_id: str) -> List[MotorReload]:
+        """Every reload built to fit the given assembly."""
+        return self.find_reloads(assembly_id=assembly_id)
+
+    def reloads_using_supply(self, casting_supply_id: str) -> List[MotorReload]:
+        """Every reload that draws liner or casting tube from the given supply."""
+        return self.find_reloads(casting_supply_id=casting_supply_id)
+
+    def assemblies_using_part(self, part_id: str) -> List[MotorAssembly]:
+        """Every assembly that references the given part."""
+        return self.find_assemblies(part_id=part_id)
+
+    def summary(self) -> Dict[str, int]:
+        """Record counts per kind, plus the number of files that failed to load."""
+        return {
+            "parts": len(self.parts),
+            "assemblies": len(self.assemblies),
+            "casting_supplies": len(self.casting_supplies),
+            "reloads": len(self.reloads),
+            "load_errors": len(self.load_errors),
+        }
@@ -0,0 +1,506 @@
+"""
+motor_cutting_stock_v1.py
+
+Cut schedules for liners and casting tubes.
+
+A build plan says how many of each reload to make. Every reload needs
+LinerReloadInfo.pieces_per_motor liner pieces of cut_length_inch and
+CastingTubeReloadInfo.grain_count casting tube pieces of
+cut_length_per_grain_inch, each drawn from a CastingSupply whose stock
+pieces are stock_length_inch long. This module decides which pieces to cut
+from which stock piece so that as few stock pieces as possible are used,
+and therefore as little material is wasted. Each saw cut consumes
+kerf_inch, and end_trim_inch can be taken off each stock piece to square
+it.
+
+Two solvers are used per supply:
+    - best-fit decreasing (always; fast for thousands of pieces)
+    - exact breadth-first search over cutting patterns (exact=True), used
+      only when the heuristic is above the lower bound; the search gives
+      up and keeps the heuristic schedule after exact_work_limit
+      (state, maximal pattern) expansions
+
+A schedule is marked optimal when its stock count is proven minimal,
+either because it meets the lower bound or because the exact search ran.
+
+Build plans are JSON objects mapping reload ID to motor count:
+    {"motor_reload_magenta_red_54mm_amw_long_v1": 24}
+
+Usage as a script:
+    python3 motor_cutting_stock_v1.py ../json-data/motor-data plan.json
+    python3 motor_cutting_stock_v1.py ../json-data/motor-data plan.json --exact --kerf 0.0625
+
+Depends on:
+    motor_casting_supplies_v1.py
+    motor_reloads_v1.py
+    motor_catalog_v1.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from motor_casting_supplies_v1 import CastingSupply
+from motor_reloads_v1 import MotorReload
+from motor_catalog_v1 import MotorCatalog
+
+
+DEFAULT_KERF_INCH = 0.0625
+DEFAULT_END_TRIM_INCH = 0.0
+DEFAULT_EXACT_WORK_LIMIT = 200_000
+
+# Lengths are compared in whole micro-inches so float noise cannot make
+# two identical cuts look different.
+LENGTH_SCALE = 1_000_000
+
+PIECE_KIND_LINER = "liner"
+PIECE_KIND_CASTING_TUBE = "casting_tube"
+
+
+# ---------------------------------------------------------------------------
+# Build plans
+# ---------------------------------------------------------------------------
+
+
+def load_build_plan(plan_path: Path) -> Dict[str, int]:
+    """Read a {reload_id: count} JSON build plan, dropping zero counts."""
+    raw_plan = json.loads(plan_path.read_text(encoding="utf-8"))
+    if not isinstance(raw_plan, dict):
+        raise ValueError(f"{plan_path}: build plan must be a JSON object of reload_id -> count.")
+    build_plan: Dict[str, int] = {}
+    for motor_reload_id, count in raw_plan.items():
+        if not isinstance(count, int) or count < 0:
+            raise ValueError(f"{plan_path}: count for '{motor_reload_id}' must be a non-negative integer.")
+        if count:
+            build_plan[motor_reload_id] = count
+    return build_plan
+
+
+# ---------------------------------------------------------------------------
+# Results
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class CutPiece:
+    """One piece to cut for one motor."""
+
+    motor_reload_id: str
+    kind: str
+    length_inch: float
+
+
+@dataclass
+class StockCut:
+    """The pieces cut from one stock piece, in cutting order."""
+
+    pieces: List[CutPiece] = field(default_factory=list)
+    offcut_inch: float = 0.0
+
+
+@dataclass
+class SupplyCutSchedule:
+    """Cut schedule for one casting supply."""
+
+    casting_supply_id: str
+    stock_length_inch: float
+    kerf_inch: float
+    piece_count: int
+    stock_cuts: List[StockCut] = field(default_factory=list)
+    lower_bound: int = 0
+    optimal: bool = False
+    pieces_in_inventory: Optional[int] = None
+
+    @property
+    def stock_pieces_required(self) -> int:
+        return len(self.stock_cuts)
+
+    @property
+    def shortfall(self) -> Optional[int]:
+        """Stock pieces to buy, or None when inventory is not tracked."""
+        if self.pieces_in_inventory is None:
+            return None
+        return max(0, self.stock_pieces_required - self.pieces_in_inventory)
+
+    @property
+    def used_length_inch(self) -> float:
+        return sum(piece.length_inch for cut in self.stock_cuts for piece in cut.pieces)
+
+    @property
+    def waste_inch(self) -> float:
+        """Stock consumed that does not end up in a piece (kerf, trim, offcuts)."""
+        return self.stock_pieces_required * self.stock_length_inch - self.used_length_inch
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "casting_supply_id": self.casting_supply_id,
+            "stock_length_inch": self.stock_length_inch,
+            "kerf_inch": self.kerf_inch,
+            "piece_count": self.piece_count,
+            "stock_pieces_required": self.stock_pieces_required,
+            "lower_bound": self.lower_bound,
+            "optimal": self.optimal,
+            "pieces_in_inventory": self.pieces_in_inventory,
+            "shortfall": self.shortfall,
+            "waste_inch": round(self.waste_inch, 4),
+            "stock_cuts": [asdict(cut) for cut in self.stock_cuts],
+        }
+
+
+@dataclass
+class CutPlan:
+    """Cut schedules for every supply a build plan draws on."""
+
+    schedules: Dict[str, SupplyCutSchedule] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "errors": list(self.errors),
+            "schedules": [
+                schedule.to_dict()
+                for _supply_id, schedule in sorted(self.schedules.items())
+            ],
+        }
+
+
+# ---------------------------------------------------------------------------
+# Solvers
+#
+# Both work in integer micro-inches on "slot" lengths. Every piece occupies
+# its length plus one kerf, and each stock piece offers its usable length
+# plus one kerf, because the last piece needs no cut after it when it ends
+# flush with the stock.
+# ---------------------------------------------------------------------------
+
+
+def _best_fit_decreasing(slot_lengths: List[int], capacity: int) -> List[List[int]]:
+    """Indices into slot_lengths per stock piece."""
+    order = sorted(range(len(slot_lengths)), key=lambda index: -slot_lengths[index])
+    bins: List[List[int]] = []
+    remaining: List[int] = []
+    for index in order:
+        slot_length = slot_lengths[index]
+        best_bin = -1
+        best_remaining = capacity + 1
+        for bin_index, space in enumerate(remaining):
+            if slot_length <= space < best_remaining:
+                best_bin = bin_index
+                best_remaining = space
+        if best_bin < 0:
+            bins.append([index])
+            remaining.append(capacity - slot_length)
+        else:
+            bins[best_bin].append(index)
+            remaining[best_bin] -= slot_length
+    return bins
+
+
+def _cutting_patterns(
+    distinct_lengths: List[int],
+    demand: Tuple[int, ...],
+    capacity: int,
+) -> List[Tuple[int, ...]]:
+    """
+    Maximal count vectors over distinct_lengths that fit in capacity.
+
+    Counts are capped at demand, and a pattern is kept only when no length
+    with demand left over would still fit in the remaining space. Any other
+    pattern is dominated by a maximal one, so the search loses nothing.
+    """
+    patterns: List[Tuple[int, ...]] = []
+
+    def extend(position: int, space: int, counts: List[int]) -> None:
+        if position == len(distinct_lengths):
+            if any(counts) and all(
+                count == limit or length > space
+                for length, count, limit in zip(distinct_lengths, counts, demand)
+            ):
+                patterns.append(tuple(counts))
+            return
+        most = min(demand[position], space // distinct_lengths[position])
+        for count in range(most, -1, -1):
+            counts.append(count)
+            extend(position + 1, space - count * distinct_lengths[position], counts)
+            counts.pop()
+
+    extend(0, capacity, [])
+    return patterns
+
+
+def _exact_pattern_search(
+    distinct_lengths: List[int],
+    demand: Tuple[int, ...],
+    capacity: int,
+    work_limit: int,
+) -> Optional[List[Tuple[int, ...]]]:
+    """
+    Fewest stock pieces covering demand, as one count vector per stock
+    piece. Breadth-first over remaining demand, so the first time demand
+    reaches zero the stock count is minimal. None when the search would
+    expand more than work_limit (state, pattern) pairs.
+    """
+    patterns = _cutting_patterns(distinct_lengths, demand, capacity)
+    if len(patterns) > work_limit:
+        return None
+    parents: Dict[Tuple[int, ...], Tuple[Tuple[int, ...], Tuple[int, ...]]] = {}
+    frontier = [demand]
+    seen = {demand}
+    zero = tuple(0 for _ in demand)
+    work_done = 0
+    while frontier:
+        next_frontier = []
+        for state in frontier:
+            work_done += len(patterns)
+            if work_done > work_limit:
+                return None
+            for pattern in patterns:
+                taken = tuple(min(have, use) for have, use in zip(state, pattern))
+                if not any(taken):
+                    continue
+                next_state = tuple(have - use for have, use in zip(state, taken))
+                if next_state in seen:
+                    continue
+                seen.add(next_state)
+                parents[next_state] = (state, taken)
+                if next_state == zero:
+                    stock_patterns = []
+                    while next_state != demand:
+                        next_state, taken = parents[next_state]
+                        stock_patterns.append(taken)
+                    return stock_patterns
+                next_frontier.append(next_state)
+        frontier = next_frontier
+    return []
+
+
+def schedule_supply(
+    casting_supply: CastingSupply,
+    pieces: List[CutPiece],
+    kerf_inch: float = DEFAULT_KERF_INCH,
+    end_trim_inch: float = DEFAULT_END_TRIM_INCH,
+    exact: bool = False,
+    exact_work_limit: int = DEFAULT_EXACT_WORK_LIMIT,
+) -> SupplyCutSchedule:
+    """
+    Cut schedule for pieces drawn from one supply.
+
+    Raises ValueError if any piece is longer than the usable stock length.
+    """
+    stock_length = casting_supply.stock_length_inch
+    schedule = SupplyCutSchedule(
+        casting_supply_id=casting_supply.casting_supply_id,
+        stock_length_inch=stock_length,
+        kerf_inch=kerf_inch,
+        piece_count=len(pieces),
+        pieces_in_inventory=casting_supply.pieces_in_inventory,
+    )
+    if not pieces:
+        schedule.optimal = True
+        return schedule
+
+    kerf = round(kerf_inch * LENGTH_SCALE)
+    capacity = round((stock_length - end_trim_inch) * LENGTH_SCALE) + kerf
+    slot_lengths = [round(piece.length_inch * LENGTH_SCALE) + kerf for piece in pieces]
+    too_long = [piece for piece, slot in zip(pieces, slot_lengths) if slot > capacity]
+    if too_long:
+        raise ValueError(
+            f"{casting_supply.casting_supply_id}: {too_long[0].kind} piece of "
+            f"{too_long[0].length_inch} in for '{too_long[0].motor_reload_id}' is longer "
+            f"than the usable stock length."
+        )
+
+    schedule.lower_bound = math.ceil(sum(slot_lengths) / capacity)
+    bins = _best_fit_decreasing(slot_lengths, capacity)
+    schedule.optimal = len(bins) == schedule.lower_bound
+
+    if exact and not schedule.optimal:
+        distinct_lengths = sorted(set(slot_lengths), reverse=True)
+        pieces_by_length: Dict[int, List[int]] = defaultdict(list)
+        for index, slot_length in enumerate(slot_lengths):
+            pieces_by_length[slot_length].append(index)
+        demand = tuple(len(pieces_by_length[length]) for length in distinct_lengths)
+        stock_patterns = _exact_pattern_search(
+            distinct_lengths, demand, capacity, exact_work_limit
+        )
+        if stock_patterns is not None:
+            schedule.optimal = True
+            if len(stock_patterns) < len(bins):
+                bins = []
+                for pattern in stock_patterns:
+                    bins.append(
+                        [
+                            pieces_by_length[length].pop()
+                            for length, count in zip(distinct_lengths, pattern)
+                            for _ in range(count)
+                        ]
+                    )
+
+    for bin_indices in bins:
+        bin_indices.sort(key=lambda index: -slot_lengths[index])
+        used = sum(slot_lengths[index] for index in bin_indices)
+        # Anything left over is separated by one more cut.
+        schedule.stock_cuts.append(
+            StockCut(
+                pieces=[pieces[index] for index in bin_indices],
+                offcut_inch=round(max(0, capacity - used - kerf) / LENGTH_SCALE, 4),
+            )
+        )
+    schedule.stock_cuts.sort(key=lambda cut: cut.offcut_inch)
+    return schedule
+
+
+# ---------------------------------------------------------------------------
+# Build plan -> cut plan
+# ---------------------------------------------------------------------------
+
+
+def pieces_for_reload(motor_reload: MotorReload, count: int) -> List[Tuple[str, CutPiece]]:
+    """(casting_supply_id, piece) for every liner and tube piece of count motors."""
+    liner = motor_reload.liner
+    tubes = motor_reload.casting_tubes
+    liner_piece = CutPiece(motor_reload.motor_reload_id, PIECE_KIND_LINER, liner.cut_length_inch)
+    tube_piece = CutPiece(
+        motor_reload.motor_reload_id,
+        PIECE_KIND_CASTING_TUBE,
+        tubes.cut_length_per_grain_inch,
+    )
+    return (
+        [(liner.casting_supply_id, liner_piece)] * (liner.pieces_per_motor * count)
+        + [(tubes.casting_supply_id, tube_piece)] * (tubes.grain_count * count)
+    )
+
+
+def plan_cuts(
+    build_plan: Mapping[str, int],
+    reloads: Mapping[str, MotorReload],
+    casting_supplies: Mapping[str, CastingSupply],
+    kerf_inch: float = DEFAULT_KERF_INCH,
+    end_trim_inch: float = DEFAULT_END_TRIM_INCH,
+    exact: bool = False,
+    exact_work_limit: int = DEFAULT_EXACT_WORK_LIMIT,
+) -> CutPlan:
+    """
+    Cut schedules for a {reload_id: count} build plan.
+
+    Unknown reloads or supplies, and pieces that do not fit the stock, are
+    reported in CutPlan.errors; every other supply is still scheduled.
+    """
+    cut_plan = CutPlan()
+    pieces_by_supply: Dict[str, List[CutPiece]] = defaultdict(list)
+    for motor_reload_id, count in sorted(build_plan.items()):
+        motor_reload = reloads.get(motor_reload_id)
+        if motor_reload is None:
+            cut_plan.errors.append(f"Unknown reload '{motor_reload_id}'.")
+            continue
+        for casting_supply_id, piece in pieces_for_reload(motor_reload, count):
+            pieces_by_supply[casting_supply_id].append(piece)
+
+    for casting_supply_id, pieces in sorted(pieces_by_supply.items()):
+        casting_supply = casting_supplies.get(casting_supply_id)
+        if casting_supply is None:
+            reload_ids = sorted({piece.motor_reload_id for piece in pieces})
+            cut_plan.errors.append(
+                f"Unknown casting supply '{casting_supply_id}' "
+                f"(needed by {', '.join(reload_ids)})."
+            )
+            continue
+        try:
+            cut_plan.schedules[casting_supply_id] = schedule_supply(
+                casting_supply,
+                pieces,
+                kerf_inch=kerf_inch,
+                end_trim_inch=end_trim_inch,
+                exact=exact,
+                exact_work_limit=exact_work_limit,
+            )
+        except ValueError as error:
+            cut_plan.errors.append(str(error))
+
+    return cut_plan
+
+
+# ---------------------------------------------------------------------------
+# Command line
+# ---------------------------------------------------------------------------
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Plan liner and casting tube cuts for a reload build plan.",
+    )
+    parser.add_argument("motor_data_directory", help="Path to the motor-data root.")
+    parser.add_argument("build_plan", help="JSON file mapping reload_id to motor count.")
+    parser.add_argument(
+        "--kerf",
+        type=float,
+        default=DEFAULT_KERF_INCH,
+        help="Material lost per saw cut, in inches.",
+    )
+    parser.add_argument(
+        "--end-trim",
+        type=float,
+        default=DEFAULT_END_TRIM_INCH,
+        help="Length trimmed from each stock piece before cutting, in inches.",
+    )
+    parser.add_argument(
+        "--exact",
+        action="store_true",
+        help="Search for a proven-minimal schedule when the heuristic may not be.",
+    )
+    parser.add_argument(
+        "--report",
+        default="",
+        help="Optional path for a JSON cut schedule.",
+    )
+    args = parser.parse_args(argv)
+
+    base_directory = Path(args.motor_data_directory).resolve()
+    if not base_directory.is_dir():
+        print(f"Not a directory: {base_directory}", file=sys.stderr)
+        return 2
+
+    build_plan = load_build_plan(Path(args.build_plan))
+    catalog = MotorCatalog.from_directory(base_directory)
+    cut_plan = plan_cuts(
+        build_plan,
+        catalog.reloads.records,
+        catalog.casting_supplies.records,
+        kerf_inch=args.kerf,
+        end_trim_inch=args.end_trim,
+        exact=args.exact,
+    )
+
+    for error in cut_plan.errors:
+        print(f"error: {error}", file=sys.stderr)
+    for casting_supply_id, schedule in sorted(cut_plan.schedules.items()):
+        shortfall = schedule.shortfall
+        print(
+            f"{casting_supply_id}: {schedule.piece_count} pieces from "
+            f"{schedule.stock_pieces_required} x {schedule.stock_length_inch} in stock "
+            f"(lower bound {schedule.lower_bound}{', optimal' if schedule.optimal else ''}), "
+            f"waste {schedule.waste_inch:.2f} in"
+            + (f", short {shortfall}" if shortfall else "")
+        )
+
+    if args.report:
+        report_path = Path(args.report)
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_text(json.dumps(cut_plan.to_dict(), indent=2) + "\n", encoding="utf-8")
+
+    return 0 if cut_plan.ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
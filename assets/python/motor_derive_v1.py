@@ -0,0 +1,557 @@
+"""
+motor_derive_v1.py
+
+Derive mass roll-ups and unit conversions in motor-data records, so they no
+longer have to be maintained by hand.
+
+For every record under a motor-data root this module:
+    - fills each optional unit field from its counterpart:
+        X_mm            <- X_inch * 25.4
+        X_ounces        <- X_grams converted to ounces
+        X_pounds        <- X_grams converted to pounds
+        ounces_per_inch <- grams_per_inch converted to ounces
+    - sets MotorAssembly.hardware_mass.total_hardware_mass_grams to the sum
+      of its parts' Mass records, and the per-role keys already present in
+      hardware_mass (case_mass_grams, forward_closure_mass_grams,
+      aft_nozzle_mass_grams, ...) to the sum for parts in that role
+    - sets ReloadMassBreakdown.hardware_mass_grams from the reload's
+      assembly, and total_loaded_mass_grams to hardware + propellant +
+      liner_and_tube mass
+
+Values that already agree with the derived value to the stored precision
+are left alone, and a file is rewritten only when at least one value
+changes. Only the changed values are replaced in the file's text; key
+order, blank lines, inline arrays and the spelling of every other number
+stay exactly as they were, and a replaced number keeps its decimal places.
+
+Records are processed in dependency order (parts, casting supplies,
+assemblies, reloads). A state file remembers each record's version token
+(LocalJsonFileStore.model_version) and the versions of the records it was
+derived from. A record whose own file and inputs are unchanged since the
+last run is skipped without being read.
+
+Usage as a script:
+    python3 motor_derive_v1.py ../json-data/motor-data --dry-run
+    python3 motor_derive_v1.py ../json-data/motor-data --state .derive-state.json
+
+Depends on:
+    motor_parts_v1.py
+    motor_assemblies_v1.py
+    motor_reloads_v1.py
+    motor_store_v1.py
+    motor_resolve_v1.py (record kinds and keys)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+
+from pydantic import BaseModel, RootModel, ValidationError
+
+from motor_common_v1 import PartRole
+from motor_parts_v1 import MotorPartBase
+from motor_assemblies_v1 import MotorAssembly
+from motor_reloads_v1 import MotorReload
+from motor_store_v1 import LocalJsonFileStore, assembly_key, parts_key
+from motor_resolve_v1 import RECORD_KINDS
+
+
+# Bumped whenever a rule changes, so the next run re-checks every record.
+DERIVATION_VERSION = 2
+STATE_FORMAT = "rocketgeek-motor-derivation-state"
+
+MILLIMETERS_PER_INCH = 25.4
+GRAMS_PER_OUNCE = 28.349523125
+GRAMS_PER_POUND = 453.59237
+
+# Decimal places stored for derived unit fields and gram roll-ups.
+UNIT_PRECISION = 2
+MASS_PRECISION = 1
+
+# Processing order; later kinds read the results of earlier ones.
+DIRECTORY_KINDS: Tuple[Tuple[str, str], ...] = (
+    ("motor-parts", "part"),
+    ("casting-supplies", "casting_supply"),
+    ("motor-assemblies", "assembly"),
+    ("motor-reloads", "reload"),
+)
+
+# Raw hardware_mass keys rolled up per assembly role. They are not model
+# fields, so they are only updated where a record already has them.
+ROLE_MASS_FIELDS: Dict[PartRole, str] = {
+    PartRole.CASE: "case_mass_grams",
+    PartRole.FORWARD_CLOSURE: "forward_closure_mass_grams",
+    PartRole.AFT_CLOSURE: "aft_closure_mass_grams",
+    PartRole.AFT_CLOSURE_NOZZLE: "aft_nozzle_mass_grams",
+    PartRole.NOZZLE: "nozzle_mass_grams",
+    PartRole.NOZZLE_RETAINER: "nozzle_retainer_mass_grams",
+}
+
+JsonPath = Tuple[Union[str, int], ...]
+
+
+# ---------------------------------------------------------------------------
+# Field changes
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class FieldChange:
+    """One value to write into a record's JSON."""
+
+    path: JsonPath
+    old_value: Optional[float]
+    new_value: float
+
+    @property
+    def dotted_path(self) -> str:
+        return ".".join(str(part) for part in self.path)
+
+
+def _differs(old_value: Optional[float], new_value: float, precision: int) -> bool:
+    if old_value is None:
+        return True
+    return abs(old_value - new_value) > 0.5 * 10 ** (-precision) + 1e-9
+
+
+def _unit_source(field_name: str) -> Optional[Tuple[str, float]]:
+    """(source field, factor) for a derived unit field, or None."""
+    if field_name.startswith("ounces_per_"):
+        return "grams_per_" + field_name[len("ounces_per_"):], 1.0 / GRAMS_PER_OUNCE
+    if field_name.endswith("_mm"):
+        return field_name[: -len("_mm")] + "_inch", MILLIMETERS_PER_INCH
+    if field_name.endswith("_ounces"):
+        return field_name[: -len("_ounces")] + "_grams", 1.0 / GRAMS_PER_OUNCE
+    if field_name.endswith("_pounds"):
+        return field_name[: -len("_pounds")] + "_grams", 1.0 / GRAMS_PER_POUND
+    return None
+
+
+def unit_changes(model: BaseModel, path: JsonPath = ()) -> List[FieldChange]:
+    """Every unit field in model (recursively) whose derived value differs."""
+    changes: List[FieldChange] = []
+    model_fields = type(model).model_fields
+    for field_name in model_fields:
+        value = getattr(model, field_name)
+        if isinstance(value, BaseModel):
+            changes.extend(unit_changes(value, path + (field_name,)))
+            continue
+        if isinstance(value, list):
+            for index, item in enumerate(value):
+                if isinstance(item, BaseModel):
+                    changes.extend(unit_changes(item, path + (field_name, index)))
+            continue
+        source = _unit_source(field_name)
+        if source is None or source[0] not in model_fields:
+            continue
+        source_value = getattr(model, source[0])
+        if source_value is None:
+            continue
+        # Compare unrounded, so a hand-entered 48.90 for 48.895 is kept.
+        derived = source_value * source[1]
+        if _differs(value, derived, UNIT_PRECISION):
+            changes.append(
+                FieldChange(path + (field_name,), value, round(derived, UNIT_PRECISION))
+            )
+    return changes
+
+
+def assembly_mass_changes(
+    assembly: MotorAssembly,
+    parts: Mapping[str, MotorPartBase],
+    raw_hardware_mass: Optional[Mapping[str, Any]] = None,
+) -> List[FieldChange]:
+    """
+    Changes to total_hardware_mass_grams, and to the ROLE_MASS_FIELDS keys
+    present in raw_hardware_mass, from the parts' masses.
+
+    A role whose parts have no Mass record is left alone.
+    Raises KeyError naming the first referenced part that is not in parts.
+    """
+    total_grams = 0.0
+    role_grams: Dict[PartRole, float] = {}
+    unknown_roles = set()
+    for part_ref in assembly.parts:
+        if part_ref.part_id not in parts:
+            raise KeyError(part_ref.part_id)
+        part_mass = getattr(parts[part_ref.part_id], "mass", None)
+        if part_mass is None:
+            unknown_roles.add(part_ref.role)
+            continue
+        total_grams += part_mass.total_grams
+        role_grams[part_ref.role] = role_grams.get(part_ref.role, 0.0) + part_mass.total_grams
+
+    changes: List[FieldChange] = []
+    for role, grams in role_grams.items():
+        field_name = ROLE_MASS_FIELDS.get(role)
+        if field_name is None or role in unknown_roles or field_name not in (raw_hardware_mass or {}):
+            continue
+        current = raw_hardware_mass[field_name]  # type: ignore[index]
+        grams = round(grams, MASS_PRECISION)
+        if _differs(current, grams, MASS_PRECISION):
+            changes.append(FieldChange(("hardware_mass", field_name), current, grams))
+
+    total_grams = round(total_grams, MASS_PRECISION)
+    current_total = assembly.hardware_mass.total_hardware_mass_grams
+    if _differs(current_total, total_grams, MASS_PRECISION):
+        changes.append(
+            FieldChange(("hardware_mass", "total_hardware_mass_grams"), current_total, total_grams)
+        )
+    return changes
+
+
+def reload_mass_changes(motor_reload: MotorReload, assembly: MotorAssembly) -> List[FieldChange]:
+    """Changes to the reload's hardware and total loaded mass, if it has a breakdown."""
+    breakdown = motor_reload.mass_breakdown
+    if breakdown is None:
+        return []
+    changes: List[FieldChange] = []
+    hardware_grams = assembly.hardware_mass.total_hardware_mass_grams
+    if _differs(breakdown.hardware_mass_grams, hardware_grams, MASS_PRECISION):
+        changes.append(
+            FieldChange(
+                ("mass_breakdown", "hardware_mass_grams"),
+                breakdown.hardware_mass_grams,
+                hardware_grams,
+            )
+        )
+    total_grams = round(
+        hardware_grams
+        + breakdown.propellant_mass_grams
+        + (breakdown.liner_and_tube_mass_grams or 0.0),
+        MASS_PRECISION,
+    )
+    if _differs(breakdown.total_loaded_mass_grams, total_grams, MASS_PRECISION):
+        changes.append(
+            FieldChange(
+                ("mass_breakdown", "total_loaded_mass_grams"),
+                breakdown.total_loaded_mass_grams,
+                total_grams,
+            )
+        )
+    return changes
+
+
+def apply_changes(raw_record: Dict[str, Any], changes: List[FieldChange]) -> None:
+    """Write each change into the parsed JSON in place."""
+    for change in changes:
+        container: Any = raw_record
+        for part in change.path[:-1]:
+            container = container[part]
+        container[change.path[-1]] = change.new_value
+
+
+# ---------------------------------------------------------------------------
+# In-place text patching
+# ---------------------------------------------------------------------------
+
+_WHITESPACE_PATTERN = re.compile(r"\s*")
+_DECIMAL_PATTERN = re.compile(r"-?\d+\.(\d+)")
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _skip_whitespace(json_text: str, index: int) -> int:
+    return _WHITESPACE_PATTERN.match(json_text, index).end()  # type: ignore[union-attr]
+
+
+def _members(json_text: str, start: int) -> List[Tuple[Union[str, int], int, int, int]]:
+    """
+    (name or index, member start, value start, value end) for each member
+    of the object or array that opens at start.
+    """
+    closing = "}" if json_text[start] == "{" else "]"
+    members: List[Tuple[Union[str, int], int, int, int]] = []
+    index = _skip_whitespace(json_text, start + 1)
+    while json_text[index] != closing:
+        member_start = index
+        name: Union[str, int] = len(members)
+        if closing == "}":
+            name, index = json.decoder.scanstring(json_text, index + 1)
+            index = _skip_whitespace(json_text, _skip_whitespace(json_text, index) + 1)
+        _value, value_end = _JSON_DECODER.raw_decode(json_text, index)
+        members.append((name, member_start, index, value_end))
+        index = _skip_whitespace(json_text, value_end)
+        if json_text[index] == ",":
+            index = _skip_whitespace(json_text, index + 1)
+    return members
+
+
+def _number_text(new_value: float, old_text: str) -> str:
+    """new_value as JSON, keeping at least the decimal places of old_text."""
+    new_text = json.dumps(new_value)
+    old_match = _DECIMAL_PATTERN.fullmatch(old_text)
+    if old_match is None or not _DECIMAL_PATTERN.fullmatch(new_text):
+        return new_text
+    decimals = max(len(old_match.group(1)), len(new_text.partition(".")[2]))
+    return f"{new_value:.{decimals}f}"
+
+
+def patch_json_text(json_text: str, changes: List[FieldChange]) -> str:
+    """
+    Apply changes to JSON text without re-serializing it.
+
+    Each value is replaced where it stands. A missing key is appended to
+    its object, indented like the object's last member.
+    """
+    for change in changes:
+        container_start = _skip_whitespace(json_text, 0)
+        for part in change.path[:-1]:
+            value_starts = {
+                name: value_start
+                for name, _member_start, value_start, _value_end in _members(json_text, container_start)
+            }
+            container_start = value_starts[part]
+        members = _members(json_text, container_start)
+        targets = [member for member in members if member[0] == change.path[-1]]
+        if targets:
+            _name, _member_start, value_start, value_end = targets[0]
+            new_text = _number_text(change.new_value, json_text[value_start:value_end])
+            json_text = json_text[:value_start] + new_text + json_text[value_end:]
+            continue
+
+        member_text = f"{json.dumps(change.path[-1])}: {json.dumps(change.new_value)}"
+        if not members:
+            insert_at = container_start + 1
+        else:
+            _name, member_start, _value_start, insert_at = members[-1]
+            indent_start = member_start
+            while json_text[indent_start - 1] in " \t":
+                indent_start -= 1
+            if json_text[indent_start - 1] == "\n":
+                member_text = ",\n" + json_text[indent_start:member_start] + member_text
+            else:
+                member_text = ", " + member_text
+        json_text = json_text[:insert_at] + member_text + json_text[insert_at:]
+    return json_text
+
+
+# ---------------------------------------------------------------------------
+# Incremental state
+# ---------------------------------------------------------------------------
+
+
+def _load_state(state_path: Optional[Path]) -> Dict[str, Dict[str, Any]]:
+    if state_path is None or not state_path.exists():
+        return {}
+    raw_state = json.loads(state_path.read_text(encoding="utf-8"))
+    if raw_state.get("format") != STATE_FORMAT or raw_state.get("version") != DERIVATION_VERSION:
+        return {}
+    return raw_state.get("records", {})
+
+
+def _save_state(state_path: Optional[Path], records: Dict[str, Dict[str, Any]]) -> None:
+    if state_path is None:
+        return
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    state_path.write_text(
+        json.dumps(
+            {"format": STATE_FORMAT, "version": DERIVATION_VERSION, "records": records},
+            indent=2,
+            sort_keys=True,
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+
+
+# ---------------------------------------------------------------------------
+# Batch derivation
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class DerivationReport:
+    """What a derivation run checked, skipped and changed."""
+
+    checked: int = 0
+    skipped_unchanged: int = 0
+    updated: Dict[str, List[str]] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "checked": self.checked,
+            "skipped_unchanged": self.skipped_unchanged,
+            "updated": dict(self.updated),
+            "errors": dict(self.errors),
+        }
+
+
+def derive_motor_data(
+    base_directory: Path,
+    state_path: Optional[Path] = None,
+    dry_run: bool = False,
+) -> DerivationReport:
+    """
+    Derive roll-ups and unit fields for every record under base_directory.
+
+    With state_path, records whose file and inputs are unchanged since the
+    last run are skipped. With dry_run, nothing is written (the state file
+    included) and report.updated lists what would change.
+    """
+    report = DerivationReport()
+    store = LocalJsonFileStore(base_directory)
+    previous_state = _load_state(state_path)
+    next_state: Dict[str, Dict[str, Any]] = {}
+    # Validated records by (kind, record ID), as they are after this run.
+    models: Dict[Tuple[str, str], BaseModel] = {}
+
+    def load(kind: str, record_id: str) -> Optional[BaseModel]:
+        if (kind, record_id) not in models:
+            model_class, key_for = RECORD_KINDS[kind]
+            try:
+                model = store.load_model(model_class, key_for(record_id))
+            except (FileNotFoundError, ValidationError):
+                return None
+            models[(kind, record_id)] = model.root if isinstance(model, RootModel) else model
+        return models[(kind, record_id)]
+
+    for directory_name, kind in DIRECTORY_KINDS:
+        directory_path = base_directory / directory_name
+        if not directory_path.is_dir():
+            continue
+        model_class, _key_for = RECORD_KINDS[kind]
+        for file_path in sorted(directory_path.glob("*.json")):
+            key = f"{directory_name}/{file_path.stem}"
+            version = store.model_version(key)
+            previous = previous_state.get(key)
+            if previous is not None and previous.get("version") == version and all(
+                store.model_version(input_key) == input_version
+                for input_key, input_version in previous.get("inputs", {}).items()
+            ):
+                next_state[key] = previous
+                report.skipped_unchanged += 1
+                continue
+
+            report.checked += 1
+            try:
+                original_text = file_path.read_text(encoding="utf-8")
+                raw_record = json.loads(original_text)
+                model = model_class.model_validate(raw_record)
+            except (ValueError, ValidationError) as error:
+                report.errors[key] = str(error).splitlines()[0]
+                continue
+            record = model.root if isinstance(model, RootModel) else model
+
+            changes: List[FieldChange] = []
+            input_keys: List[str] = []
+            try:
+                if isinstance(record, MotorAssembly):
+                    input_keys = [parts_key(part_ref.part_id) for part_ref in record.parts]
+                    parts: Dict[str, MotorPartBase] = {}
+                    for part_ref in record.parts:
+                        part = load("part", part_ref.part_id)
+                        if part is not None:
+                            parts[part_ref.part_id] = part  # type: ignore[assignment]
+                    changes.extend(
+                        assembly_mass_changes(record, parts, raw_record.get("hardware_mass"))
+                    )
+                elif isinstance(record, MotorReload):
+                    input_keys = [assembly_key(record.assembly_id)]
+                    assembly = load("assembly", record.assembly_id)
+                    if assembly is None:
+                        raise KeyError(record.assembly_id)
+                    changes.extend(reload_mass_changes(record, assembly))  # type: ignore[arg-type]
+            except KeyError as error:
+                report.errors[key] = f"Cannot roll up mass: record '{error.args[0]}' is missing or invalid."
+
+            if changes:
+                apply_changes(raw_record, changes)
+                model = model_class.model_validate(raw_record)
+                record = model.root if isinstance(model, RootModel) else model
+            unit_updates = unit_changes(record)
+            if unit_updates:
+                apply_changes(raw_record, unit_updates)
+                model = model_class.model_validate(raw_record)
+                record = model.root if isinstance(model, RootModel) else model
+            changes.extend(unit_updates)
+
+            record_id = file_path.stem
+            models[(kind, record_id)] = record
+            if changes:
+                report.updated[key] = [change.dotted_path for change in changes]
+                if not dry_run:
+                    store.write_text_atomic(key, patch_json_text(original_text, changes))
+                    version = store.model_version(key)
+            if key not in report.errors:
+                next_state[key] = {
+                    "version": version,
+                    "inputs": {input_key: store.model_version(input_key) for input_key in input_keys},
+                }
+
+    if not dry_run:
+        _save_state(state_path, next_state)
+    return report
+
+
+# ---------------------------------------------------------------------------
+# Command line
+# ---------------------------------------------------------------------------
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Fill derived masses and unit fields in motor-data records.",
+    )
+    parser.add_argument("motor_data_directory", help="Path to the motor-data root.")
+    parser.add_argument(
+        "--state",
+        default="",
+        help=(
+            "State file used to skip unchanged records. Keep it outside the "
+            "motor-data root so validators do not pick it up."
+        ),
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report what would change without writing anything.",
+    )
+    parser.add_argument(
+        "--report",
+        default="",
+        help="Optional path for a JSON report.",
+    )
+    args = parser.parse_args(argv)
+
+    base_directory = Path(args.motor_data_directory).resolve()
+    if not base_directory.is_dir():
+        print(f"Not a directory: {base_directory}", file=sys.stderr)
+        return 2
+
+    report = derive_motor_data(
+        base_directory,
+        state_path=Path(args.state) if args.state else None,
+        dry_run=args.dry_run,
+    )
+
+    for key, message in sorted(report.errors.items()):
+        print(f"error    {key}: {message}", file=sys.stderr)
+    verb = "would update" if args.dry_run else "updated"
+    for key, changed_paths in sorted(report.updated.items()):
+        print(f"{verb} {key}: {', '.join(changed_paths)}")
+    print(
+        f"Checked: {report.checked}  unchanged: {report.skipped_unchanged}  "
+        f"{verb}: {len(report.updated)}  errors: {len(report.errors)}"
+    )
+
+    if args.report:
+        report_path = Path(args.report)
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_text(json.dumps(report.to_dict(), indent=2) + "\n", encoding="utf-8")
+
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
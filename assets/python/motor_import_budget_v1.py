@@ -0,0 +1,111 @@
+"""
+motor_import_budget_v1.py
+
+Measure cold import time of the motor model modules and compare it with a
+budget, so regressions in schema-construction cost are caught before they
+reach short-lived CLI and Lambda processes.
+
+Each module is imported in a fresh interpreter (so pydantic and every
+dependency are counted) several times and the fastest run is kept. A bare
+"import pydantic" is measured the same way in the same run, and each
+module's budget in IMPORT_BUDGETS is a multiple of that baseline, so the
+check holds on fast and slow machines alike.
+
+Usage as a script (exits 1 when any module is over budget):
+    python3 motor_import_budget_v1.py
+    python3 motor_import_budget_v1.py --runs 10 motor_store_v1
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+BASELINE_MODULE = "pydantic"
+
+# Fastest of --runs cold imports, pydantic included, as a multiple of the
+# fastest bare BASELINE_MODULE import.
+IMPORT_BUDGETS: Dict[str, float] = {
+    "motor_hardware_models_v1": 0.5,
+    "motor_common_v1": 3.75,
+    "motor_parts_v1": 4.1,
+    "motor_assemblies_v1": 3.85,
+    "motor_casting_supplies_v1": 3.85,
+    "motor_reloads_v1": 4.1,
+    "motor_store_v1": 4.7,
+    "motor_catalog_v1": 4.6,
+}
+
+DEFAULT_RUNS = 5
+
+MEASURE_SNIPPET = (
+    "import time, importlib; "
+    "start = time.perf_counter(); "
+    "importlib.import_module({module_name!r}); "
+    "print((time.perf_counter() - start) * 1000.0)"
+)
+
+
+def measure_import_ms(module_name: str, runs: int = DEFAULT_RUNS) -> float:
+    """Fastest cold import time of module_name over runs fresh interpreters."""
+    module_directory = Path(__file__).resolve().parent
+    timings: List[float] = []
+    for _ in range(max(1, runs)):
+        completed = subprocess.run(
+            [sys.executable, "-c", MEASURE_SNIPPET.format(module_name=module_name)],
+            cwd=module_directory,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        timings.append(float(completed.stdout.strip().splitlines()[-1]))
+    return min(timings)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Check cold import time of motor modules against a budget.",
+    )
+    parser.add_argument(
+        "modules",
+        nargs="*",
+        help="Modules to measure. Defaults to every module with a budget.",
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=DEFAULT_RUNS,
+        help="Fresh interpreters per module; the fastest run is used.",
+    )
+    args = parser.parse_args(argv)
+
+    module_names = args.modules or list(IMPORT_BUDGETS)
+    baseline_ms = measure_import_ms(BASELINE_MODULE, args.runs)
+    print(f"{'baseline: ' + BASELINE_MODULE:<28} {baseline_ms:8.1f} ms")
+    over_budget = 0
+    for module_name in module_names:
+        elapsed_ms = measure_import_ms(module_name, args.runs)
+        ratio = elapsed_ms / baseline_ms
+        budget_ratio = IMPORT_BUDGETS.get(module_name)
+        if budget_ratio is None:
+            status = "no budget"
+        elif ratio <= budget_ratio:
+            status = "ok"
+        else:
+            status = "OVER"
+            over_budget += 1
+        budget_text = f"{budget_ratio:5.2f}x" if budget_ratio is not None else "     -"
+        print(
+            f"{module_name:<28} {elapsed_ms:8.1f} ms  {ratio:5.2f}x  "
+            f"budget {budget_text}  {status}"
+        )
+
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,431 @@
+"""
+motor_integrity_v1.py
+
+Referential-integrity checker for a motor-data directory tree.
+
+Validating each file on its own (motor_bulk_load_v1.py) does not catch
+dangling references, such as a reload pointing at a casting supply that does
+not exist. This module builds ID indexes for every record kind in a single
+pass, then checks each cross-reference with dictionary lookups, so the whole
+check stays O(n) as the dataset grows:
+
+    - record IDs are unique and match their file names
+    - assembly part refs point at existing parts, with a role the part's
+      part_type can fill (and, as a warning, the role the part declares)
+    - assemblies have exactly one case
+    - reload assembly_id points at an existing assembly
+    - reload liner / casting tube supply IDs point at existing supplies of
+      the matching supply_type
+    - motor_standard agrees across references (warning)
+    - reload liner cut fits the assembly's available liner length (warning)
+
+References to files that exist but fail validation are reported as
+'target_invalid' rather than 'missing'.
+
+Usage as a script (exits 1 when any error-severity issue is found):
+    python3 motor_integrity_v1.py ../json-data/motor-data
+    python3 motor_integrity_v1.py ../json-data/motor-data --report integrity.json
+
+Depends on:
+    motor_bulk_load_v1.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from motor_common_v1 import CastingSupplyType, MotorStandard, PartRole, PartType
+from motor_parts_v1 import MotorPartBase
+from motor_assemblies_v1 import MotorAssembly
+from motor_casting_supplies_v1 import CastingSupply
+from motor_reloads_v1 import MotorReload
+from motor_bulk_load_v1 import BulkLoadError, bulk_load_motor_data
+
+
+# ---------------------------------------------------------------------------
+# Rules
+# ---------------------------------------------------------------------------
+
+SEVERITY_ERROR = "error"
+SEVERITY_WARNING = "warning"
+
+# Roles each part_type can fill inside an assembly.
+ROLES_BY_PART_TYPE: Dict[PartType, Set[PartRole]] = {
+    PartType.CASE: {PartRole.CASE},
+    PartType.CLOSURE: {
+        PartRole.FORWARD_CLOSURE,
+        PartRole.AFT_CLOSURE,
+        PartRole.NOZZLE_RETAINER,
+    },
+    PartType.NOZZLE: {PartRole.NOZZLE, PartRole.AFT_CLOSURE_NOZZLE},
+    PartType.OTHER: set(PartRole),
+}
+
+ID_FIELD_BY_DIRECTORY: Dict[str, str] = {
+    "motor-parts": "part_id",
+    "motor-assemblies": "assembly_id",
+    "casting-supplies": "casting_supply_id",
+    "motor-reloads": "motor_reload_id",
+}
+
+
+# ---------------------------------------------------------------------------
+# Report types
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class IntegrityIssue:
+    """One integrity problem, located by source file and field."""
+
+    severity: str
+    code: str
+    source: str
+    field: str
+    target: str
+    message: str
+
+
+@dataclass
+class IntegrityReport:
+    """All issues found, plus record counts."""
+
+    record_counts: Dict[str, int] = field(default_factory=dict)
+    issues: List[IntegrityIssue] = field(default_factory=list)
+    validation_errors: List[BulkLoadError] = field(default_factory=list)
+
+    @property
+    def error_count(self) -> int:
+        return sum(1 for issue in self.issues if issue.severity == SEVERITY_ERROR)
+
+    @property
+    def warning_count(self) -> int:
+        return sum(1 for issue in self.issues if issue.severity == SEVERITY_WARNING)
+
+    @property
+    def ok(self) -> bool:
+        return self.error_count == 0 and not self.validation_errors
+
+    def to_dict(self) -> Dict[str, object]:
+        """Machine-readable report, suitable for json.dumps."""
+        return {
+            "ok": self.ok,
+            "record_counts": self.record_counts,
+            "error_count": self.error_count,
+            "warning_count": self.warning_count,
+            "validation_error_count": len(self.validation_errors),
+            "issues": [asdict(issue) for issue in self.issues],
+            "validation_errors": [asdict(error) for error in self.validation_errors],
+        }
+
+
+# ---------------------------------------------------------------------------
+# Checker
+# ---------------------------------------------------------------------------
+
+
+class _Indexes:
+    """ID -> (record, source key) for every kind, plus IDs of invalid files."""
+
+    def __init__(self) -> None:
+        self.parts: Dict[str, MotorPartBase] = {}
+        self.assemblies: Dict[str, MotorAssembly] = {}
+        self.casting_supplies: Dict[str, CastingSupply] = {}
+        self.reloads: Dict[str, MotorReload] = {}
+        self.sources: Dict[str, str] = {}
+        self.invalid_ids: Dict[str, Set[str]] = {
+            directory_name: set() for directory_name in ID_FIELD_BY_DIRECTORY
+        }
+
+
+def _standards_conflict(left: MotorStandard, right: MotorStandard) -> bool:
+    return MotorStandard.OTHER not in (left, right) and left != right
+
+
+def check_motor_data(base_directory: Path) -> IntegrityReport:
+    """Validate every record, build ID indexes once and check cross-references."""
+    report = IntegrityReport()
+    load_result = bulk_load_motor_data(base_directory)
+    report.validation_errors = list(load_result.errors)
+    indexes = _Indexes()
+
+    def add_issue(
+        severity: str,
+        code: str,
+        source: str,
+        field_name: str,
+        target: str,
+        message: str,
+    ) -> None:
+        report.issues.append(
+            IntegrityIssue(severity, code, f"{source}.json", field_name, target, message)
+        )
+
+    # Invalid files still count as present, so references to them are
+    # reported as 'target_invalid' instead of 'missing'.
+    for error_file in sorted({error.file for error in load_result.errors}):
+        directory_name, _, file_name = error_file.partition("/")
+        if directory_name in indexes.invalid_ids:
+            indexes.invalid_ids[directory_name].add(Path(file_name).stem)
+
+    # --- pass 1: index every record by ID ----------------------------------
+    for key, record in sorted(load_result.records.items()):
+        directory_name, _, file_stem = key.partition("/")
+        id_field = ID_FIELD_BY_DIRECTORY.get(directory_name)
+        if id_field is None:
+            continue
+        record_id = getattr(record, id_field)
+        if record_id != file_stem:
+            add_issue(
+                SEVERITY_WARNING,
+                "id_filename_mismatch",
+                key,
+                id_field,
+                record_id,
+                f"{id_field} '{record_id}' does not match file name '{file_stem}'.",
+            )
+        kind_index: Dict[str, object] = {
+            "motor-parts": indexes.parts,
+            "motor-assemblies": indexes.assemblies,
+            "casting-supplies": indexes.casting_supplies,
+            "motor-reloads": indexes.reloads,
+        }[directory_name]
+        source_key = f"{directory_name}:{record_id}"
+        if record_id in kind_index:
+            add_issue(
+                SEVERITY_ERROR,
+                "duplicate_id",
+                key,
+                id_field,
+                record_id,
+                f"{id_field} '{record_id}' is also used by "
+                f"{indexes.sources[source_key]}.json.",
+            )
+            continue
+        kind_index[record_id] = record
+        indexes.sources[source_key] = key
+
+    def check_reference(
+        source: str,
+        field_name: str,
+        target_id: str,
+        directory_name: str,
+        index: Dict[str, object],
+    ) -> Optional[object]:
+        target = index.get(target_id)
+        if target is not None:
+            return target
+        if target_id in indexes.invalid_ids[directory_name]:
+            add_issue(
+                SEVERITY_ERROR,
+                "target_invalid",
+                source,
+                field_name,
+                target_id,
+                f"{directory_name}/{target_id}.json exists but fails validation.",
+            )
+        else:
+            add_issue(
+                SEVERITY_ERROR,
+                "missing_reference",
+                source,
+                field_name,
+                target_id,
+                f"No record '{target_id}' in {directory_name}/.",
+            )
+        return None
+
+    # --- pass 2: assemblies -> parts ---------------------------------------
+    for assembly_id, assembly in indexes.assemblies.items():
+        source = indexes.sources[f"motor-assemblies:{assembly_id}"]
+        case_count = 0
+        for position, part_ref in enumerate(assembly.parts):
+            field_name = f"parts.{position}.part_id"
+            if part_ref.role == PartRole.CASE:
+                case_count += 1
+            part = check_reference(
+                source, field_name, part_ref.part_id, "motor-parts", indexes.parts
+            )
+            if not isinstance(part, MotorPartBase):
+                continue
+            if part_ref.role not in ROLES_BY_PART_TYPE.get(part.part_type, set()):
+                add_issue(
+                    SEVERITY_ERROR,
+                    "role_incompatible",
+                    source,
+                    f"parts.{position}.role",
+                    part_ref.part_id,
+                    f"A {part.part_type.value} part cannot fill role "
+                    f"'{part_ref.role.value}'.",
+                )
+            elif part.role not in (PartRole.OTHER, part_ref.role):
+                add_issue(
+                    SEVERITY_WARNING,
+                    "role_mismatch",
+                    source,
+                    f"parts.{position}.role",
+                    part_ref.part_id,
+                    f"Assembly uses the part as '{part_ref.role.value}' but the "
+                    f"part declares role '{part.role.value}'.",
+                )
+            if _standards_conflict(assembly.motor_standard, part.motor_standard):
+                add_issue(
+                    SEVERITY_WARNING,
+                    "motor_standard_mismatch",
+                    source,
+                    field_name,
+                    part_ref.part_id,
+                    f"Assembly is {assembly.motor_standard.value} but the part is "
+                    f"{part.motor_standard.value}.",
+                )
+        if case_count > 1:
+            add_issue(
+                SEVERITY_ERROR,
+                "multiple_cases",
+                source,
+                "parts",
+                assembly_id,
+                f"Assembly lists {case_count} parts with role 'case'.",
+            )
+        elif case_count == 0:
+            add_issue(
+                SEVERITY_ERROR,
+                "missing_case",
+                source,
+                "parts",
+                assembly_id,
+                "Assembly lists no part with role 'case'.",
+            )
+
+    # --- pass 3: reloads -> assemblies and supplies -------------------------
+    for motor_reload_id, motor_reload in indexes.reloads.items():
+        source = indexes.sources[f"motor-reloads:{motor_reload_id}"]
+
+        assembly = check_reference(
+            source,
+            "assembly_id",
+            motor_reload.assembly_id,
+            "motor-assemblies",
+            indexes.assemblies,
+        )
+        if isinstance(assembly, MotorAssembly):
+            if _standards_conflict(motor_reload.motor_standard, assembly.motor_standard):
+                add_issue(
+                    SEVERITY_WARNING,
+                    "motor_standard_mismatch",
+                    source,
+                    "assembly_id",
+                    assembly.assembly_id,
+                    f"Reload is {motor_reload.motor_standard.value} but the assembly "
+                    f"is {assembly.motor_standard.value}.",
+                )
+            available_length = assembly.stack_geometry.available_liner_length_inch
+            if motor_reload.liner.cut_length_inch > available_length:
+                add_issue(
+                    SEVERITY_WARNING,
+                    "liner_too_long",
+                    source,
+                    "liner.cut_length_inch",
+                    assembly.assembly_id,
+                    f"Liner cut {motor_reload.liner.cut_length_inch} in exceeds the "
+                    f"assembly's available liner length {available_length} in.",
+                )
+
+        for field_name, supply_id, expected_type in (
+            (
+                "liner.casting_supply_id",
+                motor_reload.liner.casting_supply_id,
+                CastingSupplyType.LINER,
+            ),
+            (
+                "casting_tubes.casting_supply_id",
+                motor_reload.casting_tubes.casting_supply_id,
+                CastingSupplyType.CASTING_TUBE,
+            ),
+        ):
+            supply = check_reference(
+                source,
+                field_name,
+                supply_id,
+                "casting-supplies",
+                indexes.casting_supplies,
+            )
+            if isinstance(supply, CastingSupply) and supply.supply_type != expected_type:
+                add_issue(
+                    SEVERITY_ERROR,
+                    "supply_type_mismatch",
+                    source,
+                    field_name,
+                    supply_id,
+                    f"Expected a '{expected_type.value}' supply, found "
+                    f"'{supply.supply_type.value}'.",
+                )
+
+    report.record_counts = {
+        "parts": len(indexes.parts),
+        "assemblies": len(indexes.assemblies),
+        "casting_supplies": len(indexes.casting_supplies),
+        "reloads": len(indexes.reloads),
+    }
+    return report
+
+
+# ---------------------------------------------------------------------------
+# Command line
+# ---------------------------------------------------------------------------
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Check cross-references between motor-data records.",
+    )
+    parser.add_argument("motor_data_directory", help="Path to the motor-data root.")
+    parser.add_argument(
+        "--report",
+        default="",
+        help="Optional path for a JSON report.",
+    )
+    args = parser.parse_args(argv)
+
+    base_directory = Path(args.motor_data_directory).resolve()
+    if not base_directory.is_dir():
+        print(f"Not a directory: {base_directory}", file=sys.stderr)
+        return 2
+
+    report = check_motor_data(base_directory)
+
+    for error in report.validation_errors:
+        print(
+            f"error    validation: {error.file} {error.field}: {error.message}",
+            file=sys.stderr,
+        )
+    for issue in report.issues:
+        print(
+            f"{issue.severity:<8} {issue.code}: {issue.source} {issue.field}: "
+            f"{issue.message}",
+            file=sys.stderr,
+        )
+    print(
+        f"Records: {json.dumps(report.record_counts, sort_keys=True)}  "
+        f"errors: {report.error_count}  warnings: {report.warning_count}  "
+        f"invalid files: {len({error.file for error in report.validation_errors})}"
+    )
+
+    if args.report:
+        report_path = Path(args.report)
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_text(
+            json.dumps(report.to_dict(), indent=2) + "\n",
+            encoding="utf-8",
+        )
+
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
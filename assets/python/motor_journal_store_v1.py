@@ -0,0 +1,366 @@
+"""
+motor_journal_store_v1.py
+
+Append-only, journaled implementation of the ModelStore interface from
+motor_store_v1.py.
+
+Every save_model appends one versioned entry (sequence number, timestamp,
+key, model type and the record's JSON) to a journal file, so editing
+inventory or reload definitions is an O(1) append instead of a file rewrite,
+and every earlier version stays available.
+
+Files, all next to journal_path:
+    <name>.jsonl                    active journal, one entry per line
+    <name>.snapshot.jsonl           latest version of every live key as of
+                                    the last compaction (header line first)
+    <name>.<first>-<last>.archive.jsonl
+                                    journals rolled over by compaction, kept
+                                    for point-in-time reads (keep_archives)
+
+Opening the store loads the snapshot and replays the active journal to
+rebuild the in-memory latest-version index. A torn last line left by a
+crash mid-append is dropped. compact() (run automatically every
+compact_every appends) rewrites the snapshot and starts a fresh journal.
+
+Example:
+    store = JournaledModelStore(Path("motor-data.journal.jsonl"))
+    save_casting_supply(store, supply)
+    earlier = store.load_model_at(CastingSupply, "casting-supplies/liner_x", at=yesterday)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+SNAPSHOT_FORMAT = "rocketgeek-motor-journal-snapshot"
+SNAPSHOT_VERSION = 1
+DEFAULT_COMPACT_EVERY = 1000
+
+
+class JournalEntry(NamedTuple):
+    """One saved (or deleted, when data is None) version of a key."""
+
+    seq: int
+    timestamp: float
+    key: str
+    model_type: str
+    data: Optional[Dict[str, Any]]
+
+    @property
+    def deleted(self) -> bool:
+        return self.data is None
+
+    def to_line(self) -> str:
+        return json.dumps(
+            {
+                "seq": self.seq,
+                "ts": self.timestamp,
+                "key": self.key,
+                "model_type": self.model_type,
+                "data": self.data,
+            },
+            separators=(",", ":"),
+            ensure_ascii=False,
+        ) + "\n"
+
+    @classmethod
+    def from_line(cls, line: str) -> "JournalEntry":
+        raw = json.loads(line)
+        return cls(raw["seq"], raw["ts"], raw["key"], raw["model_type"], raw["data"])
+
+
+def _normalize_key(key: str) -> str:
+    return key[: -len(".json")] if key.endswith(".json") else key
+
+
+def _read_entries(file_path: Path) -> Iterator[JournalEntry]:
+    """Entries in a journal or archive file, stopping at a torn trailing line."""
+    with file_path.open("r", encoding="utf-8") as input_file:
+        for line in input_file:
+            if not line.endswith("\n"):
+                return
+            if line.strip():
+                yield JournalEntry.from_line(line)
+
+
+class JournaledModelStore:
+    """
+    ModelStore that appends every save to a journal and keeps the latest
+    version of each key in memory.
+
+    load_model reads the latest version; load_model_at reads the version that
+    was current at a timestamp or sequence number. Missing or deleted keys
+    raise FileNotFoundError, matching LocalJsonFileStore.
+    """
+
+    def __init__(
+        self,
+        journal_path: Path,
+        compact_every: Optional[int] = DEFAULT_COMPACT_EVERY,
+        keep_archives: bool = True,
+        durable: bool = True,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.journal_path = journal_path
+        self.snapshot_path = journal_path.with_name(f"{journal_path.stem}.snapshot.jsonl")
+        self.compact_every = compact_every
+        self.keep_archives = keep_archives
+        self.durable = durable
+        self._clock = clock
+        self._lock = threading.RLock()
+
+        # Latest entry per key (deleted keys keep their tombstone until compaction).
+        self._latest: Dict[str, JournalEntry] = {}
+        # Entries per key in the active journal, oldest first.
+        self._journal_history: Dict[str, List[JournalEntry]] = {}
+        # Latest entry per key as of the last compaction.
+        self._snapshot_entries: Dict[str, JournalEntry] = {}
+        self._snapshot_seq = 0
+        self._next_seq = 1
+        self._appends_since_compaction = 0
+
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        self._load_snapshot()
+        self._replay_journal()
+        self._journal_file = self.journal_path.open("a", encoding="utf-8")
+
+    # --- opening -------------------------------------------------------------
+
+    def _load_snapshot(self) -> None:
+        if not self.snapshot_path.exists():
+            return
+        with self.snapshot_path.open("r", encoding="utf-8") as input_file:
+            header = json.loads(input_file.readline())
+            if header.get("format") != SNAPSHOT_FORMAT or header.get("version") != SNAPSHOT_VERSION:
+                raise ValueError(f"{self.snapshot_path}: not a supported journal snapshot.")
+            self._snapshot_seq = int(header["last_seq"])
+            for line in input_file:
+                if line.strip():
+                    entry = JournalEntry.from_line(line)
+                    self._snapshot_entries[entry.key] = entry
+        self._latest.update(self._snapshot_entries)
+        self._next_seq = self._snapshot_seq + 1
+
+    def _replay_journal(self) -> None:
+        if not self.journal_path.exists():
+            return
+        valid_bytes = 0
+        with self.journal_path.open("rb") as input_file:
+            for raw_line in input_file:
+                if not raw_line.endswith(b"\n"):
+                    break
+                valid_bytes += len(raw_line)
+                if not raw_line.strip():
+                    continue
+                entry = JournalEntry.from_line(raw_line.decode("utf-8"))
+                if entry.seq <= self._snapshot_seq:
+                    # Already folded into the snapshot (crash during compaction).
+                    continue
+                self._apply(entry)
+                self._appends_since_compaction += 1
+        if valid_bytes < self.journal_path.stat().st_size:
+            # Drop the torn tail so the next append starts on a clean line.
+            with self.journal_path.open("r+b") as output_file:
+                output_file.truncate(valid_bytes)
+
+    def _apply(self, entry: JournalEntry) -> None:
+        self._latest[entry.key] = entry
+        self._journal_history.setdefault(entry.key, []).append(entry)
+        self._next_seq = max(self._next_seq, entry.seq + 1)
+
+    def close(self) -> None:
+        with self._lock:
+            self._journal_file.close()
+
+    def __enter__(self) -> "JournaledModelStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    # --- appending -----------------------------------------------------------
+
+    def _append(self, key: str, model_type: str, data: Optional[Dict[str, Any]]) -> JournalEntry:
+        with self._lock:
+            entry = JournalEntry(self._next_seq, self._clock(), key, model_type, data)
+            self._journal_file.write(entry.to_line())
+            self._journal_file.flush()
+            if self.durable:
+                os.fsync(self._journal_file.fileno())
+            self._apply(entry)
+            self._appends_since_compaction += 1
+            if self.compact_every and self._appends_since_compaction >= self.compact_every:
+                self.compact()
+            return entry
+
+    # --- ModelStore interface ------------------------------------------------
+
+    def load_model(self, model_class: Type[ModelType], key: str) -> ModelType:
+        with self._lock:
+            entry = self._latest.get(_normalize_key(key))
+        if entry is None or entry.deleted:
+            raise FileNotFoundError(f"No record stored under key '{key}'.")
+        return model_class.model_validate(entry.data)
+
+    def save_model(self, model_instance: ModelType, key: str) -> None:
+        self._append(
+            _normalize_key(key),
+            type(model_instance).__name__,
+            model_instance.model_dump(mode="json"),
+        )
+
+    def delete_model(self, key: str) -> bool:
+        """Append a tombstone for key. Returns False if it was not live."""
+        normalized_key = _normalize_key(key)
+        with self._lock:
+            entry = self._latest.get(normalized_key)
+            if entry is None or entry.deleted:
+                return False
+            self._append(normalized_key, entry.model_type, None)
+        return True
+
+    def model_version(self, key: str) -> Optional[str]:
+        """Sequence number of the latest entry for key, or None if not live."""
+        with self._lock:
+            entry = self._latest.get(_normalize_key(key))
+        if entry is None or entry.deleted:
+            return None
+        return str(entry.seq)
+
+    def keys(self, prefix: str = "") -> List[str]:
+        """Live keys, optionally limited to a prefix such as 'motor-reloads/'."""
+        with self._lock:
+            return sorted(
+                key
+                for key, entry in self._latest.items()
+                if not entry.deleted and key.startswith(prefix)
+            )
+
+    # --- history -------------------------------------------------------------
+
+    def _archive_paths(self) -> List[Path]:
+        """Archived journals, newest first."""
+        return sorted(
+            self.journal_path.parent.glob(f"{self.journal_path.stem}.*.archive.jsonl"),
+            reverse=True,
+        )
+
+    def history(self, key: str) -> List[JournalEntry]:
+        """Every retained version of key, oldest first (archives included)."""
+        normalized_key = _normalize_key(key)
+        entries: List[JournalEntry] = []
+        for archive_path in reversed(self._archive_paths()):
+            entries.extend(
+                entry for entry in _read_entries(archive_path) if entry.key == normalized_key
+            )
+        with self._lock:
+            snapshot_entry = self._snapshot_entries.get(normalized_key)
+            if snapshot_entry is not None and all(
+                entry.seq != snapshot_entry.seq for entry in entries
+            ):
+                entries.append(snapshot_entry)
+            entries.extend(self._journal_history.get(normalized_key, []))
+        return entries
+
+    def load_model_at(
+        self,
+        model_class: Type[ModelType],
+        key: str,
+        at: Optional[float] = None,
+        seq: Optional[int] = None,
+    ) -> ModelType:
+        """
+        Load the version of key that was current at timestamp 'at' (or at
+        sequence number 'seq'). Raises FileNotFoundError if the key did not
+        exist then, was deleted, or its history was compacted away.
+        """
+        if (at is None) == (seq is None):
+            raise ValueError("Pass exactly one of 'at' or 'seq'.")
+
+        def is_visible(entry: JournalEntry) -> bool:
+            return entry.seq <= seq if seq is not None else entry.timestamp <= at  # type: ignore[operator]
+
+        normalized_key = _normalize_key(key)
+        found: Optional[JournalEntry] = None
+        with self._lock:
+            for entry in reversed(self._journal_history.get(normalized_key, [])):
+                if is_visible(entry):
+                    found = entry
+                    break
+            snapshot_entry = self._snapshot_entries.get(normalized_key)
+        if found is None and snapshot_entry is not None and is_visible(snapshot_entry):
+            found = snapshot_entry
+        if found is None:
+            for archive_path in self._archive_paths():
+                candidates = [
+                    entry
+                    for entry in _read_entries(archive_path)
+                    if entry.key == normalized_key and is_visible(entry)
+                ]
+                if candidates:
+                    found = candidates[-1]
+                    break
+        if found is None or found.deleted:
+            raise FileNotFoundError(f"No version of '{key}' at the requested point in time.")
+        return model_class.model_validate(found.data)
+
+    # --- compaction ----------------------------------------------------------
+
+    def compact(self) -> None:
+        """
+        Fold the journal into a new snapshot and start an empty journal.
+
+        The snapshot is written to a temp file and renamed into place before
+        the journal is rotated, so a crash at any point loses nothing.
+        """
+        with self._lock:
+            last_seq = self._next_seq - 1
+            live_entries = [
+                entry for _key, entry in sorted(self._latest.items()) if not entry.deleted
+            ]
+            temp_path = self.snapshot_path.with_name(self.snapshot_path.name + ".tmp")
+            with temp_path.open("w", encoding="utf-8") as output_file:
+                output_file.write(
+                    json.dumps(
+                        {
+                            "format": SNAPSHOT_FORMAT,
+                            "version": SNAPSHOT_VERSION,
+                            "last_seq": last_seq,
+                            "compacted_at": self._clock(),
+                            "record_count": len(live_entries),
+                        },
+                        separators=(",", ":"),
+                    )
+                    + "\n"
+                )
+                for entry in live_entries:
+                    output_file.write(entry.to_line())
+                output_file.flush()
+                if self.durable:
+                    os.fsync(output_file.fileno())
+            os.replace(temp_path, self.snapshot_path)
+
+            self._journal_file.close()
+            first_seq = self._snapshot_seq + 1
+            if self.keep_archives and last_seq >= first_seq and self.journal_path.exists():
+                archive_path = self.journal_path.with_name(
+                    f"{self.journal_path.stem}.{first_seq:010d}-{last_seq:010d}.archive.jsonl"
+                )
+                os.replace(self.journal_path, archive_path)
+            self._journal_file = self.journal_path.open("w", encoding="utf-8")
+
+            self._snapshot_seq = last_seq
+            self._snapshot_entries = {entry.key: entry for entry in live_entries}
+            self._latest = dict(self._snapshot_entries)
+            self._journal_history = {}
+            self._appends_since_compaction = 0
@@ -5,6 +5,7 @@ Models for individual rocket motor hardware parts:
 - CasePart
 - ClosurePart
 - NozzlePart
+- MotorPart / MotorPartRecord: part_type-discriminated union of the above
 
 These classes describe single physical items and do NOT know where data lives
 (S3, disk, etc.). Persistence and loading logic should go into a separate
@@ -16,9 +17,9 @@ Depends on:
 
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Annotated, Any, List, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Discriminator, Field, RootModel, Tag
 
 from motor_common_v1 import (
     Ecosystem,
@@ -266,3 +267,45 @@ class NozzlePart(MotorPartBase):
         description="Any O-rings associated with this nozzle or its shoulder.",
     )
 
+
+# ---------------------------------------------------------------------------
+# Discriminated union over part_type
+# ---------------------------------------------------------------------------
+
+
+def _part_type_tag(value: Any) -> str:
+    """
+    Pick the union member for raw JSON data or an existing part instance.
+
+    Missing or unrecognized part_type values fall back to MotorPartBase.
+    """
+    if isinstance(value, dict):
+        part_type = value.get("part_type", PartType.OTHER.value)
+    else:
+        part_type = getattr(value, "part_type", PartType.OTHER)
+    if isinstance(part_type, PartType):
+        part_type = part_type.value
+    if part_type in (PartType.CASE.value, PartType.CLOSURE.value, PartType.NOZZLE.value):
+        return part_type
+    return PartType.OTHER.value
+
+
+MotorPart = Annotated[
+    Union[
+        Annotated[CasePart, Tag(PartType.CASE.value)],
+        Annotated[ClosurePart, Tag(PartType.CLOSURE.value)],
+        Annotated[NozzlePart, Tag(PartType.NOZZLE.value)],
+        Annotated[MotorPartBase, Tag(PartType.OTHER.value)],
+    ],
+    Discriminator(_part_type_tag),
+]
+
+
+class MotorPartRecord(RootModel[MotorPart]):
+    """
+    Wrapper that validates any part JSON into its concrete subclass in one
+    pass, dispatching on part_type.
+
+    Being a regular Pydantic model, it works with every ModelStore:
+        part = store.load_model(MotorPartRecord, key).root
+    """
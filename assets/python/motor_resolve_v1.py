@@ -0,0 +1,281 @@
+"""
+motor_resolve_v1.py
+
+Lazily resolved views over motor records.
+
+MotorAssembly.parts only holds AssemblyPartRef(role, part_id), and
+MotorReload refers to its assembly and casting supplies by ID. Instead of
+every consumer resolving those strings through separate store calls, a
+ResolutionSession hands out views that fetch referenced records on first
+access and memoize them for the rest of the session:
+
+    session = ResolutionSession(store)
+    resolved = session.resolve_reload("motor_reload_magenta_red_54mm_amw_long_v1")
+    case = resolved.assembly.part_for_role(PartRole.CASE)
+    liner = resolved.liner_supply
+
+Shared parts are loaded once per session no matter how many assemblies use
+them, and prefetch_reloads()/prefetch_assemblies() load a whole batch of
+references up front (through store.load_many when the backend has it, or a
+thread pool otherwise) to avoid N+1 loading.
+
+Depends on:
+    motor_store_v1.py
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, RootModel
+
+from motor_common_v1 import PartRole
+from motor_parts_v1 import MotorPartBase, MotorPartRecord
+from motor_assemblies_v1 import AssemblyPartRef, MotorAssembly
+from motor_casting_supplies_v1 import CastingSupply
+from motor_reloads_v1 import MotorReload
+from motor_store_v1 import (
+    ModelStore,
+    assembly_key,
+    casting_supply_key,
+    parts_key,
+    reload_key,
+)
+
+
+DEFAULT_PREFETCH_WORKERS = 8
+
+# kind -> (model class used for loading, record ID -> store key)
+RECORD_KINDS: Dict[str, Tuple[Type[BaseModel], Callable[[str], str]]] = {
+    "part": (MotorPartRecord, parts_key),
+    "assembly": (MotorAssembly, assembly_key),
+    "casting_supply": (CastingSupply, casting_supply_key),
+    "reload": (MotorReload, reload_key),
+}
+
+
+# ---------------------------------------------------------------------------
+# Session
+# ---------------------------------------------------------------------------
+
+
+class ResolutionSession:
+    """
+    Per-session memo of loaded records plus factories for resolved views.
+
+    A session is meant to be short-lived (one request, one report, one CLI
+    run); it never re-checks the store for changes once a record is loaded.
+    """
+
+    def __init__(
+        self,
+        store: ModelStore,
+        prefetch_workers: int = DEFAULT_PREFETCH_WORKERS,
+    ) -> None:
+        self.store = store
+        self.prefetch_workers = max(1, prefetch_workers)
+        self._records: Dict[Tuple[str, str], BaseModel] = {}
+        self._lock = threading.Lock()
+        self.load_count = 0
+
+    # --- single record access ------------------------------------------------
+
+    def _remember(self, kind: str, record_id: str, record: BaseModel) -> BaseModel:
+        if isinstance(record, RootModel):
+            record = record.root
+        with self._lock:
+            self._records[(kind, record_id)] = record
+        return record
+
+    def _get(self, kind: str, record_id: str) -> BaseModel:
+        with self._lock:
+            cached = self._records.get((kind, record_id))
+        if cached is not None:
+            return cached
+        model_class, key_for = RECORD_KINDS[kind]
+        record = self.store.load_model(model_class, key_for(record_id))
+        with self._lock:
+            self.load_count += 1
+        return self._remember(kind, record_id, record)
+
+    def part(self, part_id: str) -> MotorPartBase:
+        return self._get("part", part_id)  # type: ignore[return-value]
+
+    def assembly(self, assembly_id: str) -> MotorAssembly:
+        return self._get("assembly", assembly_id)  # type: ignore[return-value]
+
+    def casting_supply(self, casting_supply_id: str) -> CastingSupply:
+        return self._get("casting_supply", casting_supply_id)  # type: ignore[return-value]
+
+    def reload(self, motor_reload_id: str) -> MotorReload:
+        return self._get("reload", motor_reload_id)  # type: ignore[return-value]
+
+    # --- batch prefetch ------------------------------------------------------
+
+    def _prefetch(self, kind: str, record_ids: Iterable[str]) -> None:
+        """
+        Load every not-yet-memoized ID of one kind in a single batch.
+
+        Prefetch is best-effort: records that fail to load are skipped here
+        and raise normally when they are accessed.
+        """
+        with self._lock:
+            pending_ids = [
+                record_id
+                for record_id in dict.fromkeys(record_ids)
+                if (kind, record_id) not in self._records
+            ]
+        if not pending_ids:
+            return
+
+        model_class, key_for = RECORD_KINDS[kind]
+        keys = [key_for(record_id) for record_id in pending_ids]
+
+        load_many = getattr(self.store, "load_many", None)
+        if load_many is not None:
+            try:
+                loaded = load_many(model_class, keys)
+            except Exception:
+                loaded = None
+            if loaded is not None:
+                for record_id, key in zip(pending_ids, keys):
+                    if key in loaded:
+                        self._remember(kind, record_id, loaded[key])
+                with self._lock:
+                    self.load_count += len(loaded)
+                return
+
+        def load_one(key: str) -> Optional[BaseModel]:
+            try:
+                return self.store.load_model(model_class, key)
+            except Exception:
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.prefetch_workers) as executor:
+            results = list(executor.map(load_one, keys))
+        for record_id, record in zip(pending_ids, results):
+            if record is not None:
+                self._remember(kind, record_id, record)
+                with self._lock:
+                    self.load_count += 1
+
+    def prefetch_assemblies(self, assembly_ids: Iterable[str]) -> None:
+        """Load assemblies and then every part they reference, in two batches."""
+        assembly_ids = list(assembly_ids)
+        self._prefetch("assembly", assembly_ids)
+        with self._lock:
+            assemblies = [
+                self._records[("assembly", assembly_id)]
+                for assembly_id in assembly_ids
+                if ("assembly", assembly_id) in self._records
+            ]
+        self._prefetch(
+            "part",
+            (
+                part_ref.part_id
+                for assembly in assemblies
+                for part_ref in assembly.parts  # type: ignore[attr-defined]
+            ),
+        )
+
+    def prefetch_reloads(self, motor_reload_ids: Iterable[str]) -> None:
+        """Load reloads, then their assemblies, supplies and parts, batch by batch."""
+        motor_reload_ids = list(motor_reload_ids)
+        self._prefetch("reload", motor_reload_ids)
+        with self._lock:
+            reloads: List[MotorReload] = [
+                self._records[("reload", motor_reload_id)]  # type: ignore[misc]
+                for motor_reload_id in motor_reload_ids
+                if ("reload", motor_reload_id) in self._records
+            ]
+        self._prefetch(
+            "casting_supply",
+            (
+                supply_id
+                for motor_reload in reloads
+                for supply_id in (
+                    motor_reload.liner.casting_supply_id,
+                    motor_reload.casting_tubes.casting_supply_id,
+                )
+            ),
+        )
+        self.prefetch_assemblies(motor_reload.assembly_id for motor_reload in reloads)
+
+    # --- resolved views ------------------------------------------------------
+
+    def resolve_assembly(self, assembly_id: str) -> "ResolvedAssembly":
+        return ResolvedAssembly(self, self.assembly(assembly_id))
+
+    def resolve_reload(self, motor_reload_id: str) -> "ResolvedReload":
+        return ResolvedReload(self, self.reload(motor_reload_id))
+
+
+# ---------------------------------------------------------------------------
+# Resolved views
+# ---------------------------------------------------------------------------
+
+
+class ResolvedAssembly:
+    """
+    A MotorAssembly whose part references resolve to part records on demand.
+
+    The first access to parts prefetches every referenced part in one batch.
+    """
+
+    def __init__(self, session: ResolutionSession, assembly: MotorAssembly) -> None:
+        self.session = session
+        self.assembly = assembly
+
+    @property
+    def assembly_id(self) -> str:
+        return self.assembly.assembly_id
+
+    @cached_property
+    def parts(self) -> List[Tuple[AssemblyPartRef, MotorPartBase]]:
+        """(reference, part) pairs in assembly order."""
+        self.session._prefetch(
+            "part", (part_ref.part_id for part_ref in self.assembly.parts)
+        )
+        return [
+            (part_ref, self.session.part(part_ref.part_id))
+            for part_ref in self.assembly.parts
+        ]
+
+    def part_for_role(self, role: PartRole) -> Optional[MotorPartBase]:
+        """The first part filling role, or None if the assembly has none."""
+        for part_ref, part in self.parts:
+            if part_ref.role == role:
+                return part
+        return None
+
+    def parts_for_role(self, role: PartRole) -> List[MotorPartBase]:
+        return [part for part_ref, part in self.parts if part_ref.role == role]
+
+
+class ResolvedReload:
+    """A MotorReload whose assembly and casting supply references resolve on demand."""
+
+    def __init__(self, session: ResolutionSession, motor_reload: MotorReload) -> None:
+        self.session = session
+        self.motor_reload = motor_reload
+
+    @property
+    def motor_reload_id(self) -> str:
+        return self.motor_reload.motor_reload_id
+
+    @cached_property
+    def assembly(self) -> ResolvedAssembly:
+        return self.session.resolve_assembly(self.motor_reload.assembly_id)
+
+    @cached_property
+    def liner_supply(self) -> CastingSupply:
+        return self.session.casting_supply(self.motor_reload.liner.casting_supply_id)
+
+    @cached_property
+    def casting_tube_supply(self) -> CastingSupply:
+        return self.session.casting_supply(
+            self.motor_reload.casting_tubes.casting_supply_id
+        )
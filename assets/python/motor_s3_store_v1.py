@@ -0,0 +1,417 @@
+"""
+motor_s3_store_v1.py
+
+S3-backed implementation of the ModelStore interface from motor_store_v1.py,
+so motor data can live in the same directory bucket the profile Lambdas use.
+
+This module defines:
+    - S3JsonStore: load_model/save_model plus concurrent load_many/save_many,
+      ETag conditional gets and retry with exponential backoff
+    - LocalFakeS3Client: a filesystem-backed stand-in for the boto3 S3 client
+      (get_object/put_object/head_object only), for tests and offline work
+
+boto3 is optional: it is only needed when S3JsonStore creates its own
+client. Passing client=LocalFakeS3Client(...) works without it.
+
+Example:
+    store = S3JsonStore("rocket-geek-user-data--use1-az6--x-s3")
+    assembly = load_motor_assembly(store, "assembly_54mm_amw_long_snapring_v1")
+
+    offline_store = S3JsonStore(
+        "motor-bucket", client=LocalFakeS3Client(Path("/tmp/fake-s3"))
+    )
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import random
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+try:
+    import boto3
+    from botocore.config import Config as BotocoreConfig
+    from botocore.exceptions import ConnectionError as BotocoreConnectionError
+    from botocore.exceptions import HTTPClientError as BotocoreHTTPClientError
+except ImportError:  # pragma: no cover - depends on the environment
+    boto3 = None
+    BotocoreConfig = None
+    BotocoreConnectionError = None
+    BotocoreHTTPClientError = None
+
+# Connection resets and timeouts from the HTTP layer. botocore's transport
+# errors (EndpointConnectionError, ConnectionClosedError, ReadTimeoutError,
+# ...) do not derive from the builtin ConnectionError/TimeoutError.
+TRANSPORT_ERROR_TYPES: Tuple[type, ...] = tuple(
+    error_type
+    for error_type in (
+        ConnectionError,
+        TimeoutError,
+        BotocoreConnectionError,
+        BotocoreHTTPClientError,
+    )
+    if error_type is not None
+)
+
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+ResultType = TypeVar("ResultType")
+
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+DEFAULT_KEY_PREFIX = "motor-data/"
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_BASE_BACKOFF_SECONDS = 0.1
+DEFAULT_MAX_BACKOFF_SECONDS = 5.0
+DEFAULT_MAX_CACHED_BODIES = 1024
+
+RETRYABLE_ERROR_CODES = {
+    "InternalError",
+    "RequestTimeout",
+    "RequestTimeTooSkewed",
+    "ServiceUnavailable",
+    "SlowDown",
+    "Throttling",
+    "ThrottlingException",
+}
+NOT_FOUND_ERROR_CODES = {"404", "NoSuchKey", "NotFound"}
+NOT_MODIFIED_ERROR_CODES = {"304", "NotModified"}
+
+
+# ---------------------------------------------------------------------------
+# Error helpers
+# ---------------------------------------------------------------------------
+
+
+def _error_details(error: Exception) -> Tuple[str, int]:
+    """
+    Return (error code, HTTP status) for botocore ClientError-shaped errors.
+
+    Works for both botocore's ClientError and FakeS3ClientError, which share
+    the same 'response' dictionary layout.
+    """
+    response = getattr(error, "response", None) or {}
+    error_code = str(response.get("Error", {}).get("Code", ""))
+    status_code = int(response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0) or 0)
+    return error_code, status_code
+
+
+def _is_retryable(error: Exception) -> bool:
+    error_code, status_code = _error_details(error)
+    if error_code in RETRYABLE_ERROR_CODES or status_code >= 500:
+        return True
+    return isinstance(error, TRANSPORT_ERROR_TYPES)
+
+
+# ---------------------------------------------------------------------------
+# S3 store
+# ---------------------------------------------------------------------------
+
+
+class S3JsonStore:
+    """
+    ModelStore implementation backed by S3 (including directory buckets).
+
+    Keys are mapped like LocalJsonFileStore: '.json' is appended when missing
+    and key_prefix is prepended, so 'motor-parts/case_x' becomes
+    'motor-data/motor-parts/case_x.json'.
+
+    A single client is shared by every call. Its connection pool is sized to
+    max_workers so load_many/save_many threads do not queue for sockets.
+    Bodies fetched with load_model are remembered with their ETag; later loads
+    send If-None-Match and reuse the remembered body on 304 Not Modified.
+    At most max_cached_bodies bodies are kept, least recently used first out.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        key_prefix: str = DEFAULT_KEY_PREFIX,
+        client: Any = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        base_backoff_seconds: float = DEFAULT_BASE_BACKOFF_SECONDS,
+        max_backoff_seconds: float = DEFAULT_MAX_BACKOFF_SECONDS,
+        sleep: Callable[[float], None] = time.sleep,
+        max_cached_bodies: int = DEFAULT_MAX_CACHED_BODIES,
+    ) -> None:
+        self.bucket = bucket
+        self.key_prefix = key_prefix
+        self.max_workers = max(1, max_workers)
+        self.max_attempts = max(1, max_attempts)
+        self.base_backoff_seconds = base_backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.max_cached_bodies = max(0, max_cached_bodies)
+        self._sleep = sleep
+
+        if client is None:
+            if boto3 is None:
+                raise RuntimeError(
+                    "boto3 is not installed. Install it or pass client=..."
+                )
+            # Retries are handled here so load_many/save_many share one policy.
+            client = boto3.client(
+                "s3",
+                config=BotocoreConfig(
+                    max_pool_connections=self.max_workers,
+                    retries={"max_attempts": 1, "mode": "standard"},
+                ),
+            )
+        self.client = client
+
+        # object key -> (ETag, body text) from the last successful get, LRU.
+        self._body_cache: "OrderedDict[str, Tuple[str, str]]" = OrderedDict()
+        self._body_cache_lock = threading.Lock()
+
+    # --- key mapping ---------------------------------------------------------
+
+    def _object_key(self, key: str) -> str:
+        normalized_key = key if key.endswith(".json") else f"{key}.json"
+        return f"{self.key_prefix}{normalized_key}"
+
+    # --- retry ---------------------------------------------------------------
+
+    def _with_retries(self, operation: Callable[[], ResultType]) -> ResultType:
+        """Run operation, retrying transient errors with full-jitter backoff."""
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return operation()
+            except Exception as error:
+                if attempt >= self.max_attempts or not _is_retryable(error):
+                    raise
+                backoff_ceiling = min(
+                    self.max_backoff_seconds,
+                    self.base_backoff_seconds * (2 ** (attempt - 1)),
+                )
+                self._sleep(random.uniform(0, backoff_ceiling))
+
+    # --- raw object access ---------------------------------------------------
+
+    def _remember_body(self, object_key: str, etag: str, body_text: str) -> None:
+        """Cache (etag, body) for object_key. Caller holds _body_cache_lock."""
+        if not self.max_cached_bodies:
+            return
+        self._body_cache[object_key] = (etag, body_text)
+        self._body_cache.move_to_end(object_key)
+        while len(self._body_cache) > self.max_cached_bodies:
+            self._body_cache.popitem(last=False)
+
+    def _get_text(self, object_key: str) -> str:
+        with self._body_cache_lock:
+            cached = self._body_cache.get(object_key)
+            if cached is not None:
+                self._body_cache.move_to_end(object_key)
+
+        request: Dict[str, Any] = {"Bucket": self.bucket, "Key": object_key}
+        if cached is not None:
+            request["IfNoneMatch"] = cached[0]
+
+        def fetch() -> Optional[Tuple[str, str]]:
+            try:
+                response = self.client.get_object(**request)
+            except Exception as error:
+                error_code, status_code = _error_details(error)
+                if cached is not None and (
+                    error_code in NOT_MODIFIED_ERROR_CODES or status_code == 304
+                ):
+                    return None
+                if error_code in NOT_FOUND_ERROR_CODES:
+                    raise FileNotFoundError(
+                        f"s3://{self.bucket}/{object_key} does not exist."
+                    ) from error
+                raise
+            body_text = response["Body"].read().decode("utf-8")
+            return response.get("ETag", ""), body_text
+
+        fetched = self._with_retries(fetch)
+        if fetched is None and cached is not None:
+            return cached[1]
+        etag, body_text = fetched  # type: ignore[misc]
+        if etag:
+            with self._body_cache_lock:
+                self._remember_body(object_key, etag, body_text)
+        return body_text
+
+    def _put_text(self, object_key: str, body_text: str) -> None:
+        def put() -> Dict[str, Any]:
+            return self.client.put_object(
+                Bucket=self.bucket,
+                Key=object_key,
+                Body=body_text.encode("utf-8"),
+                ContentType="application/json",
+            )
+
+        response = self._with_retries(put)
+        etag = response.get("ETag", "") if isinstance(response, dict) else ""
+        with self._body_cache_lock:
+            if etag:
+                self._remember_body(object_key, etag, body_text)
+            else:
+                self._body_cache.pop(object_key, None)
+
+    # --- ModelStore interface ------------------------------------------------
+
+    def load_model(self, model_class: Type[ModelType], key: str) -> ModelType:
+        return model_class.model_validate_json(self._get_text(self._object_key(key)))
+
+    def save_model(self, model_instance: ModelType, key: str) -> None:
+        self._put_text(self._object_key(key), model_instance.model_dump_json(indent=2))
+
+    def model_version(self, key: str) -> Optional[str]:
+        """Current ETag for key (via HEAD), or None if the object is missing."""
+        object_key = self._object_key(key)
+
+        def head() -> Optional[str]:
+            try:
+                response = self.client.head_object(Bucket=self.bucket, Key=object_key)
+            except Exception as error:
+                if _error_details(error)[0] in NOT_FOUND_ERROR_CODES:
+                    return None
+                raise
+            return response.get("ETag")
+
+        return self._with_retries(head)
+
+    # --- batch operations ----------------------------------------------------
+
+    def load_many(
+        self,
+        model_class: Type[ModelType],
+        keys: Iterable[str],
+    ) -> Dict[str, ModelType]:
+        """
+        Load several records of one model class concurrently.
+
+        Returns {key: model}. The first failure is raised after all requests
+        have finished.
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            models = list(
+                executor.map(lambda key: self.load_model(model_class, key), unique_keys)
+            )
+        return dict(zip(unique_keys, models))
+
+    def save_many(self, items: Iterable[Tuple[BaseModel, str]]) -> None:
+        """Save (model_instance, key) pairs concurrently. A repeated key's last pair wins."""
+        # Keyed by object key so duplicates are never uploaded concurrently.
+        latest_by_object_key: Dict[str, Tuple[BaseModel, str]] = {}
+        for model_instance, key in items:
+            latest_by_object_key[self._object_key(key)] = (model_instance, key)
+        pending_items = list(latest_by_object_key.values())
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(
+                executor.map(
+                    lambda item: self.save_model(item[0], item[1]),
+                    pending_items,
+                )
+            )
+
+
+# ---------------------------------------------------------------------------
+# Filesystem-backed fake S3 client
+# ---------------------------------------------------------------------------
+
+
+class FakeS3ClientError(Exception):
+    """Mimics botocore.exceptions.ClientError closely enough for S3JsonStore."""
+
+    def __init__(self, error_code: str, status_code: int, operation_name: str) -> None:
+        super().__init__(f"{operation_name}: {error_code} ({status_code})")
+        self.response = {
+            "Error": {"Code": error_code, "Message": error_code},
+            "ResponseMetadata": {"HTTPStatusCode": status_code},
+        }
+
+
+class LocalFakeS3Client:
+    """
+    Stand-in for a boto3 S3 client that stores objects as files under
+    root_directory/<bucket>/<key>.
+
+    Set pending_failures to make the next N calls fail with a retryable
+    503 SlowDown, to exercise retry handling. request_count counts every call.
+    """
+
+    def __init__(self, root_directory: Path) -> None:
+        self.root_directory = root_directory
+        self.pending_failures = 0
+        self.request_count = 0
+        self._lock = threading.Lock()
+
+    def _path_for(self, bucket: str, key: str) -> Path:
+        return self.root_directory / bucket / key
+
+    def _begin_request(self, operation_name: str) -> None:
+        with self._lock:
+            self.request_count += 1
+            if self.pending_failures > 0:
+                self.pending_failures -= 1
+                raise FakeS3ClientError("SlowDown", 503, operation_name)
+
+    @staticmethod
+    def _etag_for(data: bytes) -> str:
+        return f'"{hashlib.md5(data).hexdigest()}"'
+
+    def get_object(self, Bucket: str, Key: str, IfNoneMatch: Optional[str] = None) -> Dict[str, Any]:
+        self._begin_request("GetObject")
+        try:
+            data = self._path_for(Bucket, Key).read_bytes()
+        except FileNotFoundError:
+            raise FakeS3ClientError("NoSuchKey", 404, "GetObject") from None
+        etag = self._etag_for(data)
+        if IfNoneMatch is not None and IfNoneMatch == etag:
+            raise FakeS3ClientError("304", 304, "GetObject")
+        return {"Body": io.BytesIO(data), "ETag": etag, "ContentLength": len(data)}
+
+    def head_object(self, Bucket: str, Key: str) -> Dict[str, Any]:
+        self._begin_request("HeadObject")
+        try:
+            data = self._path_for(Bucket, Key).read_bytes()
+        except FileNotFoundError:
+            raise FakeS3ClientError("404", 404, "HeadObject") from None
+        return {"ETag": self._etag_for(data), "ContentLength": len(data)}
+
+    def put_object(
+        self,
+        Bucket: str,
+        Key: str,
+        Body: bytes,
+        ContentType: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        self._begin_request("PutObject")
+        target_path = self._path_for(Bucket, Key)
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temp_name = tempfile.mkstemp(dir=target_path.parent)
+        with os.fdopen(file_descriptor, "wb") as output_file:
+            output_file.write(Body)
+        os.replace(temp_name, target_path)
+        return {"ETag": self._etag_for(Body)}
+
+    def list_keys(self, Bucket: str, Prefix: str = "") -> List[str]:
+        """Convenience for tests: every key in Bucket starting with Prefix."""
+        bucket_directory = self.root_directory / Bucket
+        if not bucket_directory.is_dir():
+            return []
+        keys = (
+            file_path.relative_to(bucket_directory).as_posix()
+            for file_path in bucket_directory.rglob("*")
+            if file_path.is_file()
+        )
+        return sorted(key for key in keys if key.startswith(Prefix))
@@ -0,0 +1,328 @@
+"""
+motor_simulation_cache_v1.py
+
+Memoized performance estimates for motor_ballistics_v1.
+
+Page builds, reports and overlapping sweeps keep asking for the same
+reload's performance. SimulationCache answers repeats without simulating:
+    - results are keyed by a canonical SHA-256 hash of exactly the inputs
+      that affect the simulation (grain OD/core/length/count, throat
+      diameter, expansion ratio, every propellant property, web steps) and
+      the solver version
+    - an in-memory LRU tier serves repeats within a process
+    - an optional on-disk tier (any ModelStore; LocalJsonFileStore by
+      default through in_directory) serves repeats across processes
+
+Cache keys and disk paths both include SOLVER_VERSION, so results from an
+older solver are never returned. in_directory() also deletes entries left
+behind by other solver versions.
+
+Example:
+    cache = SimulationCache.in_directory(Path(".cache/motor-simulations"))
+    estimates = cache.estimate(reload.grain_geometry, nozzle, propellant)
+    print(cache.stats())
+
+Depends on:
+    motor_ballistics_v1.py
+    motor_common_v1.py
+    motor_reloads_v1.py
+    motor_store_v1.py
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import shutil
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel, Field, ValidationError
+
+from motor_ballistics_v1 import (
+    DEFAULT_WEB_STEPS,
+    SOLVER_VERSION,
+    PropellantProperties,
+    simulate_bates_batch,
+)
+from motor_common_v1 import NozzleGeometry
+from motor_reloads_v1 import GrainGeometry, MotorReload, PerformanceEstimates
+from motor_store_v1 import LocalJsonFileStore, ModelStore
+
+
+SIMULATION_CACHE_PREFIX = "simulation-cache"
+DEFAULT_MAX_ENTRIES = 4096
+
+# Every propellant property except its ID changes the result.
+PROPELLANT_HASH_FIELDS = tuple(
+    name for name in PropellantProperties.model_fields if name != "propellant_id"
+)
+
+
+# ---------------------------------------------------------------------------
+# Cache keys and records
+# ---------------------------------------------------------------------------
+
+
+def _canonical_number(value: float) -> float:
+    """Round away float noise so 3.25 and 3.2500000000000004 share a key."""
+    return float(format(float(value), ".12g"))
+
+
+def simulation_cache_key(
+    grain_geometry: GrainGeometry,
+    nozzle_geometry: NozzleGeometry,
+    propellant: PropellantProperties,
+    steps: int = DEFAULT_WEB_STEPS,
+    solver_version: str = SOLVER_VERSION,
+) -> str:
+    """
+    Hex SHA-256 of the simulation inputs.
+
+    Display-only fields (millimeter copies, web thickness, propellant_id,
+    expansion profile) are left out so they do not split the cache.
+    """
+    canonical = {
+        "solver_version": solver_version,
+        "steps": int(steps),
+        "grain": [
+            _canonical_number(grain_geometry.grain_outer_diameter_inch),
+            _canonical_number(grain_geometry.grain_core_diameter_inch),
+            _canonical_number(grain_geometry.grain_length_inch),
+            _canonical_number(grain_geometry.grain_count),
+        ],
+        "nozzle": [
+            _canonical_number(nozzle_geometry.throat_diameter_inch),
+            _canonical_number(nozzle_geometry.expansion_ratio),
+        ],
+        "propellant": {
+            name: _canonical_number(getattr(propellant, name))
+            for name in PROPELLANT_HASH_FIELDS
+        },
+    }
+    canonical_text = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical_text.encode("utf-8")).hexdigest()
+
+
+class SimulationRecord(BaseModel):
+    """One cached simulation result."""
+
+    cache_key: str = Field(..., description="simulation_cache_key of the inputs.")
+    solver_version: str = Field(..., description="SOLVER_VERSION that produced it.")
+    performance_estimates: PerformanceEstimates = Field(
+        ...,
+        description="Estimates as returned by estimate_performance.",
+    )
+    burn_time_seconds: float = Field(..., description="Burn time in seconds.")
+    propellant_mass_grams: float = Field(..., description="Propellant mass in grams.")
+
+
+def prune_stale_versions(cache_directory: Path, solver_version: str = SOLVER_VERSION) -> int:
+    """Delete on-disk entries written by other solver versions. Returns directories removed."""
+    versions_directory = cache_directory / SIMULATION_CACHE_PREFIX
+    if not versions_directory.is_dir():
+        return 0
+    removed = 0
+    for version_directory in versions_directory.iterdir():
+        if version_directory.is_dir() and version_directory.name != solver_version:
+            shutil.rmtree(version_directory, ignore_errors=True)
+            removed += 1
+    return removed
+
+
+# ---------------------------------------------------------------------------
+# Two-tier cache
+# ---------------------------------------------------------------------------
+
+
+class SimulationCache:
+    """
+    LRU memory tier in front of an optional ModelStore disk tier.
+
+    Returned PerformanceEstimates are shared between callers; treat them as
+    read-only or call model_copy() before mutating.
+    """
+
+    def __init__(
+        self,
+        store: Optional[ModelStore] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        solver_version: str = SOLVER_VERSION,
+        steps: int = DEFAULT_WEB_STEPS,
+    ) -> None:
+        self.store = store
+        self.max_entries = max_entries
+        self.solver_version = solver_version
+        self.steps = steps
+        self._entries: "OrderedDict[str, SimulationRecord]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def in_directory(
+        cls,
+        cache_directory: Path,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        solver_version: str = SOLVER_VERSION,
+        steps: int = DEFAULT_WEB_STEPS,
+    ) -> "SimulationCache":
+        """Cache with a compact LocalJsonFileStore disk tier under cache_directory."""
+        prune_stale_versions(cache_directory, solver_version)
+        store = LocalJsonFileStore(cache_directory, compact=True, durable=False)
+        return cls(store, max_entries, solver_version, steps)
+
+    def _disk_key(self, cache_key: str) -> str:
+        return f"{SIMULATION_CACHE_PREFIX}/{self.solver_version}/{cache_key[:2]}/{cache_key}"
+
+    def _remember(self, record: SimulationRecord) -> None:
+        self._entries[record.cache_key] = record
+        self._entries.move_to_end(record.cache_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def key_for(
+        self,
+        grain_geometry: GrainGeometry,
+        nozzle_geometry: NozzleGeometry,
+        propellant: PropellantProperties,
+    ) -> str:
+        return simulation_cache_key(
+            grain_geometry, nozzle_geometry, propellant, self.steps, self.solver_version
+        )
+
+    def get(self, cache_key: str) -> Optional[SimulationRecord]:
+        """
+        Cached record for cache_key from memory or disk, or None.
+
+        A truncated or corrupt disk entry (possible after a crash, since the
+        disk tier is not fsynced) counts as a miss; the next put overwrites it.
+        """
+        with self._lock:
+            record = self._entries.get(cache_key)
+            if record is not None:
+                self._entries.move_to_end(cache_key)
+                self.memory_hits += 1
+                return record
+
+        if self.store is not None:
+            try:
+                record = self.store.load_model(SimulationRecord, self._disk_key(cache_key))
+            except (FileNotFoundError, ValueError, ValidationError):
+                record = None
+            if record is not None and record.solver_version == self.solver_version:
+                with self._lock:
+                    self._remember(record)
+                    self.disk_hits += 1
+                return record
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put_many(self, records: Sequence[SimulationRecord]) -> None:
+        """Add records to both tiers (save_many on the store when it has one)."""
+        with self._lock:
+            for record in records:
+                self._remember(record)
+        if self.store is None or not records:
+            return
+        items = [(record, self._disk_key(record.cache_key)) for record in records]
+        save_many = getattr(self.store, "save_many", None)
+        if save_many is not None:
+            save_many(items)
+        else:
+            for record, disk_key in items:
+                self.store.save_model(record, disk_key)
+
+    def estimate_many(
+        self,
+        configurations: Sequence[Tuple[GrainGeometry, NozzleGeometry]],
+        propellant: PropellantProperties,
+    ) -> List[PerformanceEstimates]:
+        """
+        Estimates for each (grain, nozzle) pair, in order.
+
+        Misses are de-duplicated and simulated together in one vectorized
+        batch, then written to both tiers.
+        """
+        cache_keys = [
+            self.key_for(grain_geometry, nozzle_geometry, propellant)
+            for grain_geometry, nozzle_geometry in configurations
+        ]
+        found: Dict[str, SimulationRecord] = {}
+        missing: Dict[str, Tuple[GrainGeometry, NozzleGeometry]] = {}
+        for cache_key, configuration in zip(cache_keys, configurations):
+            if cache_key in found or cache_key in missing:
+                continue
+            record = self.get(cache_key)
+            if record is None:
+                missing[cache_key] = configuration
+            else:
+                found[cache_key] = record
+
+        if missing:
+            pending = list(missing.items())
+            result = simulate_bates_batch(
+                [grain.grain_outer_diameter_inch for _key, (grain, _nozzle) in pending],
+                [grain.grain_core_diameter_inch for _key, (grain, _nozzle) in pending],
+                [grain.grain_length_inch for _key, (grain, _nozzle) in pending],
+                [grain.grain_count for _key, (grain, _nozzle) in pending],
+                [nozzle.throat_diameter_inch for _key, (_grain, nozzle) in pending],
+                [nozzle.expansion_ratio for _key, (_grain, nozzle) in pending],
+                propellant,
+                self.steps,
+            )
+            new_records = [
+                SimulationRecord(
+                    cache_key=cache_key,
+                    solver_version=self.solver_version,
+                    performance_estimates=result.performance_estimates(index),
+                    burn_time_seconds=round(float(result.burn_time_seconds[index]), 4),
+                    propellant_mass_grams=round(float(result.propellant_mass_grams[index]), 2),
+                )
+                for index, (cache_key, _configuration) in enumerate(pending)
+            ]
+            self.put_many(new_records)
+            found.update((record.cache_key, record) for record in new_records)
+
+        return [found[cache_key].performance_estimates for cache_key in cache_keys]
+
+    def estimate(
+        self,
+        grain_geometry: GrainGeometry,
+        nozzle_geometry: NozzleGeometry,
+        propellant: PropellantProperties,
+    ) -> PerformanceEstimates:
+        return self.estimate_many([(grain_geometry, nozzle_geometry)], propellant)[0]
+
+    def fill_performance_estimates(
+        self,
+        motor_reload: MotorReload,
+        nozzle_geometry: NozzleGeometry,
+        propellant: PropellantProperties,
+    ) -> MotorReload:
+        """Cached counterpart of motor_ballistics_v1.fill_performance_estimates."""
+        estimates = self.estimate(motor_reload.grain_geometry, nozzle_geometry, propellant)
+        return motor_reload.model_copy(update={"performance_estimates": estimates})
+
+    def invalidate(self) -> None:
+        """Drop the memory tier. The disk tier is only cleared by a solver version change."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current memory-tier size."""
+        with self._lock:
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+            }
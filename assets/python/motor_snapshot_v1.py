@@ -0,0 +1,318 @@
+"""
+motor_snapshot_v1.py
+
+Packed, versioned snapshot of a whole motor-data catalog in one file, for
+fast cold starts (Lambda, CLI tools) that only touch a few records.
+
+File layout (JSON Lines):
+    line 1      header: format, version, record count, data checksum and an
+                offset index {key: [offset, length]} into the data section
+    line 2..n   one compact, already-validated record per line, sorted by key
+
+Offsets are relative to the first byte after the header line, so the header
+can be written last without shifting record positions. Opening a snapshot
+reads only the header; each record is sliced from a memory map and validated
+the first time it is requested.
+
+Usage as a script:
+    python3 motor_snapshot_v1.py export ../json-data/motor-data motor-data.snapshot.jsonl
+    python3 motor_snapshot_v1.py info motor-data.snapshot.jsonl
+
+Depends on:
+    motor_bulk_load_v1.py (parallel read and validation for export)
+    motor_catalog_v1.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, RootModel
+
+from motor_assemblies_v1 import MotorAssembly
+from motor_bulk_load_v1 import BulkLoadError, bulk_load_motor_data
+from motor_casting_supplies_v1 import CastingSupply
+from motor_catalog_v1 import MotorCatalog
+from motor_parts_v1 import MotorPartRecord
+from motor_reloads_v1 import MotorReload
+
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+
+# ---------------------------------------------------------------------------
+# Format constants
+# ---------------------------------------------------------------------------
+
+SNAPSHOT_FORMAT = "rocketgeek-motor-snapshot"
+SNAPSHOT_VERSION = 1
+
+MODEL_CLASS_BY_DIRECTORY: Dict[str, Type[BaseModel]] = {
+    "motor-parts": MotorPartRecord,
+    "motor-assemblies": MotorAssembly,
+    "casting-supplies": CastingSupply,
+    "motor-reloads": MotorReload,
+}
+
+
+class SnapshotFormatError(ValueError):
+    """Raised when a file is not a readable snapshot of a supported version."""
+
+
+class ReadOnlySnapshotError(PermissionError):
+    """Raised by MotorSnapshot.save_model; snapshots change only by re-export."""
+
+
+def _normalize_key(key: str) -> str:
+    return key[: -len(".json")] if key.endswith(".json") else key
+
+
+# ---------------------------------------------------------------------------
+# Export
+# ---------------------------------------------------------------------------
+
+
+def write_snapshot(
+    records: Dict[str, BaseModel],
+    output_path: Path,
+    source: str = "",
+) -> Dict[str, object]:
+    """
+    Write records ({store key: model}) to output_path atomically.
+
+    Returns the header that was written.
+    """
+    data_lines: List[bytes] = []
+    index: Dict[str, List[int]] = {}
+    offset = 0
+    data_digest = hashlib.sha256()
+    for key in sorted(records):
+        line_bytes = records[key].model_dump_json().encode("utf-8") + b"\n"
+        index[_normalize_key(key)] = [offset, len(line_bytes) - 1]
+        data_lines.append(line_bytes)
+        data_digest.update(line_bytes)
+        offset += len(line_bytes)
+
+    header: Dict[str, object] = {
+        "format": SNAPSHOT_FORMAT,
+        "version": SNAPSHOT_VERSION,
+        "source": source,
+        "record_count": len(index),
+        "data_bytes": offset,
+        "data_sha256": data_digest.hexdigest(),
+        "index": index,
+    }
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = output_path.with_name(output_path.name + ".tmp")
+    with temp_path.open("wb") as output_file:
+        output_file.write(json.dumps(header, separators=(",", ":")).encode("utf-8"))
+        output_file.write(b"\n")
+        output_file.writelines(data_lines)
+        output_file.flush()
+        os.fsync(output_file.fileno())
+    os.replace(temp_path, output_path)
+    return header
+
+
+def export_snapshot(
+    motor_data_directory: Path,
+    output_path: Path,
+) -> Tuple[Dict[str, object], List[BulkLoadError]]:
+    """
+    Validate every record under motor_data_directory and pack the valid ones.
+
+    Invalid files are left out of the snapshot and returned as errors.
+    """
+    result = bulk_load_motor_data(motor_data_directory)
+    header = write_snapshot(result.records, output_path, source=motor_data_directory.name)
+    return header, result.errors
+
+
+# ---------------------------------------------------------------------------
+# Lazy reader
+# ---------------------------------------------------------------------------
+
+
+class MotorSnapshot:
+    """
+    Read-only, lazily deserialized view of a snapshot file.
+
+    Also satisfies the loading half of ModelStore, so the load_* helpers in
+    motor_store_v1.py work against it directly. save_model always raises
+    ReadOnlySnapshotError:
+
+        with MotorSnapshot.open(Path("motor-data.snapshot.jsonl")) as snapshot:
+            assembly = load_motor_assembly(snapshot, "assembly_54mm_amw_long_snapring_v1")
+    """
+
+    def __init__(self, snapshot_path: Path) -> None:
+        self.snapshot_path = snapshot_path
+        self._file = snapshot_path.open("rb")
+        try:
+            header_line = self._file.readline()
+            try:
+                header = json.loads(header_line)
+            except ValueError as error:
+                raise SnapshotFormatError(f"{snapshot_path}: unreadable header.") from error
+            if not isinstance(header, dict) or header.get("format") != SNAPSHOT_FORMAT:
+                raise SnapshotFormatError(f"{snapshot_path}: not a motor snapshot.")
+            if header.get("version") != SNAPSHOT_VERSION:
+                raise SnapshotFormatError(
+                    f"{snapshot_path}: unsupported snapshot version {header.get('version')}."
+                )
+            self.header: Dict[str, object] = header
+            self._index: Dict[str, List[int]] = header["index"]  # type: ignore[assignment]
+            self._data_start = len(header_line)
+            self._map: Optional[mmap.mmap] = None
+            if self._index:
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        self._records: Dict[Tuple[type, str], BaseModel] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, snapshot_path: Path) -> "MotorSnapshot":
+        return cls(snapshot_path)
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self) -> "MotorSnapshot":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and _normalize_key(key) in self._index
+
+    def keys(self, prefix: str = "") -> List[str]:
+        """Record keys in the snapshot, optionally limited to a key prefix."""
+        return [key for key in self._index if key.startswith(prefix)]
+
+    def raw_json(self, key: str) -> bytes:
+        """The stored JSON bytes for key, without validation."""
+        location = self._index.get(_normalize_key(key))
+        if location is None or self._map is None:
+            raise FileNotFoundError(f"No record '{key}' in snapshot {self.snapshot_path}.")
+        start = self._data_start + location[0]
+        return self._map[start : start + location[1]]
+
+    def verify(self) -> bool:
+        """Check the data section against the header checksum."""
+        if self._map is None:
+            return self.header.get("data_bytes") == 0
+        return hashlib.sha256(self._map[self._data_start :]).hexdigest() == self.header.get(
+            "data_sha256"
+        )
+
+    def get(self, key: str) -> BaseModel:
+        """Validate (once) and return the record for key, using its directory's model."""
+        normalized_key = _normalize_key(key)
+        model_class = MODEL_CLASS_BY_DIRECTORY.get(normalized_key.split("/", 1)[0])
+        if model_class is None:
+            raise KeyError(f"Cannot infer a model class for key '{key}'.")
+        record = self.load_model(model_class, normalized_key)
+        # Parts come back as MotorPartRecord; hand out the concrete part.
+        return record.root if isinstance(record, RootModel) else record
+
+    def load_model(self, model_class: Type[ModelType], key: str) -> ModelType:
+        normalized_key = _normalize_key(key)
+        cache_key = (model_class, normalized_key)
+        with self._lock:
+            cached = self._records.get(cache_key)
+        if cached is not None:
+            return cached  # type: ignore[return-value]
+        model_instance = model_class.model_validate_json(self.raw_json(normalized_key))
+        with self._lock:
+            self._records[cache_key] = model_instance
+        return model_instance
+
+    def save_model(self, model_instance: BaseModel, key: str) -> None:
+        raise ReadOnlySnapshotError(
+            f"{self.snapshot_path} is a read-only snapshot; re-export to change '{key}'."
+        )
+
+    def model_version(self, key: str) -> Optional[str]:
+        """The data checksum; every record changes version together."""
+        if _normalize_key(key) not in self._index:
+            return None
+        return str(self.header.get("data_sha256"))
+
+    def iter_records(self, keys: Optional[Iterable[str]] = None) -> Iterable[Tuple[str, BaseModel]]:
+        """Yield (key, model) pairs, validating each on first access."""
+        for key in keys if keys is not None else self.keys():
+            yield key, self.get(key)
+
+    def to_catalog(self) -> MotorCatalog:
+        """Validate every record and build an indexed MotorCatalog from them."""
+        catalog = MotorCatalog()
+        catalog.add_records(record for _key, record in self.iter_records())
+        return catalog
+
+
+# ---------------------------------------------------------------------------
+# Command line
+# ---------------------------------------------------------------------------
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Export or inspect motor-data snapshots.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser("export", help="Pack a motor-data directory.")
+    export_parser.add_argument("motor_data_directory")
+    export_parser.add_argument("output_path")
+
+    info_parser = subparsers.add_parser("info", help="Show a snapshot's header and check it.")
+    info_parser.add_argument("snapshot_path")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        header, errors = export_snapshot(
+            Path(args.motor_data_directory).resolve(),
+            Path(args.output_path),
+        )
+        for error in errors:
+            print(
+                f"Skipped {error.file} [{error.model}] {error.field}: {error.message}",
+                file=sys.stderr,
+            )
+        print(
+            f"Wrote {header['record_count']} records "
+            f"({header['data_bytes']} bytes) to {args.output_path}"
+        )
+        return 1 if errors else 0
+
+    with MotorSnapshot.open(Path(args.snapshot_path)) as snapshot:
+        counts: Dict[str, int] = {}
+        for key in snapshot.keys():
+            directory_name = key.split("/", 1)[0]
+            counts[directory_name] = counts.get(directory_name, 0) + 1
+        print(f"Format: {snapshot.header['format']} v{snapshot.header['version']}")
+        print(f"Records: {len(snapshot)}  {json.dumps(counts, sort_keys=True)}")
+        checksum_ok = snapshot.verify()
+        print(f"Checksum: {'ok' if checksum_ok else 'MISMATCH'}")
+    return 0 if checksum_ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,390 @@
+"""
+motor_sqlite_store_v1.py
+
+SQLite-backed implementation of the ModelStore interface from motor_store_v1.py.
+
+Each record is stored as its canonical JSON next to a few extracted, indexed
+columns, so common lookups are indexed queries instead of directory scans,
+and multi-record updates are atomic:
+    - record_id          part_id / assembly_id / casting_supply_id / motor_reload_id
+    - kind               top-level directory of the key, e.g. 'motor-parts'
+    - motor_standard, part_type, role, supply_type
+    - assembly_id        (reloads)
+    - liner_casting_supply_id, casting_tube_casting_supply_id (reloads)
+    - ecosystem          (separate record_ecosystems table, one row per value)
+
+Keys follow the same convention as LocalJsonFileStore ('motor-parts/case_x',
+with or without '.json'), so the key helpers in motor_store_v1.py work as-is.
+
+Example:
+    store = SqliteModelStore(Path("motor-data.sqlite3"))
+    with store.transaction():
+        save_motor_assembly(store, assembly)
+        save_motor_reload(store, motor_reload)
+    reloads = store.reloads_for_assembly(assembly.assembly_id)
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, TypeVar, Union
+
+from pydantic import BaseModel
+
+from motor_reloads_v1 import MotorReload
+
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+
+# ---------------------------------------------------------------------------
+# Schema
+# ---------------------------------------------------------------------------
+
+SCHEMA_STATEMENTS = [
+    """
+    CREATE TABLE IF NOT EXISTS records (
+        key TEXT PRIMARY KEY,
+        kind TEXT NOT NULL,
+        model_type TEXT NOT NULL,
+        record_id TEXT,
+        motor_standard TEXT,
+        part_type TEXT,
+        role TEXT,
+        supply_type TEXT,
+        assembly_id TEXT,
+        liner_casting_supply_id TEXT,
+        casting_tube_casting_supply_id TEXT,
+        revision INTEGER NOT NULL DEFAULT 1,
+        payload TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_records_kind ON records (kind)",
+    "CREATE INDEX IF NOT EXISTS idx_records_record_id ON records (record_id)",
+    "CREATE INDEX IF NOT EXISTS idx_records_standard ON records (kind, motor_standard)",
+    "CREATE INDEX IF NOT EXISTS idx_records_part ON records (kind, part_type, role)",
+    "CREATE INDEX IF NOT EXISTS idx_records_assembly ON records (assembly_id)",
+    "CREATE INDEX IF NOT EXISTS idx_records_liner ON records (liner_casting_supply_id)",
+    "CREATE INDEX IF NOT EXISTS idx_records_tube ON records (casting_tube_casting_supply_id)",
+    """
+    CREATE TABLE IF NOT EXISTS record_ecosystems (
+        key TEXT NOT NULL REFERENCES records (key) ON DELETE CASCADE,
+        ecosystem TEXT NOT NULL,
+        PRIMARY KEY (key, ecosystem)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_ecosystems ON record_ecosystems (ecosystem, key)",
+]
+
+# Reloads also carry assembly_id, so their own ID field is checked first.
+RECORD_ID_FIELDS = ["motor_reload_id", "part_id", "casting_supply_id", "assembly_id"]
+
+CriterionValue = Union[str, Enum, None]
+
+
+def _normalize_key(key: str) -> str:
+    return key[: -len(".json")] if key.endswith(".json") else key
+
+
+def _column_value(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, Enum):
+        return str(value.value)
+    return str(value)
+
+
+def _extract_columns(model_instance: BaseModel) -> Dict[str, Optional[str]]:
+    """Pull the indexed columns out of any motor model."""
+    record_id = next(
+        (
+            getattr(model_instance, field_name)
+            for field_name in RECORD_ID_FIELDS
+            if isinstance(getattr(model_instance, field_name, None), str)
+        ),
+        None,
+    )
+    columns: Dict[str, Optional[str]] = {
+        "record_id": record_id,
+        "motor_standard": _column_value(getattr(model_instance, "motor_standard", None)),
+        "part_type": _column_value(getattr(model_instance, "part_type", None)),
+        "role": _column_value(getattr(model_instance, "role", None)),
+        "supply_type": _column_value(getattr(model_instance, "supply_type", None)),
+        "assembly_id": None,
+        "liner_casting_supply_id": None,
+        "casting_tube_casting_supply_id": None,
+    }
+    if isinstance(model_instance, MotorReload):
+        columns["assembly_id"] = model_instance.assembly_id
+        columns["liner_casting_supply_id"] = model_instance.liner.casting_supply_id
+        columns["casting_tube_casting_supply_id"] = (
+            model_instance.casting_tubes.casting_supply_id
+        )
+    return columns
+
+
+# ---------------------------------------------------------------------------
+# SQLite store
+# ---------------------------------------------------------------------------
+
+
+class SqliteModelStore:
+    """
+    ModelStore implementation backed by a single SQLite file.
+
+    Missing keys raise FileNotFoundError, matching LocalJsonFileStore, so
+    callers can switch stores without changing error handling.
+
+    save_model commits immediately unless it runs inside transaction(), in
+    which case everything in the block commits or rolls back together.
+    """
+
+    def __init__(self, database_path: Union[Path, str]) -> None:
+        self.database_path = database_path
+        self._connection = sqlite3.connect(
+            str(database_path),
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        if str(database_path) != ":memory:":
+            self._connection.execute("PRAGMA journal_mode = WAL")
+        self._lock = threading.RLock()
+        self._transaction_depth = 0
+        with self._lock:
+            for statement in SCHEMA_STATEMENTS:
+                self._connection.execute(statement)
+
+    def close(self) -> None:
+        self._connection.close()
+
+    # --- transactions --------------------------------------------------------
+
+    @contextmanager
+    def transaction(self) -> Iterator["SqliteModelStore"]:
+        """
+        Group several saves into one atomic transaction.
+
+        Nested blocks are savepoints: if an inner block raises, only its own
+        writes are rolled back, even when an outer block catches the error.
+        """
+        with self._lock:
+            depth = self._transaction_depth
+            savepoint_name = f"nested_{depth}"
+            if depth == 0:
+                self._connection.execute("BEGIN IMMEDIATE")
+            else:
+                self._connection.execute(f"SAVEPOINT {savepoint_name}")
+            self._transaction_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._transaction_depth -= 1
+                if depth == 0:
+                    self._connection.execute("ROLLBACK")
+                else:
+                    self._connection.execute(f"ROLLBACK TO {savepoint_name}")
+                    self._connection.execute(f"RELEASE {savepoint_name}")
+                raise
+            self._transaction_depth -= 1
+            if depth == 0:
+                self._connection.execute("COMMIT")
+            else:
+                self._connection.execute(f"RELEASE {savepoint_name}")
+
+    # --- ModelStore interface ------------------------------------------------
+
+    def load_model(self, model_class: Type[ModelType], key: str) -> ModelType:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT payload FROM records WHERE key = ?",
+                (_normalize_key(key),),
+            ).fetchone()
+        if row is None:
+            raise FileNotFoundError(f"No record stored under key '{key}'.")
+        return model_class.model_validate_json(row[0])
+
+    def save_model(self, model_instance: ModelType, key: str) -> None:
+        normalized_key = _normalize_key(key)
+        columns = _extract_columns(model_instance)
+        payload = model_instance.model_dump_json()
+        ecosystems = [
+            _column_value(ecosystem)
+            for ecosystem in getattr(model_instance, "ecosystem", None) or []
+        ]
+        with self.transaction():
+            self._connection.execute(
+                """
+                INSERT INTO records (
+                    key, kind, model_type, record_id, motor_standard, part_type,
+                    role, supply_type, assembly_id, liner_casting_supply_id,
+                    casting_tube_casting_supply_id, payload
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    kind = excluded.kind,
+                    model_type = excluded.model_type,
+                    record_id = excluded.record_id,
+                    motor_standard = excluded.motor_standard,
+                    part_type = excluded.part_type,
+                    role = excluded.role,
+                    supply_type = excluded.supply_type,
+                    assembly_id = excluded.assembly_id,
+                    liner_casting_supply_id = excluded.liner_casting_supply_id,
+                    casting_tube_casting_supply_id = excluded.casting_tube_casting_supply_id,
+                    revision = records.revision + 1,
+                    payload = excluded.payload
+                """,
+                (
+                    normalized_key,
+                    normalized_key.split("/", 1)[0] if "/" in normalized_key else "",
+                    type(model_instance).__name__,
+                    columns["record_id"],
+                    columns["motor_standard"],
+                    columns["part_type"],
+                    columns["role"],
+                    columns["supply_type"],
+                    columns["assembly_id"],
+                    columns["liner_casting_supply_id"],
+                    columns["casting_tube_casting_supply_id"],
+                    payload,
+                ),
+            )
+            self._connection.execute(
+                "DELETE FROM record_ecosystems WHERE key = ?",
+                (normalized_key,),
+            )
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO record_ecosystems (key, ecosystem) VALUES (?, ?)",
+                [(normalized_key, ecosystem) for ecosystem in ecosystems],
+            )
+
+    def model_version(self, key: str) -> Optional[str]:
+        """Row revision for key (bumped on every save), or None if missing."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT revision FROM records WHERE key = ?",
+                (_normalize_key(key),),
+            ).fetchone()
+        return None if row is None else str(row[0])
+
+    # --- batch operations ----------------------------------------------------
+
+    def save_many(self, items: Iterable[Tuple[BaseModel, str]]) -> None:
+        """Save (model_instance, key) pairs in one transaction."""
+        with self.transaction():
+            for model_instance, key in items:
+                self.save_model(model_instance, key)
+
+    def delete_model(self, key: str) -> bool:
+        """Remove a record. Returns True if it existed."""
+        with self.transaction():
+            cursor = self._connection.execute(
+                "DELETE FROM records WHERE key = ?",
+                (_normalize_key(key),),
+            )
+        return cursor.rowcount > 0
+
+    # --- indexed queries -----------------------------------------------------
+
+    def _select_matching(
+        self,
+        column_name: str,
+        kind: Optional[str] = None,
+        motor_standard: CriterionValue = None,
+        ecosystem: CriterionValue = None,
+        part_type: CriterionValue = None,
+        role: CriterionValue = None,
+        supply_type: CriterionValue = None,
+        assembly_id: Optional[str] = None,
+        casting_supply_id: Optional[str] = None,
+    ) -> List[str]:
+        """column_name of every record matching the criteria, ordered by key."""
+        where_clauses: List[str] = []
+        parameters: List[Optional[str]] = []
+        for criterion_column, value in (
+            ("records.kind", kind),
+            ("records.motor_standard", motor_standard),
+            ("records.part_type", part_type),
+            ("records.role", role),
+            ("records.supply_type", supply_type),
+            ("records.assembly_id", assembly_id),
+        ):
+            if value is not None:
+                where_clauses.append(f"{criterion_column} = ?")
+                parameters.append(_column_value(value))
+        if casting_supply_id is not None:
+            where_clauses.append(
+                "(records.liner_casting_supply_id = ? "
+                "OR records.casting_tube_casting_supply_id = ?)"
+            )
+            parameters.extend([casting_supply_id, casting_supply_id])
+
+        query_text = f"SELECT {column_name} FROM records"
+        if ecosystem is not None:
+            query_text += (
+                " JOIN record_ecosystems ON record_ecosystems.key = records.key"
+                " AND record_ecosystems.ecosystem = ?"
+            )
+            parameters.insert(0, _column_value(ecosystem))
+        if where_clauses:
+            query_text += " WHERE " + " AND ".join(where_clauses)
+        query_text += " ORDER BY records.key"
+
+        with self._lock:
+            rows = self._connection.execute(query_text, parameters).fetchall()
+        return [row[0] for row in rows]
+
+    def find_keys(
+        self,
+        kind: Optional[str] = None,
+        motor_standard: CriterionValue = None,
+        ecosystem: CriterionValue = None,
+        part_type: CriterionValue = None,
+        role: CriterionValue = None,
+        supply_type: CriterionValue = None,
+        assembly_id: Optional[str] = None,
+        casting_supply_id: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Keys of records matching every given criterion (None is ignored).
+
+        casting_supply_id matches reloads using the supply for either the
+        liner or the casting tubes.
+        """
+        return self._select_matching(
+            "records.key",
+            kind,
+            motor_standard,
+            ecosystem,
+            part_type,
+            role,
+            supply_type,
+            assembly_id,
+            casting_supply_id,
+        )
+
+    def query(
+        self,
+        model_class: Type[ModelType],
+        **criteria: CriterionValue,
+    ) -> List[ModelType]:
+        """Like find_keys, but returns validated models from a single SELECT."""
+        payloads = self._select_matching("records.payload", **criteria)  # type: ignore[arg-type]
+        return [model_class.model_validate_json(payload) for payload in payloads]
+
+    def reloads_for_assembly(self, assembly_id: str) -> List[MotorReload]:
+        """Every reload built to fit the given assembly."""
+        return self.query(MotorReload, kind="motor-reloads", assembly_id=assembly_id)
+
+    def reloads_using_supply(self, casting_supply_id: str) -> List[MotorReload]:
+        """Every reload that draws liner or casting tube from the given supply."""
+        return self.query(
+            MotorReload,
+            kind="motor-reloads",
+            casting_supply_id=casting_supply_id,
+        )
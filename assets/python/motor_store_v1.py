@@ -6,6 +6,7 @@ Small, pluggable persistence layer for motor models.
 This module defines:
     - ModelStore: a simple interface for loading and saving Pydantic models
     - LocalJsonFileStore: a local JSON file implementation
+    - CachingModelStore: a read-through LRU cache that wraps any ModelStore
     - Convenience helper functions that understand the standard directory
       layout:
         motor-data/
@@ -14,19 +15,31 @@ This module defines:
           casting-supplies/
           motor-reloads/
 
-Later, you can add an S3-backed implementation that also satisfies ModelStore
-without changing the rest of your code.
+S3JsonStore (motor_s3_store_v1.py) also satisfies ModelStore, so callers can
+switch backends without changing the rest of their code.
 """
 
 from __future__ import annotations
 
 import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Protocol, Type, TypeVar
+from typing import Callable, Dict, Iterable, List, Optional, Protocol, Tuple, Type, TypeVar
 
 from pydantic import BaseModel
 
-from motor_parts_v1 import CasePart, ClosurePart, NozzlePart, MotorPartBase
+from motor_parts_v1 import (
+    CasePart,
+    ClosurePart,
+    NozzlePart,
+    MotorPartBase,
+    MotorPartRecord,
+)
 from motor_assemblies_v1 import MotorAssembly
 from motor_casting_supplies_v1 import CastingSupply
 from motor_reloads_v1 import MotorReload
@@ -34,6 +47,10 @@ from motor_reloads_v1 import MotorReload
 
 ModelType = TypeVar("ModelType", bound=BaseModel)
 
+# How long CachingModelStore trusts a validated entry before asking the
+# backend for its version again.
+DEFAULT_REVALIDATE_AFTER_SECONDS = 5.0
+
 
 # ---------------------------------------------------------------------------
 # Store interface
@@ -80,6 +97,15 @@ class LocalJsonFileStore:
     Simple implementation of ModelStore that uses the local filesystem
     under a given base directory.
 
+    Writes are atomic: JSON goes to a temporary file in the target directory,
+    which is fsynced and then renamed over the target, so a crash leaves
+    either the old or the new file, never a truncated one. With durable=False
+    the fsyncs are skipped (still atomic, but not crash-durable), which is
+    fine for scratch or test directories.
+
+    compact=True writes minified JSON instead of indent=2, for machine-only
+    stores that nobody edits by hand.
+
     Example:
         base_directory = Path("motor-data")
         store = LocalJsonFileStore(base_directory)
@@ -87,8 +113,17 @@ class LocalJsonFileStore:
         case = store.load_model(CasePart, "motor-parts/case_54mm_amw_long_v1.json")
     """
 
-    def __init__(self, base_directory: Path) -> None:
+    def __init__(
+        self,
+        base_directory: Path,
+        compact: bool = False,
+        durable: bool = True,
+        max_workers: int = 8,
+    ) -> None:
         self.base_directory = base_directory
+        self.compact = compact
+        self.durable = durable
+        self.max_workers = max(1, max_workers)
 
     def _resolve_path(self, key: str) -> Path:
         """
@@ -99,6 +134,70 @@ class LocalJsonFileStore:
         normalized_key = key if key.endswith(".json") else f"{key}.json"
         return self.base_directory / normalized_key
 
+    def _serialize(self, model_instance: BaseModel) -> str:
+        if self.compact:
+            return model_instance.model_dump_json()
+        return model_instance.model_dump_json(indent=2)
+
+    def _write_atomic(self, target_path: Path, json_text: str) -> None:
+        """Write json_text to a temp file beside target_path, then rename it into place."""
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temp_name = tempfile.mkstemp(
+            prefix=f".{target_path.name}.",
+            suffix=".tmp",
+            dir=target_path.parent,
+        )
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as output_file:
+                output_file.write(json_text)
+                output_file.flush()
+                if self.durable:
+                    os.fsync(output_file.fileno())
+            os.replace(temp_name, target_path)
+        except BaseException:
+            try:
+                os.unlink(temp_name)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def _fsync_directory(self, directory_path: Path) -> None:
+        """Persist renames in directory_path. A no-op where directories cannot be opened."""
+        if not self.durable:
+            return
+        try:
+            directory_descriptor = os.open(directory_path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(directory_descriptor)
+        except OSError:
+            pass
+        finally:
+            os.close(directory_descriptor)
+
+    def write_text_atomic(self, key: str, json_text: str) -> None:
+        """
+        Replace the file for key with json_text exactly as given, atomically
+        and (when durable) fsynced like save_model. For tools that edit a
+        record's text in place rather than re-serializing a model.
+        """
+        target_path = self._resolve_path(key)
+        self._write_atomic(target_path, json_text)
+        self._fsync_directory(target_path.parent)
+
+    def model_version(self, key: str) -> Optional[str]:
+        """
+        Cheap change token for key (mtime and size), or None if missing.
+
+        CachingModelStore uses this to detect edits without re-reading files.
+        """
+        try:
+            stat_result = self._resolve_path(key).stat()
+        except FileNotFoundError:
+            return None
+        return f"{stat_result.st_mtime_ns}:{stat_result.st_size}"
+
     def load_model(self, model_class: Type[ModelType], key: str) -> ModelType:
         target_path = self._resolve_path(key)
         with target_path.open("r", encoding="utf-8") as input_file:
@@ -108,10 +207,202 @@ class LocalJsonFileStore:
 
     def save_model(self, model_instance: ModelType, key: str) -> None:
         target_path = self._resolve_path(key)
-        target_path.parent.mkdir(parents=True, exist_ok=True)
-        json_text = model_instance.model_dump_json(indent=2)
-        with target_path.open("w", encoding="utf-8") as output_file:
-            output_file.write(json_text)
+        self._write_atomic(target_path, self._serialize(model_instance))
+        self._fsync_directory(target_path.parent)
+
+    def save_many(self, items: Iterable[Tuple[BaseModel, str]]) -> None:
+        """
+        Save (model_instance, key) pairs concurrently.
+
+        Each file is written atomically as in save_model, but the directory
+        fsync happens once per directory after all writes finish instead of
+        once per file. If any write fails, the first error is raised after
+        the remaining writes complete; files already renamed stay in place.
+        When a key appears more than once, the last pair wins.
+        """
+        # Keyed by target path so duplicates are never written concurrently.
+        texts_by_path: Dict[Path, str] = {}
+        for model_instance, key in items:
+            texts_by_path[self._resolve_path(key)] = self._serialize(model_instance)
+        write_jobs: List[Tuple[Path, str]] = list(texts_by_path.items())
+        if not write_jobs:
+            return
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self._write_atomic, target_path, json_text)
+                for target_path, json_text in write_jobs
+            ]
+        for directory_path in sorted({target_path.parent for target_path, _ in write_jobs}):
+            self._fsync_directory(directory_path)
+        for future in futures:
+            future.result()
+
+
+# ---------------------------------------------------------------------------
+# Read-through caching wrapper
+# ---------------------------------------------------------------------------
+
+
+class CachingModelStore:
+    """
+    Read-through LRU cache of validated model instances around any ModelStore.
+
+    Entries are bounded by max_entries (least recently used are evicted) and
+    by ttl_seconds (None disables expiry). If the backend has a
+    model_version(key) method (LocalJsonFileStore returns mtime/size, S3
+    stores return the ETag), hits are checked against it and stale entries
+    are reloaded. An entry validated less than revalidate_after_seconds ago
+    is trusted without asking the backend, so repeated hits on a remote
+    backend (a HEAD request per check on S3) stay off the network; set it
+    to 0 to check on every hit.
+
+    Cached instances are shared between callers; treat them as read-only or
+    call model_copy() before mutating.
+
+    Example:
+        store = CachingModelStore(LocalJsonFileStore(Path("motor-data")))
+        assembly = load_motor_assembly(store, "assembly_54mm_amw_long_snapring_v1")
+        print(store.stats())
+    """
+
+    def __init__(
+        self,
+        backend: ModelStore,
+        max_entries: int = 1024,
+        ttl_seconds: Optional[float] = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+        revalidate_after_seconds: float = DEFAULT_REVALIDATE_AFTER_SECONDS,
+    ) -> None:
+        self.backend = backend
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.revalidate_after_seconds = revalidate_after_seconds
+        self._clock = clock
+        self._version_getter: Optional[Callable[[str], Optional[str]]] = getattr(
+            backend, "model_version", None
+        )
+        # (model class, key) -> (instance, version token, loaded-at time,
+        # last-validated time)
+        self._entries: "OrderedDict[Tuple[type, str], Tuple[BaseModel, Optional[str], float, float]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    def _current_version(self, key: str) -> Optional[str]:
+        if self._version_getter is None:
+            return None
+        return self._version_getter(key)
+
+    def _store_entry(
+        self,
+        cache_key: Tuple[type, str],
+        model_instance: BaseModel,
+        version: Optional[str],
+    ) -> None:
+        now = self._clock()
+        self._entries[cache_key] = (model_instance, version, now, now)
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _cached(self, cache_key: Tuple[type, str], version: Optional[str]) -> Optional[BaseModel]:
+        """
+        Cached instance for cache_key, or None. Caller holds _lock.
+
+        With version None the entry is only returned inside the trust
+        window; otherwise it is returned when the versions match, and its
+        validation time is refreshed.
+        """
+        entry = self._entries.get(cache_key)
+        if entry is None:
+            return None
+        model_instance, cached_version, loaded_at, validated_at = entry
+        now = self._clock()
+        expired = self.ttl_seconds is not None and now - loaded_at > self.ttl_seconds
+        if not expired:
+            trusted = (
+                self._version_getter is None
+                or now - validated_at < self.revalidate_after_seconds
+            )
+            if version is None and trusted:
+                self._entries.move_to_end(cache_key)
+                return model_instance
+            if version is None:
+                return None
+            if cached_version == version:
+                self._entries[cache_key] = (model_instance, cached_version, loaded_at, now)
+                self._entries.move_to_end(cache_key)
+                return model_instance
+        del self._entries[cache_key]
+        self.invalidations += 1
+        return None
+
+    def load_model(self, model_class: Type[ModelType], key: str) -> ModelType:
+        cache_key = (model_class, key)
+
+        with self._lock:
+            model_instance = self._cached(cache_key, None)
+            if model_instance is not None:
+                self.hits += 1
+                return model_instance  # type: ignore[return-value]
+            needs_check = cache_key in self._entries
+
+        version = self._current_version(key)
+        with self._lock:
+            if needs_check:
+                model_instance = self._cached(cache_key, version)
+                if model_instance is not None:
+                    self.hits += 1
+                    return model_instance  # type: ignore[return-value]
+            self.misses += 1
+
+        model_instance = self.backend.load_model(model_class, key)
+        with self._lock:
+            self._store_entry(cache_key, model_instance, version)
+        return model_instance
+
+    def save_model(self, model_instance: ModelType, key: str) -> None:
+        self.backend.save_model(model_instance, key)
+        with self._lock:
+            # Other model classes cached under this key may now be stale.
+            for cache_key in [cached for cached in self._entries if cached[1] == key]:
+                del self._entries[cache_key]
+            self._store_entry(
+                (type(model_instance), key),
+                model_instance,
+                self._current_version(key),
+            )
+
+    def model_version(self, key: str) -> Optional[str]:
+        return self._current_version(key)
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Drop cached entries for key, or everything when key is None."""
+        with self._lock:
+            if key is None:
+                self.invalidations += len(self._entries)
+                self._entries.clear()
+                return
+            for cache_key in [cached for cached in self._entries if cached[1] == key]:
+                del self._entries[cache_key]
+                self.invalidations += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+            }
 
 
 # ---------------------------------------------------------------------------
@@ -126,19 +417,19 @@ class LocalJsonFileStore:
 #     motor-reloads/
 
 
-def _parts_key(part_id: str) -> str:
+def parts_key(part_id: str) -> str:
     return f"motor-parts/{part_id}"
 
 
-def _assembly_key(assembly_id: str) -> str:
+def assembly_key(assembly_id: str) -> str:
     return f"motor-assemblies/{assembly_id}"
 
 
-def _casting_supply_key(casting_supply_id: str) -> str:
+def casting_supply_key(casting_supply_id: str) -> str:
     return f"casting-supplies/{casting_supply_id}"
 
 
-def _reload_key(motor_reload_id: str) -> str:
+def reload_key(motor_reload_id: str) -> str:
     return f"motor-reloads/{motor_reload_id}"
 
 
@@ -149,30 +440,29 @@ def load_motor_part(store: ModelStore, part_id: str) -> MotorPartBase:
     """
     Load any motor part by part_id from the 'motor-parts/' directory.
 
-    The caller is responsible for casting to CasePart, ClosurePart, or NozzlePart
-    if they expect a specific subtype.
+    The record is validated once against the part_type-discriminated union,
+    so the result is already a CasePart, ClosurePart or NozzlePart (or a
+    plain MotorPartBase for other part types) with all subtype fields.
     """
-    key = _parts_key(part_id)
-    # We load as MotorPartBase to allow the caller to inspect part_type/role
-    # before deciding how to handle it.
-    return store.load_model(MotorPartBase, key)
+    key = parts_key(part_id)
+    return store.load_model(MotorPartRecord, key).root
 
 
 def load_case_part(store: ModelStore, part_id: str) -> CasePart:
     """Load a CasePart from 'motor-parts/' given its part_id."""
-    key = _parts_key(part_id)
+    key = parts_key(part_id)
     return store.load_model(CasePart, key)
 
 
 def load_closure_part(store: ModelStore, part_id: str) -> ClosurePart:
     """Load a ClosurePart from 'motor-parts/' given its part_id."""
-    key = _parts_key(part_id)
+    key = parts_key(part_id)
     return store.load_model(ClosurePart, key)
 
 
 def load_nozzle_part(store: ModelStore, part_id: str) -> NozzlePart:
     """Load a NozzlePart from 'motor-parts/' given its part_id."""
-    key = _parts_key(part_id)
+    key = parts_key(part_id)
     return store.load_model(NozzlePart, key)
 
 
@@ -182,7 +472,7 @@ def save_motor_part(store: ModelStore, part: MotorPartBase) -> None:
 
     The JSON filename will match part.part_id with a .json suffix.
     """
-    key = _parts_key(part.part_id)
+    key = parts_key(part.part_id)
     store.save_model(part, key)
 
 
@@ -191,13 +481,13 @@ def save_motor_part(store: ModelStore, part: MotorPartBase) -> None:
 
 def load_motor_assembly(store: ModelStore, assembly_id: str) -> MotorAssembly:
     """Load a MotorAssembly from 'motor-assemblies/' given its assembly_id."""
-    key = _assembly_key(assembly_id)
+    key = assembly_key(assembly_id)
     return store.load_model(MotorAssembly, key)
 
 
 def save_motor_assembly(store: ModelStore, assembly: MotorAssembly) -> None:
     """Save a MotorAssembly into the 'motor-assemblies/' directory."""
-    key = _assembly_key(assembly.assembly_id)
+    key = assembly_key(assembly.assembly_id)
     store.save_model(assembly, key)
 
 
@@ -209,7 +499,7 @@ def load_casting_supply(
     casting_supply_id: str,
 ) -> CastingSupply:
     """Load a CastingSupply from 'casting-supplies/' given its ID."""
-    key = _casting_supply_key(casting_supply_id)
+    key = casting_supply_key(casting_supply_id)
     return store.load_model(CastingSupply, key)
 
 
@@ -218,7 +508,7 @@ def save_casting_supply(
     casting_supply: CastingSupply,
 ) -> None:
     """Save a CastingSupply into the 'casting-supplies/' directory."""
-    key = _casting_supply_key(casting_supply.casting_supply_id)
+    key = casting_supply_key(casting_supply.casting_supply_id)
     store.save_model(casting_supply, key)
 
 
@@ -227,12 +517,12 @@ def save_casting_supply(
 
 def load_motor_reload(store: ModelStore, motor_reload_id: str) -> MotorReload:
     """Load a MotorReload from 'motor-reloads/' given its ID."""
-    key = _reload_key(motor_reload_id)
+    key = reload_key(motor_reload_id)
     return store.load_model(MotorReload, key)
 
 
 def save_motor_reload(store: ModelStore, motor_reload: MotorReload) -> None:
     """Save a MotorReload into the 'motor-reloads/' directory."""
-    key = _reload_key(motor_reload.motor_reload_id)
+    key = reload_key(motor_reload.motor_reload_id)
     store.save_model(motor_reload, key)
 
@@ -0,0 +1,498 @@
+"""
+motor_sweep_v1.py
+
+Design-space sweep for new BATES reloads in existing hardware.
+
+Given ranges for grain core diameter, grain length, grain count and nozzle
+throat diameter, this module:
+    - builds the full candidate grid with NumPy
+    - drops candidates whose grain stack exceeds the assembly's
+      StackGeometry.maximum_grain_stack_length_inch, or whose core port is
+      smaller than the throat
+    - simulates the rest with motor_ballistics_v1.simulate_bates_batch,
+      in batches spread across a process pool
+    - drops candidates whose peak pressure exceeds the case
+      max_operating_pressure_psi, or whose average pressure is too low to
+      burn reliably
+    - returns the Pareto front of total impulse (higher is better) against
+      peak chamber pressure (lower is better)
+
+The grain outer diameter and the nozzle exit diameter are fixed by the
+hardware, so the expansion ratio of each candidate follows from its throat.
+
+Example:
+    space = SweepSpace.from_specs("0.5:1.0:11", "2.0:4.0:9", "1:4:4", "0.35:0.65:13")
+    result = run_design_sweep(space, envelope, GENERIC_APCP)
+    for candidate in result.pareto_front:
+        print(candidate.total_impulse_newton_second, candidate.peak_pressure_psi)
+
+Usage as a script (the template reload supplies the assembly and grain OD):
+    python3 motor_sweep_v1.py ../json-data/motor-data \\
+        motor_reload_magenta_red_54mm_amw_long_v1 \\
+        --core 0.5:1.0:11 --length 2.0:4.0:9 --count 1:4:4 --throat 0.35:0.65:13
+
+Depends on:
+    numpy
+    motor_ballistics_v1.py
+    motor_parts_v1.py
+    motor_reloads_v1.py
+    motor_store_v1.py
+    motor_resolve_v1.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from motor_ballistics_v1 import (
+    DEFAULT_WEB_STEPS,
+    GENERIC_APCP,
+    PropellantProperties,
+    assembly_nozzle_geometry,
+    simulate_bates_batch,
+)
+from motor_common_v1 import PartRole
+from motor_parts_v1 import CasePart
+from motor_reloads_v1 import GrainGeometry
+from motor_store_v1 import LocalJsonFileStore
+from motor_resolve_v1 import ResolutionSession
+
+
+DEFAULT_BATCH_SIZE = 4096
+DEFAULT_PROCESS_THRESHOLD = 8192
+DEFAULT_MINIMUM_PORT_TO_THROAT_RATIO = 1.0
+# Below this, APCP burns erratically or chuffs; such designs are not useful.
+DEFAULT_MINIMUM_AVERAGE_PRESSURE_PSI = 150.0
+
+# Column order of the per-batch result matrix returned by workers.
+RESULT_COLUMNS = (
+    "initial_kn",
+    "maximum_kn",
+    "peak_pressure_psi",
+    "average_pressure_psi",
+    "total_impulse_newton_second",
+    "isp_seconds",
+    "burn_time_seconds",
+    "propellant_mass_grams",
+)
+
+
+# ---------------------------------------------------------------------------
+# Sweep inputs
+# ---------------------------------------------------------------------------
+
+
+def parse_range_spec(spec: str) -> np.ndarray:
+    """
+    Values for a 'start:stop:count' spec (inclusive, evenly spaced), or a
+    single number.
+    """
+    parts = spec.split(":")
+    if len(parts) == 1:
+        return np.array([float(parts[0])])
+    if len(parts) != 3:
+        raise ValueError(f"Expected 'start:stop:count', got '{spec}'.")
+    start, stop, count = float(parts[0]), float(parts[1]), int(parts[2])
+    if count < 1:
+        raise ValueError(f"Range '{spec}' needs a positive count.")
+    return np.linspace(start, stop, count)
+
+
+@dataclass(frozen=True)
+class SweepSpace:
+    """Candidate values for each swept dimension (inches, grain count)."""
+
+    core_diameters_inch: np.ndarray
+    grain_lengths_inch: np.ndarray
+    grain_counts: np.ndarray
+    throat_diameters_inch: np.ndarray
+
+    @classmethod
+    def from_specs(
+        cls,
+        core_spec: str,
+        length_spec: str,
+        count_spec: str,
+        throat_spec: str,
+    ) -> "SweepSpace":
+        """
+        Parse one range spec per dimension.
+
+        Raises ValueError for negative cores, non-positive lengths or
+        throats, and grain counts below 1.
+        """
+        space = cls(
+            core_diameters_inch=parse_range_spec(core_spec),
+            grain_lengths_inch=parse_range_spec(length_spec),
+            grain_counts=np.unique(np.rint(parse_range_spec(count_spec)).astype(int)),
+            throat_diameters_inch=parse_range_spec(throat_spec),
+        )
+        for label, spec, values, minimum, inclusive in (
+            ("Core diameters", core_spec, space.core_diameters_inch, 0.0, True),
+            ("Grain lengths", length_spec, space.grain_lengths_inch, 0.0, False),
+            ("Grain counts", count_spec, space.grain_counts, 1, True),
+            ("Throat diameters", throat_spec, space.throat_diameters_inch, 0.0, False),
+        ):
+            too_small = values < minimum if inclusive else values <= minimum
+            if np.any(too_small):
+                bound = f"at least {minimum:g}" if inclusive else f"greater than {minimum:g}"
+                raise ValueError(f"{label} must be {bound}; '{spec}' includes {values.min():g}.")
+        return space
+
+    @property
+    def size(self) -> int:
+        return (
+            len(self.core_diameters_inch)
+            * len(self.grain_lengths_inch)
+            * len(self.grain_counts)
+            * len(self.throat_diameters_inch)
+        )
+
+    def grid(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Flattened (core, length, count, throat) arrays covering every combination."""
+        core, length, count, throat = np.meshgrid(
+            self.core_diameters_inch,
+            self.grain_lengths_inch,
+            self.grain_counts.astype(float),
+            self.throat_diameters_inch,
+            indexing="ij",
+        )
+        return core.ravel(), length.ravel(), count.ravel(), throat.ravel()
+
+
+@dataclass(frozen=True)
+class HardwareEnvelope:
+    """Limits imposed by an existing assembly."""
+
+    grain_outer_diameter_inch: float
+    maximum_grain_stack_length_inch: float
+    nozzle_exit_diameter_inch: float
+    max_operating_pressure_psi: Optional[float] = None
+    minimum_port_to_throat_ratio: float = DEFAULT_MINIMUM_PORT_TO_THROAT_RATIO
+    minimum_average_pressure_psi: float = DEFAULT_MINIMUM_AVERAGE_PRESSURE_PSI
+
+
+# ---------------------------------------------------------------------------
+# Sweep results
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class SweepCandidate:
+    """One simulated design."""
+
+    grain_core_diameter_inch: float
+    grain_length_inch: float
+    grain_count: int
+    throat_diameter_inch: float
+    expansion_ratio: float
+    initial_kn: float
+    maximum_kn: float
+    peak_pressure_psi: float
+    average_pressure_psi: float
+    total_impulse_newton_second: float
+    isp_seconds: float
+    burn_time_seconds: float
+    propellant_mass_grams: float
+
+    def grain_geometry(self, grain_outer_diameter_inch: float) -> GrainGeometry:
+        return GrainGeometry(
+            grain_outer_diameter_inch=grain_outer_diameter_inch,
+            grain_core_diameter_inch=self.grain_core_diameter_inch,
+            grain_length_inch=self.grain_length_inch,
+            grain_count=self.grain_count,
+            web_thickness_inch=round(
+                (grain_outer_diameter_inch - self.grain_core_diameter_inch) / 2.0, 4
+            ),
+        )
+
+
+@dataclass
+class SweepResult:
+    """Outcome of a design sweep."""
+
+    candidate_count: int = 0
+    simulated_count: int = 0
+    feasible_count: int = 0
+    rejected: Dict[str, int] = field(default_factory=dict)
+    pareto_front: List[SweepCandidate] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "candidate_count": self.candidate_count,
+            "simulated_count": self.simulated_count,
+            "feasible_count": self.feasible_count,
+            "rejected": dict(self.rejected),
+            "pareto_front": [asdict(candidate) for candidate in self.pareto_front],
+        }
+
+
+# ---------------------------------------------------------------------------
+# Evaluation
+# ---------------------------------------------------------------------------
+
+
+def _evaluate_batch(
+    job: Tuple[np.ndarray, float, PropellantProperties, int],
+) -> np.ndarray:
+    """
+    Simulate one batch. Module-level so it can be sent to worker processes.
+
+    job is (inputs, grain_outer_diameter_inch, propellant, steps), where
+    inputs has columns core, length, count, throat, expansion ratio. Returns
+    a matrix with RESULT_COLUMNS.
+    """
+    inputs, outer_diameter, propellant, steps = job
+    result = simulate_bates_batch(
+        outer_diameter,
+        inputs[:, 0],
+        inputs[:, 1],
+        inputs[:, 2],
+        inputs[:, 3],
+        inputs[:, 4],
+        propellant,
+        steps,
+    )
+    return np.column_stack([getattr(result, column) for column in RESULT_COLUMNS])
+
+
+def pareto_front_mask(impulse: np.ndarray, peak_pressure: np.ndarray) -> np.ndarray:
+    """
+    True for designs not dominated by any other (more impulse at no more
+    pressure, or less pressure at no less impulse).
+    """
+    order = np.lexsort((-impulse, peak_pressure))
+    sorted_impulse = impulse[order]
+    best_so_far = np.maximum.accumulate(sorted_impulse)
+    previous_best = np.concatenate([[-np.inf], best_so_far[:-1]])
+    mask = np.zeros(impulse.shape[0], dtype=bool)
+    mask[order] = sorted_impulse > previous_best
+    return mask
+
+
+def run_design_sweep(
+    space: SweepSpace,
+    envelope: HardwareEnvelope,
+    propellant: PropellantProperties,
+    workers: Optional[int] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    process_threshold: int = DEFAULT_PROCESS_THRESHOLD,
+    steps: int = DEFAULT_WEB_STEPS,
+) -> SweepResult:
+    """
+    Evaluate every candidate in space that fits envelope and return the
+    impulse / peak-pressure Pareto front, lowest pressure first.
+
+    workers defaults to os.cpu_count(). Sweeps smaller than
+    process_threshold candidates run in the calling process, where pool
+    start-up would cost more than it saves.
+    """
+    result = SweepResult(candidate_count=space.size)
+    core, length, count, throat = space.grid()
+    outer = envelope.grain_outer_diameter_inch
+
+    checks = (
+        ("core_not_smaller_than_outer_diameter", core < outer),
+        ("stack_too_long", count * length <= envelope.maximum_grain_stack_length_inch),
+        ("throat_not_smaller_than_exit", throat < envelope.nozzle_exit_diameter_inch),
+        (
+            "port_smaller_than_throat",
+            core**2 >= envelope.minimum_port_to_throat_ratio * throat**2,
+        ),
+    )
+    keep = np.ones(core.shape[0], dtype=bool)
+    for reason, passes in checks:
+        result.rejected[reason] = int(np.count_nonzero(keep & ~passes))
+        keep &= passes
+
+    expansion = (envelope.nozzle_exit_diameter_inch / throat) ** 2
+    inputs = np.column_stack([core, length, count, throat, expansion])[keep]
+    result.simulated_count = int(inputs.shape[0])
+    if result.simulated_count == 0:
+        return result
+
+    jobs = [
+        (inputs[start : start + batch_size], outer, propellant, steps)
+        for start in range(0, inputs.shape[0], max(1, batch_size))
+    ]
+    worker_count = workers or os.cpu_count() or 1
+    if worker_count > 1 and len(jobs) > 1 and inputs.shape[0] >= process_threshold:
+        with ProcessPoolExecutor(max_workers=min(worker_count, len(jobs))) as executor:
+            outputs = list(executor.map(_evaluate_batch, jobs))
+    else:
+        outputs = [_evaluate_batch(job) for job in jobs]
+    outcomes = np.vstack(outputs)
+
+    column = {name: index for index, name in enumerate(RESULT_COLUMNS)}
+    peak_pressure = outcomes[:, column["peak_pressure_psi"]]
+    if envelope.max_operating_pressure_psi is not None:
+        under_limit = peak_pressure <= envelope.max_operating_pressure_psi
+    else:
+        under_limit = np.ones(peak_pressure.shape[0], dtype=bool)
+    burns_reliably = (
+        outcomes[:, column["average_pressure_psi"]] >= envelope.minimum_average_pressure_psi
+    )
+    within_pressure = under_limit & burns_reliably
+    result.rejected["over_max_operating_pressure"] = int(np.count_nonzero(~under_limit))
+    result.rejected["under_minimum_pressure"] = int(np.count_nonzero(under_limit & ~burns_reliably))
+    result.feasible_count = int(np.count_nonzero(within_pressure))
+
+    inputs = inputs[within_pressure]
+    outcomes = outcomes[within_pressure]
+    if inputs.shape[0] == 0:
+        return result
+
+    front = pareto_front_mask(
+        outcomes[:, column["total_impulse_newton_second"]],
+        outcomes[:, column["peak_pressure_psi"]],
+    )
+    front_indices = np.flatnonzero(front)
+    front_indices = front_indices[np.argsort(outcomes[front_indices, column["peak_pressure_psi"]])]
+    result.pareto_front = [
+        SweepCandidate(
+            grain_core_diameter_inch=round(float(inputs[index, 0]), 4),
+            grain_length_inch=round(float(inputs[index, 1]), 4),
+            grain_count=int(inputs[index, 2]),
+            throat_diameter_inch=round(float(inputs[index, 3]), 4),
+            expansion_ratio=round(float(inputs[index, 4]), 3),
+            **{
+                name: round(float(outcomes[index, position]), 3)
+                for position, name in enumerate(RESULT_COLUMNS)
+            },
+        )
+        for index in front_indices
+    ]
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Command line
+# ---------------------------------------------------------------------------
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Sweep BATES grain and throat designs for an existing assembly.",
+    )
+    parser.add_argument("motor_data_directory", help="Path to the motor-data root.")
+    parser.add_argument(
+        "template_reload_id",
+        help="Reload whose assembly and grain outer diameter define the hardware.",
+    )
+    parser.add_argument("--core", required=True, help="Core diameter range 'start:stop:count'.")
+    parser.add_argument("--length", required=True, help="Grain length range 'start:stop:count'.")
+    parser.add_argument("--count", required=True, help="Grain count range 'start:stop:count'.")
+    parser.add_argument("--throat", required=True, help="Throat diameter range 'start:stop:count'.")
+    parser.add_argument(
+        "--burn-rate-coefficient",
+        type=float,
+        default=GENERIC_APCP.burn_rate_coefficient,
+        help="Burn-rate coefficient a, in in/s/psi^n.",
+    )
+    parser.add_argument(
+        "--burn-rate-exponent",
+        type=float,
+        default=GENERIC_APCP.burn_rate_exponent,
+        help="Burn-rate pressure exponent n.",
+    )
+    parser.add_argument(
+        "--max-pressure",
+        type=float,
+        default=0.0,
+        help="Pressure limit in psi when the case record has none.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Processes used to simulate. Defaults to the CPU count.",
+    )
+    parser.add_argument(
+        "--report",
+        default="",
+        help="Optional path for a JSON report of the Pareto front.",
+    )
+    args = parser.parse_args(argv)
+
+    base_directory = Path(args.motor_data_directory).resolve()
+    if not base_directory.is_dir():
+        print(f"Not a directory: {base_directory}", file=sys.stderr)
+        return 2
+
+    session = ResolutionSession(LocalJsonFileStore(base_directory))
+    try:
+        resolved = session.resolve_reload(args.template_reload_id)
+        assembly = resolved.assembly
+        nozzle_geometry = assembly_nozzle_geometry(assembly)
+        case_ids = [
+            part_ref.part_id
+            for part_ref in assembly.assembly.parts
+            if part_ref.role == PartRole.CASE
+        ]
+        case_part = session.part(case_ids[0]) if case_ids else None
+    except FileNotFoundError as error:
+        print(f"{args.template_reload_id}: {error}", file=sys.stderr)
+        return 1
+    if nozzle_geometry is None:
+        print(f"{assembly.assembly_id}: assembly has no nozzle part.", file=sys.stderr)
+        return 1
+
+    max_pressure = case_part.max_operating_pressure_psi if isinstance(case_part, CasePart) else None
+    if max_pressure is None and args.max_pressure > 0:
+        max_pressure = args.max_pressure
+    if max_pressure is None:
+        print("Warning: no case pressure limit; sweep is unconstrained by pressure.", file=sys.stderr)
+
+    envelope = HardwareEnvelope(
+        grain_outer_diameter_inch=resolved.motor_reload.grain_geometry.grain_outer_diameter_inch,
+        maximum_grain_stack_length_inch=assembly.assembly.stack_geometry.maximum_grain_stack_length_inch,
+        nozzle_exit_diameter_inch=nozzle_geometry.exit_diameter_inch,
+        max_operating_pressure_psi=max_pressure,
+    )
+    propellant = PropellantProperties(
+        burn_rate_coefficient=args.burn_rate_coefficient,
+        burn_rate_exponent=args.burn_rate_exponent,
+    )
+    try:
+        space = SweepSpace.from_specs(args.core, args.length, args.count, args.throat)
+    except ValueError as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 2
+
+    result = run_design_sweep(space, envelope, propellant, workers=args.workers or None)
+
+    print(
+        f"Candidates: {result.candidate_count}  simulated: {result.simulated_count}  "
+        f"feasible: {result.feasible_count}  pareto: {len(result.pareto_front)}"
+    )
+    for reason, rejected_count in sorted(result.rejected.items()):
+        if rejected_count:
+            print(f"  rejected {reason}: {rejected_count}")
+    for candidate in result.pareto_front:
+        print(
+            f"  {candidate.total_impulse_newton_second:9.1f} N·s  "
+            f"{candidate.peak_pressure_psi:7.1f} psi  "
+            f"core {candidate.grain_core_diameter_inch:.3f}  "
+            f"length {candidate.grain_length_inch:.3f} x {candidate.grain_count}  "
+            f"throat {candidate.throat_diameter_inch:.3f}"
+        )
+
+    if args.report:
+        report_path = Path(args.report)
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_text(json.dumps(result.to_dict(), indent=2) + "\n", encoding="utf-8")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+"""
+build-calendar-feeds.py
+
+Validate assets/json-data/calendar-events.json, expand recurring entries and
+generate:
+- assets/json-data/calendar-events/YYYY-MM.json   (one shard per month)
+- assets/json-data/calendar-events/months.json    (list of available shards)
+- assets/json-data/calendar-events/upcoming.json  (digest for upcoming-events.html)
+
+Each calendar view fetches only the shard of the month it shows. A multi-day
+event that crosses a month boundary is written to every month it touches.
+
+Recurring events carry an optional "recurrence" object in the source file:
+
+  "recurrence": {
+    "frequency": "monthly",        # daily | weekly | monthly | yearly
+    "interval": 1,                 # optional, default 1
+    "until": "2026-12-31",         # optional end date (inclusive)
+    "count": 12,                   # optional number of occurrences
+    "exclude_dates": ["2026-07-11"]  # optional skipped start dates
+  }
+
+Open-ended recurrences are expanded up to RECURRENCE_HORIZON_DAYS past the
+build date. Every month from the earliest event (or the build month, if
+earlier) through the horizon gets a shard, empty months included as [], so
+a calendar view always finds its month in one request. Shards outside that
+range are removed.
+
+Designed to live in: <site-root>/aws/build-calendar-feeds.py
+Run from anywhere:
+  python3 aws/build-calendar-feeds.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import calendar
+import json
+import logging
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    from zoneinfo import ZoneInfo
+except Exception:
+    ZoneInfo = None  # type: ignore[assignment]
+
+
+# Begin Configuration
+TIMEZONE_NAME_DEFAULT = "America/Chicago"
+
+SOURCE_EVENTS_RELATIVE_PATH = Path("assets/json-data/calendar-events.json")
+OUTPUT_SHARD_DIRECTORY_RELATIVE_PATH = Path("assets/json-data/calendar-events")
+MONTHS_FILE_NAME = "months.json"
+UPCOMING_FILE_NAME = "upcoming.json"
+
+RECURRENCE_HORIZON_DAYS = 540
+MAX_OCCURRENCES_PER_EVENT = 1000
+
+UPCOMING_WINDOW_DAYS = 120
+UPCOMING_MAX_EVENTS = 25
+
+REQUIRED_FIELDS = ["name", "start_date", "end_date"]
+ALLOWED_FREQUENCIES = ["daily", "weekly", "monthly", "yearly"]
+
+SHARD_FILE_NAME_PATTERN = re.compile(r"^\d{4}-\d{2}\.json$")
+TIME_PATTERN = re.compile(r"^(0?[1-9]|1[0-2]):[0-5]\d (AM|PM)$")
+# End Configuration
+
+
+# Begin Logging Setup
+def configure_logging(verbose: bool) -> None:
+    log_level = logging.DEBUG if verbose else logging.INFO
+    logging.basicConfig(level=log_level, format="%(levelname)s: %(message)s")
+# End Logging Setup
+
+
+# Begin Helpers
+def get_site_root(script_path: Path) -> Path:
+    aws_directory = script_path.resolve().parent
+    site_root = aws_directory.parent
+    return site_root
+
+
+def get_today_local(timezone_name: str) -> date:
+    if ZoneInfo is None:
+        return datetime.now().date()
+    try:
+        return datetime.now(ZoneInfo(timezone_name)).date()
+    except Exception:
+        return datetime.now().date()
+
+
+def parse_iso_date(value: Any) -> Optional[date]:
+    if not isinstance(value, str):
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def month_key(day_value: date) -> str:
+    return day_value.strftime("%Y-%m")
+
+
+def add_months(day_value: date, month_count: int) -> Optional[date]:
+    """
+    Shift by whole months, keeping the day of month. Returns None when the
+    target month has no such day (e.g. the 31st), so that occurrence is skipped.
+    """
+    month_index = day_value.month - 1 + month_count
+    target_year = day_value.year + month_index // 12
+    target_month = month_index % 12 + 1
+    if day_value.day > calendar.monthrange(target_year, target_month)[1]:
+        return None
+    return day_value.replace(year=target_year, month=target_month)
+
+
+def iterate_month_keys(start_date: date, end_date: date) -> list[str]:
+    keys: list[str] = []
+    cursor = start_date.replace(day=1)
+    while cursor <= end_date:
+        keys.append(month_key(cursor))
+        if cursor.month == 12:
+            cursor = cursor.replace(year=cursor.year + 1, month=1)
+        else:
+            cursor = cursor.replace(month=cursor.month + 1)
+    return keys
+
+
+def ensure_directory(directory_path: Path) -> None:
+    directory_path.mkdir(parents=True, exist_ok=True)
+
+
+def write_json_if_changed(output_path: Path, payload: Any) -> bool:
+    json_text = json.dumps(payload, indent=2, ensure_ascii=False) + "\n"
+    try:
+        if output_path.read_text(encoding="utf-8") == json_text:
+            return False
+    except Exception:
+        pass
+    output_path.write_text(json_text, encoding="utf-8")
+    return True
+# End Helpers
+
+
+# Begin Data Model
+@dataclass(frozen=True)
+class EventOccurrence:
+    start_date: date
+    end_date: date
+    fields: dict[str, Any]
+
+    def to_payload(self) -> dict[str, Any]:
+        payload = dict(self.fields)
+        payload["start_date"] = self.start_date.isoformat()
+        payload["end_date"] = self.end_date.isoformat()
+        return payload
+# End Data Model
+
+
+# Begin Validation
+def validate_event(position: int, event: Any) -> list[str]:
+    label = f"event[{position}]"
+    if not isinstance(event, dict):
+        return [f"{label}: must be an object"]
+
+    label = f"event[{position}] {event.get('name', '')!r}"
+    errors: list[str] = []
+
+    for field_name in REQUIRED_FIELDS:
+        if not event.get(field_name):
+            errors.append(f"{label}: missing {field_name}")
+
+    start_date = parse_iso_date(event.get("start_date"))
+    end_date = parse_iso_date(event.get("end_date"))
+    if event.get("start_date") and start_date is None:
+        errors.append(f"{label}: start_date must be YYYY-MM-DD")
+    if event.get("end_date") and end_date is None:
+        errors.append(f"{label}: end_date must be YYYY-MM-DD")
+    if start_date and end_date and end_date < start_date:
+        errors.append(f"{label}: end_date is before start_date")
+
+    for field_name in ("start_time", "end_time"):
+        time_value = event.get(field_name)
+        if time_value and not TIME_PATTERN.match(str(time_value)):
+            errors.append(f"{label}: {field_name} must look like '09:00 AM'")
+
+    recurrence = event.get("recurrence")
+    if recurrence is not None:
+        errors.extend(validate_recurrence(label, recurrence))
+
+    return errors
+
+
+def validate_recurrence(label: str, recurrence: Any) -> list[str]:
+    if not isinstance(recurrence, dict):
+        return [f"{label}: recurrence must be an object"]
+
+    errors: list[str] = []
+    if recurrence.get("frequency") not in ALLOWED_FREQUENCIES:
+        errors.append(
+            f"{label}: recurrence.frequency must be one of "
+            f"{', '.join(ALLOWED_FREQUENCIES)}"
+        )
+
+    interval_value = recurrence.get("interval", 1)
+    if not isinstance(interval_value, int) or interval_value < 1:
+        errors.append(f"{label}: recurrence.interval must be a positive integer")
+
+    count_value = recurrence.get("count")
+    if count_value is not None and (not isinstance(count_value, int) or count_value < 1):
+        errors.append(f"{label}: recurrence.count must be a positive integer")
+
+    until_value = recurrence.get("until")
+    if until_value is not None and parse_iso_date(until_value) is None:
+        errors.append(f"{label}: recurrence.until must be YYYY-MM-DD")
+
+    for excluded_value in recurrence.get("exclude_dates", []) or []:
+        if parse_iso_date(excluded_value) is None:
+            errors.append(f"{label}: recurrence.exclude_dates must be YYYY-MM-DD")
+            break
+
+    return errors
+# End Validation
+
+
+# Begin Recurrence Expansion
+def step_start_date(
+    first_start: date,
+    frequency: str,
+    step_index: int,
+) -> Optional[date]:
+    if frequency == "daily":
+        return first_start + timedelta(days=step_index)
+    if frequency == "weekly":
+        return first_start + timedelta(weeks=step_index)
+    if frequency == "monthly":
+        return add_months(first_start, step_index)
+    return add_months(first_start, 12 * step_index)
+
+
+def expand_event(event: dict[str, Any], horizon_date: date) -> list[EventOccurrence]:
+    first_start = parse_iso_date(event["start_date"])
+    first_end = parse_iso_date(event["end_date"])
+    assert first_start is not None and first_end is not None
+    duration = first_end - first_start
+
+    fields = {key: value for key, value in event.items() if key != "recurrence"}
+    recurrence = event.get("recurrence")
+    if not recurrence:
+        return [EventOccurrence(first_start, first_end, fields)]
+
+    frequency = recurrence["frequency"]
+    interval_value = recurrence.get("interval", 1)
+    count_limit = recurrence.get("count") or MAX_OCCURRENCES_PER_EVENT
+    until_date = parse_iso_date(recurrence.get("until")) or horizon_date
+    excluded_dates = {
+        parse_iso_date(excluded_value)
+        for excluded_value in recurrence.get("exclude_dates", []) or []
+    }
+
+    occurrences: list[EventOccurrence] = []
+    step_index = 0
+    emitted_count = 0
+    while emitted_count < min(count_limit, MAX_OCCURRENCES_PER_EVENT):
+        occurrence_start = step_start_date(first_start, frequency, step_index)
+        step_index += interval_value
+
+        if occurrence_start is None:
+            # Monthly/yearly rule landed on a day the month does not have.
+            continue
+        if occurrence_start > until_date:
+            break
+
+        emitted_count += 1
+        if occurrence_start in excluded_dates:
+            continue
+
+        occurrences.append(
+            EventOccurrence(occurrence_start, occurrence_start + duration, fields)
+        )
+
+    return occurrences
+# End Recurrence Expansion
+
+
+# Begin Feed Generation
+def build_month_shards(
+    occurrences: list[EventOccurrence],
+    first_date: date,
+    last_date: date,
+) -> dict[str, list[dict[str, Any]]]:
+    """
+    One shard per month from first_date through last_date (empty months
+    included), widened to cover every occurrence.
+    """
+    if occurrences:
+        first_date = min(first_date, occurrences[0].start_date)
+        last_date = max(last_date, max(occurrence.end_date for occurrence in occurrences))
+    shards: dict[str, list[dict[str, Any]]] = {
+        key: [] for key in iterate_month_keys(first_date, last_date)
+    }
+    for occurrence in occurrences:
+        payload = occurrence.to_payload()
+        for key in iterate_month_keys(occurrence.start_date, occurrence.end_date):
+            shards.setdefault(key, []).append(payload)
+    return dict(sorted(shards.items()))
+
+
+def build_upcoming_digest(
+    occurrences: list[EventOccurrence],
+    today: date,
+) -> dict[str, Any]:
+    window_end = today + timedelta(days=UPCOMING_WINDOW_DAYS)
+    upcoming = [
+        occurrence
+        for occurrence in occurrences
+        if occurrence.end_date >= today and occurrence.start_date <= window_end
+    ]
+    return {
+        "generated_for_date": today.isoformat(),
+        "window_days": UPCOMING_WINDOW_DAYS,
+        "events": [
+            occurrence.to_payload() for occurrence in upcoming[:UPCOMING_MAX_EVENTS]
+        ],
+    }
+
+
+def remove_stale_shards(shard_directory: Path, current_keys: set[str]) -> list[Path]:
+    removed_paths: list[Path] = []
+    for shard_path in sorted(shard_directory.glob("*.json")):
+        if not SHARD_FILE_NAME_PATTERN.match(shard_path.name):
+            continue
+        if shard_path.stem not in current_keys:
+            shard_path.unlink()
+            removed_paths.append(shard_path)
+    return removed_paths
+# End Feed Generation
+
+
+# Begin Main
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Generate month-sharded calendar feeds from calendar-events.json.",
+    )
+    parser.add_argument(
+        "--site-root",
+        default="",
+        help="Optional explicit site root. Defaults to parent of aws/ directory.",
+    )
+    parser.add_argument(
+        "--timezone",
+        default=TIMEZONE_NAME_DEFAULT,
+        help="Timezone name used to determine today's date.",
+    )
+    parser.add_argument(
+        "--today",
+        default="",
+        help="Override today's date (YYYY-MM-DD) for the upcoming digest.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Validate and expand events, but do not write output files.",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Enable debug logging.",
+    )
+    args = parser.parse_args()
+
+    configure_logging(args.verbose)
+
+    script_path = Path(__file__)
+    if args.site_root:
+        site_root = Path(args.site_root).resolve()
+    else:
+        site_root = get_site_root(script_path)
+
+    if not site_root.exists():
+        logging.error("Site root does not exist: %s", site_root)
+        return 2
+
+    if args.today:
+        today = parse_iso_date(args.today)
+        if today is None:
+            logging.error("Invalid --today value: %s", args.today)
+            return 2
+    else:
+        today = get_today_local(args.timezone)
+
+    source_path = site_root / SOURCE_EVENTS_RELATIVE_PATH
+    shard_directory = site_root / OUTPUT_SHARD_DIRECTORY_RELATIVE_PATH
+
+    logging.info("Site root: %s", site_root)
+    logging.info("Source events: %s", source_path)
+    logging.info("Shard directory: %s", shard_directory)
+
+    try:
+        source_events = json.loads(source_path.read_text(encoding="utf-8"))
+    except Exception as exception_value:
+        logging.error("Failed reading %s (%s)", source_path, exception_value)
+        return 1
+
+    if not isinstance(source_events, list):
+        logging.error("%s must contain a JSON array of events.", source_path)
+        return 1
+
+    validation_errors: list[str] = []
+    for position, event in enumerate(source_events):
+        validation_errors.extend(validate_event(position, event))
+    if validation_errors:
+        for error_text in validation_errors:
+            logging.error("%s", error_text)
+        logging.error("Validation failed: %d error(s).", len(validation_errors))
+        return 1
+
+    horizon_date = today + timedelta(days=RECURRENCE_HORIZON_DAYS)
+    occurrences: list[EventOccurrence] = []
+    for event in source_events:
+        occurrences.extend(expand_event(event, horizon_date))
+    occurrences.sort(
+        key=lambda occurrence: (
+            occurrence.start_date,
+            occurrence.end_date,
+            str(occurrence.fields.get("name", "")),
+        )
+    )
+    logging.info(
+        "Source events: %d, occurrences after expansion: %d",
+        len(source_events),
+        len(occurrences),
+    )
+
+    shards = build_month_shards(occurrences, today, horizon_date)
+    upcoming_digest = build_upcoming_digest(occurrences, today)
+    months_payload = {
+        "months": [
+            {"month": key, "event_count": len(shard_events)}
+            for key, shard_events in shards.items()
+        ],
+    }
+    logging.info("Month shards: %d", len(shards))
+    logging.info("Upcoming events: %d", len(upcoming_digest["events"]))
+
+    if args.dry_run:
+        logging.info("Dry run enabled; no files written.")
+        return 0
+
+    ensure_directory(shard_directory)
+    for key, shard_events in shards.items():
+        shard_path = shard_directory / f"{key}.json"
+        if write_json_if_changed(shard_path, shard_events):
+            logging.info("Wrote shard: %s", shard_path)
+
+    for removed_path in remove_stale_shards(shard_directory, set(shards)):
+        logging.info("Removed stale shard: %s", removed_path)
+
+    if write_json_if_changed(shard_directory / MONTHS_FILE_NAME, months_payload):
+        logging.info("Wrote month list: %s", shard_directory / MONTHS_FILE_NAME)
+    if write_json_if_changed(shard_directory / UPCOMING_FILE_NAME, upcoming_digest):
+        logging.info("Wrote upcoming digest: %s", shard_directory / UPCOMING_FILE_NAME)
+
+    logging.info("Done.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
+# End Main
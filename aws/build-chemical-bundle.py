@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+"""
+build-chemical-bundle.py
+
+Validate every per-chemical flame colorant JSON file and generate:
+- assets/json-data/flame-colorant-chemicals-bundle.json
+- assets/json-data/flame-colorant-chemicals-bundle.json.gz
+- assets/json-data/flame-colorant-chemicals-bundle.json.br  (if brotli is installed)
+- assets/json-data/flame-colorant-chemicals-bundle-manifest.json
+
+The bundle is one compact JSON object keyed by chemical file name, so the
+detail page (motor-color-chemical-details.html?file=...) can switch between
+chemicals without another request. The manifest records the byte offset and
+length of every record inside the bundle, plus the sha256 of each source
+file. When no source file has changed the bundle is not rebuilt.
+
+Designed to live in: <site-root>/aws/build-chemical-bundle.py
+Run from anywhere:
+  python3 aws/build-chemical-bundle.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import logging
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    import brotli  # type: ignore[import-not-found]
+except Exception:
+    brotli = None  # type: ignore[assignment]
+
+
+# Begin Configuration
+BUNDLE_FORMAT_VERSION = 1
+
+CHEMICAL_DIRECTORY_RELATIVE_PATH = Path("assets/json-data")
+OUTPUT_BUNDLE_RELATIVE_PATH = Path(
+    "assets/json-data/flame-colorant-chemicals-bundle.json"
+)
+OUTPUT_MANIFEST_RELATIVE_PATH = Path(
+    "assets/json-data/flame-colorant-chemicals-bundle-manifest.json"
+)
+
+WRITE_GZIP = True
+WRITE_BROTLI = True
+GZIP_COMPRESS_LEVEL = 9
+BROTLI_QUALITY = 11
+
+CHEMICAL_FILE_NAME_PATTERN = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*\.json$")
+
+REQUIRED_FIELDS = [
+    "id",
+    "chemical_name",
+    "chemical_compound",
+    "flame_color",
+    "burn_contribution",
+    "color_saturation",
+    "last_updated",
+]
+
+ALLOWED_VALUES = {
+    "burn_contribution": [
+        "oxidizer",
+        "fuel",
+        "neutral",
+        "binder",
+        "plasticizer",
+        "curative",
+        "color_donor",
+    ],
+    "burn_modification": [
+        "burn_accelerant",
+        "burn_inhibitor",
+        "neutral",
+        "pressure_sensitive",
+        "temperature_sensitive",
+        "slag_former",
+        "smoke_reducer",
+        "smoke_enhancer",
+        "spark_producer",
+    ],
+    "color_saturation": ["high", "medium", "low"],
+    "apcp_compatibility": ["suitable", "limited", "unsuitable"],
+}
+
+LIST_FIELDS = ["other_references", "procurement_sources"]
+# End Configuration
+
+
+# Begin Logging Setup
+def configure_logging(verbose: bool) -> None:
+    log_level = logging.DEBUG if verbose else logging.INFO
+    logging.basicConfig(level=log_level, format="%(levelname)s: %(message)s")
+# End Logging Setup
+
+
+# Begin Helpers
+def get_site_root(script_path: Path) -> Path:
+    aws_directory = script_path.resolve().parent
+    site_root = aws_directory.parent
+    return site_root
+
+
+def compute_sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def ensure_parent_directory(file_path: Path) -> None:
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+
+
+def compact_json(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def read_json_file(file_path: Path) -> Optional[Any]:
+    try:
+        return json.loads(file_path.read_text(encoding="utf-8"))
+    except Exception as exception_value:
+        logging.debug("Skipping unreadable JSON: %s (%s)", file_path, exception_value)
+        return None
+
+
+def is_chemical_record(payload: Any) -> bool:
+    return (
+        isinstance(payload, dict)
+        and "chemical_name" in payload
+        and "chemical_compound" in payload
+    )
+# End Helpers
+
+
+# Begin Data Model
+@dataclass(frozen=True)
+class ChemicalSource:
+    file_name: str
+    payload: dict[str, Any]
+    source_sha256: str
+# End Data Model
+
+
+# Begin Discovery And Validation
+def gather_chemical_sources(chemical_directory: Path) -> list[ChemicalSource]:
+    generated_names = {
+        OUTPUT_BUNDLE_RELATIVE_PATH.name,
+        OUTPUT_MANIFEST_RELATIVE_PATH.name,
+    }
+
+    sources: list[ChemicalSource] = []
+    for file_path in sorted(chemical_directory.glob("*.json")):
+        if file_path.name in generated_names:
+            continue
+
+        raw_bytes = file_path.read_bytes()
+        try:
+            payload = json.loads(raw_bytes.decode("utf-8"))
+        except Exception:
+            logging.debug("Skipping non-JSON file: %s", file_path.name)
+            continue
+
+        if not is_chemical_record(payload):
+            continue
+
+        sources.append(
+            ChemicalSource(
+                file_name=file_path.name,
+                payload=payload,
+                source_sha256=compute_sha256(raw_bytes),
+            )
+        )
+
+    return sources
+
+
+def validate_chemical_source(source: ChemicalSource) -> list[str]:
+    errors: list[str] = []
+    payload = source.payload
+
+    if not CHEMICAL_FILE_NAME_PATTERN.match(source.file_name):
+        errors.append("file name must be lower-case-with-dashes-only")
+
+    for field_name in REQUIRED_FIELDS:
+        field_value = payload.get(field_name)
+        if not isinstance(field_value, str) or not field_value.strip():
+            errors.append(f"{field_name}: required non-empty string")
+
+    for field_name, allowed_values in ALLOWED_VALUES.items():
+        field_value = payload.get(field_name)
+        if field_value is None:
+            continue
+        if field_value not in allowed_values:
+            errors.append(
+                f"{field_name}: {field_value!r} not in {', '.join(allowed_values)}"
+            )
+
+    hygroscopic_value = payload.get("hygroscopic")
+    if hygroscopic_value is not None and not isinstance(hygroscopic_value, bool):
+        errors.append("hygroscopic: must be true, false or null")
+
+    for field_name in LIST_FIELDS:
+        field_value = payload.get(field_name)
+        if field_value is not None and not isinstance(field_value, list):
+            errors.append(f"{field_name}: must be an array")
+
+    return errors
+
+
+def validate_chemical_sources(sources: list[ChemicalSource]) -> list[str]:
+    errors: list[str] = []
+    seen_ids: dict[str, str] = {}
+
+    for source in sources:
+        for error_text in validate_chemical_source(source):
+            errors.append(f"{source.file_name}: {error_text}")
+
+        record_id = source.payload.get("id")
+        if isinstance(record_id, str) and record_id:
+            if record_id in seen_ids:
+                errors.append(
+                    f"{source.file_name}: id {record_id} already used by "
+                    f"{seen_ids[record_id]}"
+                )
+            else:
+                seen_ids[record_id] = source.file_name
+
+    return errors
+# End Discovery And Validation
+
+
+# Begin Bundle Generation
+def build_bundle(
+    sources: list[ChemicalSource],
+) -> tuple[bytes, dict[str, dict[str, Any]]]:
+    """
+    Build the compact bundle text by hand so the byte offset and length of
+    every record are known without re-parsing the output.
+    """
+    encoded_parts: list[bytes] = []
+    record_index: dict[str, dict[str, Any]] = {}
+
+    header = compact_json({"version": BUNDLE_FORMAT_VERSION})[:-1]
+    encoded_parts.append((header + ',"chemicals":{').encode("utf-8"))
+    current_offset = len(encoded_parts[0])
+
+    for position, source in enumerate(sources):
+        separator = "," if position else ""
+        key_text = separator + compact_json(source.file_name) + ":"
+        key_bytes = key_text.encode("utf-8")
+        record_bytes = compact_json(source.payload).encode("utf-8")
+
+        current_offset += len(key_bytes)
+        record_index[source.file_name] = {
+            "offset": current_offset,
+            "length": len(record_bytes),
+            "source_sha256": source.source_sha256,
+        }
+        current_offset += len(record_bytes)
+
+        encoded_parts.append(key_bytes)
+        encoded_parts.append(record_bytes)
+
+    encoded_parts.append(b"}}")
+    return b"".join(encoded_parts), record_index
+
+
+def build_manifest(
+    bundle_bytes: bytes,
+    record_index: dict[str, dict[str, Any]],
+) -> dict[str, Any]:
+    return {
+        "version": BUNDLE_FORMAT_VERSION,
+        "bundle": OUTPUT_BUNDLE_RELATIVE_PATH.name,
+        "bundle_sha256": compute_sha256(bundle_bytes),
+        "bundle_bytes": len(bundle_bytes),
+        "records": record_index,
+    }
+
+
+def compressed_sibling_paths(bundle_path: Path) -> list[Path]:
+    sibling_paths: list[Path] = []
+    if WRITE_GZIP:
+        sibling_paths.append(bundle_path.with_name(bundle_path.name + ".gz"))
+    if WRITE_BROTLI and brotli is not None:
+        sibling_paths.append(bundle_path.with_name(bundle_path.name + ".br"))
+    return sibling_paths
+
+
+def is_bundle_current(
+    bundle_path: Path,
+    manifest_path: Path,
+    sources: list[ChemicalSource],
+) -> bool:
+    if not bundle_path.exists():
+        return False
+    for sibling_path in compressed_sibling_paths(bundle_path):
+        if not sibling_path.exists():
+            return False
+
+    manifest = read_json_file(manifest_path)
+    if not isinstance(manifest, dict):
+        return False
+    if manifest.get("version") != BUNDLE_FORMAT_VERSION:
+        return False
+
+    recorded_records = manifest.get("records") or {}
+    current_hashes = {source.file_name: source.source_sha256 for source in sources}
+    recorded_hashes = {
+        file_name: (entry or {}).get("source_sha256")
+        for file_name, entry in recorded_records.items()
+    }
+    if current_hashes != recorded_hashes:
+        return False
+
+    return compute_sha256(bundle_path.read_bytes()) == manifest.get("bundle_sha256")
+
+
+def write_bundle_outputs(
+    bundle_path: Path,
+    manifest_path: Path,
+    bundle_bytes: bytes,
+    manifest: dict[str, Any],
+) -> None:
+    ensure_parent_directory(bundle_path)
+    bundle_path.write_bytes(bundle_bytes)
+    logging.info("Wrote bundle: %s (%d bytes)", bundle_path, len(bundle_bytes))
+
+    if WRITE_GZIP:
+        gzip_path = bundle_path.with_name(bundle_path.name + ".gz")
+        # mtime=0 keeps the gzip output byte-identical for identical input.
+        gzip_bytes = gzip.compress(
+            bundle_bytes,
+            compresslevel=GZIP_COMPRESS_LEVEL,
+            mtime=0,
+        )
+        gzip_path.write_bytes(gzip_bytes)
+        logging.info("Wrote gzip bundle: %s (%d bytes)", gzip_path, len(gzip_bytes))
+
+    if WRITE_BROTLI:
+        if brotli is None:
+            logging.info("brotli module not installed; skipping .br output.")
+        else:
+            brotli_path = bundle_path.with_name(bundle_path.name + ".br")
+            brotli_bytes = brotli.compress(bundle_bytes, quality=BROTLI_QUALITY)
+            brotli_path.write_bytes(brotli_bytes)
+            logging.info(
+                "Wrote brotli bundle: %s (%d bytes)",
+                brotli_path,
+                len(brotli_bytes),
+            )
+
+    manifest_text = json.dumps(manifest, indent=2, ensure_ascii=False) + "\n"
+    manifest_path.write_text(manifest_text, encoding="utf-8")
+    logging.info("Wrote manifest: %s", manifest_path)
+# End Bundle Generation
+
+
+# Begin Main
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Validate chemical JSON files and build the chemical bundle.",
+    )
+    parser.add_argument(
+        "--site-root",
+        default="",
+        help="Optional explicit site root. Defaults to parent of aws/ directory.",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild the bundle even if no source file has changed.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Discover and validate files, but do not write output files.",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Enable debug logging.",
+    )
+    args = parser.parse_args()
+
+    configure_logging(args.verbose)
+
+    script_path = Path(__file__)
+    if args.site_root:
+        site_root = Path(args.site_root).resolve()
+    else:
+        site_root = get_site_root(script_path)
+
+    if not site_root.exists():
+        logging.error("Site root does not exist: %s", site_root)
+        return 2
+
+    chemical_directory = site_root / CHEMICAL_DIRECTORY_RELATIVE_PATH
+    bundle_path = site_root / OUTPUT_BUNDLE_RELATIVE_PATH
+    manifest_path = site_root / OUTPUT_MANIFEST_RELATIVE_PATH
+
+    logging.info("Site root: %s", site_root)
+    logging.info("Chemical directory: %s", chemical_directory)
+
+    sources = gather_chemical_sources(chemical_directory)
+    logging.info("Chemical files discovered: %d", len(sources))
+
+    validation_errors = validate_chemical_sources(sources)
+    if validation_errors:
+        for error_text in validation_errors:
+            logging.error("%s", error_text)
+        logging.error("Validation failed: %d error(s).", len(validation_errors))
+        return 1
+
+    if not args.force and is_bundle_current(bundle_path, manifest_path, sources):
+        logging.info("No chemical file changed; bundle is up to date.")
+        return 0
+
+    bundle_bytes, record_index = build_bundle(sources)
+    manifest = build_manifest(bundle_bytes, record_index)
+
+    if args.dry_run:
+        logging.info(
+            "Dry run enabled; bundle would be %d bytes. No files written.",
+            len(bundle_bytes),
+        )
+        return 0
+
+    write_bundle_outputs(bundle_path, manifest_path, bundle_bytes, manifest)
+
+    logging.info("Done.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
+# End Main
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+build-chemical-index.py
+
+Regenerate (from the per-chemical JSON files):
+- assets/json-data/flame-colorant-chemicals-index.json
+
+The index summary fields (flame_color, color_density, color_saturation,
+burn_contribution, details_url, ...) are copied from each chemical file so
+they can no longer drift. The output also carries precomputed groupings:
+
+  "groups": {
+    "by_flame_color":        {"green": [0, 1, 2], ...},
+    "by_burn_contribution":  {"oxidizer": [2, ...], ...}
+  }
+
+Each grouping value is a list of positions into the "chemicals" array, so
+the list page can filter without scanning every entry.
+
+The run is incremental: a small state file remembers the mtime, size and
+sha256 of every JSON file in the chemical directory together with its
+extracted summary. Files whose mtime and size are unchanged are not read.
+The index is written only when its content actually changes.
+
+Designed to live in: <site-root>/aws/build-chemical-index.py
+Run from anywhere:
+  python3 aws/build-chemical-index.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Optional
+
+
+# Begin Configuration
+STATE_FORMAT_VERSION = 1
+
+CHEMICAL_DIRECTORY_RELATIVE_PATH = Path("assets/json-data")
+OUTPUT_INDEX_RELATIVE_PATH = Path(
+    "assets/json-data/flame-colorant-chemicals-index.json"
+)
+STATE_FILE_RELATIVE_PATH = Path("aws/.build-cache/chemical-index-state.json")
+
+DETAILS_URL_PREFIX = "/motor-color-chemical-details.html?file="
+
+# Files in the chemical directory that are generated, never chemical sources.
+GENERATED_FILE_NAMES = [
+    "flame-colorant-chemicals-index.json",
+    "flame-colorant-chemicals-bundle.json",
+    "flame-colorant-chemicals-bundle-manifest.json",
+]
+
+# Key order of each index entry (matches the historical hand-written index).
+INDEX_ENTRY_FIELDS = [
+    "id",
+    "chemical_name",
+    "file_name",
+    "flame_color",
+    "color_density",
+    "apcp_compatibility",
+    "color_saturation",
+    "strong_emitter",
+    "burn_contribution",
+    "details_url",
+]
+
+GROUP_FIELDS = {
+    "by_flame_color": "flame_color",
+    "by_burn_contribution": "burn_contribution",
+}
+# End Configuration
+
+
+# Begin Logging Setup
+def configure_logging(verbose: bool) -> None:
+    log_level = logging.DEBUG if verbose else logging.INFO
+    logging.basicConfig(level=log_level, format="%(levelname)s: %(message)s")
+# End Logging Setup
+
+
+# Begin Helpers
+def get_site_root(script_path: Path) -> Path:
+    aws_directory = script_path.resolve().parent
+    site_root = aws_directory.parent
+    return site_root
+
+
+def compute_sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def ensure_parent_directory(file_path: Path) -> None:
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+
+
+def is_chemical_record(payload: Any) -> bool:
+    return (
+        isinstance(payload, dict)
+        and "chemical_name" in payload
+        and "chemical_compound" in payload
+    )
+# End Helpers
+
+
+# Begin State Handling
+def load_state(state_path: Path) -> dict[str, dict[str, Any]]:
+    try:
+        state = json.loads(state_path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    if not isinstance(state, dict) or state.get("version") != STATE_FORMAT_VERSION:
+        return {}
+    files = state.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def write_state(state_path: Path, files_state: dict[str, dict[str, Any]]) -> None:
+    ensure_parent_directory(state_path)
+    state = {"version": STATE_FORMAT_VERSION, "files": files_state}
+    state_path.write_text(
+        json.dumps(state, indent=2, sort_keys=True) + "\n",
+        encoding="utf-8",
+    )
+# End State Handling
+
+
+# Begin Summary Extraction
+def build_index_entry(file_name: str, payload: dict[str, Any]) -> dict[str, Any]:
+    entry: dict[str, Any] = {}
+    for field_name in INDEX_ENTRY_FIELDS:
+        if field_name == "file_name":
+            entry[field_name] = file_name
+        elif field_name == "details_url":
+            entry[field_name] = DETAILS_URL_PREFIX + file_name
+        else:
+            entry[field_name] = payload.get(field_name)
+    return entry
+
+
+def scan_chemical_file(file_path: Path) -> dict[str, Any]:
+    """
+    Read one JSON file and return its state record. Non-chemical and
+    unparseable files are remembered too, so they are skipped next run.
+    """
+    raw_bytes = file_path.read_bytes()
+    stat_result = file_path.stat()
+    record: dict[str, Any] = {
+        "mtime_ns": stat_result.st_mtime_ns,
+        "size": stat_result.st_size,
+        "sha256": compute_sha256(raw_bytes),
+        "entry": None,
+        "last_updated": None,
+    }
+
+    try:
+        payload = json.loads(raw_bytes.decode("utf-8"))
+    except Exception:
+        logging.debug("Skipping non-JSON file: %s", file_path.name)
+        return record
+
+    if is_chemical_record(payload):
+        record["entry"] = build_index_entry(file_path.name, payload)
+        record["last_updated"] = payload.get("last_updated")
+    return record
+
+
+def refresh_state(
+    chemical_directory: Path,
+    previous_state: dict[str, dict[str, Any]],
+) -> tuple[dict[str, dict[str, Any]], int]:
+    """
+    Return the new per-file state and the number of files actually read.
+    """
+    new_state: dict[str, dict[str, Any]] = {}
+    files_read = 0
+
+    for file_path in sorted(chemical_directory.glob("*.json")):
+        if file_path.name in GENERATED_FILE_NAMES:
+            continue
+
+        previous_record = previous_state.get(file_path.name)
+        stat_result = file_path.stat()
+        if (
+            previous_record is not None
+            and previous_record.get("mtime_ns") == stat_result.st_mtime_ns
+            and previous_record.get("size") == stat_result.st_size
+        ):
+            new_state[file_path.name] = previous_record
+            continue
+
+        scanned_record = scan_chemical_file(file_path)
+        files_read += 1
+
+        if (
+            previous_record is not None
+            and previous_record.get("sha256") == scanned_record["sha256"]
+        ):
+            logging.debug("Touched but unchanged: %s", file_path.name)
+        else:
+            logging.debug("Changed: %s", file_path.name)
+
+        new_state[file_path.name] = scanned_record
+
+    return new_state, files_read
+# End Summary Extraction
+
+
+# Begin Index Generation
+def build_index_payload(files_state: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    entries: list[dict[str, Any]] = []
+    last_updated_values: list[str] = []
+
+    for record in files_state.values():
+        entry = record.get("entry")
+        if not entry:
+            continue
+        # Re-apply the field order; the state file is written with sorted keys.
+        entries.append(
+            {field_name: entry.get(field_name) for field_name in INDEX_ENTRY_FIELDS}
+        )
+        last_updated_value = record.get("last_updated")
+        if isinstance(last_updated_value, str) and last_updated_value:
+            last_updated_values.append(last_updated_value)
+
+    entries.sort(
+        key=lambda entry: (
+            (entry.get("chemical_name") or "").lower(),
+            entry["file_name"],
+        )
+    )
+
+    groups: dict[str, dict[str, list[int]]] = {}
+    for group_name, field_name in GROUP_FIELDS.items():
+        grouping: dict[str, list[int]] = {}
+        for position, entry in enumerate(entries):
+            group_key = entry.get(field_name) or "unknown"
+            grouping.setdefault(str(group_key), []).append(position)
+        groups[group_name] = dict(sorted(grouping.items()))
+
+    # ISO 8601 UTC timestamps sort lexically, so max() is the newest record.
+    last_updated = max(last_updated_values) if last_updated_values else ""
+
+    return {
+        "chemicals": entries,
+        "groups": groups,
+        "last_updated": last_updated,
+    }
+
+
+def render_index_text(payload: dict[str, Any]) -> str:
+    return json.dumps(payload, indent=2, ensure_ascii=False) + "\n"
+
+
+def read_existing_text(file_path: Path) -> Optional[str]:
+    try:
+        return file_path.read_text(encoding="utf-8")
+    except Exception:
+        return None
+# End Index Generation
+
+
+# Begin Main
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Regenerate flame-colorant-chemicals-index.json from chemical files.",
+    )
+    parser.add_argument(
+        "--site-root",
+        default="",
+        help="Optional explicit site root. Defaults to parent of aws/ directory.",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Ignore the saved state and re-read every chemical file.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Scan files and report changes, but do not write output files.",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Enable debug logging.",
+    )
+    args = parser.parse_args()
+
+    configure_logging(args.verbose)
+
+    script_path = Path(__file__)
+    if args.site_root:
+        site_root = Path(args.site_root).resolve()
+    else:
+        site_root = get_site_root(script_path)
+
+    if not site_root.exists():
+        logging.error("Site root does not exist: %s", site_root)
+        return 2
+
+    chemical_directory = site_root / CHEMICAL_DIRECTORY_RELATIVE_PATH
+    output_index_path = site_root / OUTPUT_INDEX_RELATIVE_PATH
+    state_path = site_root / STATE_FILE_RELATIVE_PATH
+
+    logging.info("Site root: %s", site_root)
+    logging.info("Output index: %s", output_index_path)
+
+    previous_state = {} if args.full else load_state(state_path)
+    files_state, files_read = refresh_state(chemical_directory, previous_state)
+
+    chemical_count = sum(1 for record in files_state.values() if record.get("entry"))
+    logging.info(
+        "Chemical files: %d (files read this run: %d)",
+        chemical_count,
+        files_read,
+    )
+
+    index_text = render_index_text(build_index_payload(files_state))
+    index_changed = read_existing_text(output_index_path) != index_text
+
+    if args.dry_run:
+        logging.info(
+            "Dry run enabled; index %s. No files written.",
+            "would change" if index_changed else "is unchanged",
+        )
+        return 0
+
+    if index_changed:
+        ensure_parent_directory(output_index_path)
+        output_index_path.write_text(index_text, encoding="utf-8")
+        logging.info("Wrote index: %s", output_index_path)
+    else:
+        logging.info("Index unchanged: %s", output_index_path)
+
+    write_state(state_path, files_state)
+
+    logging.info("Done.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
+# End Main
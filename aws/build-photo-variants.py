@@ -0,0 +1,493 @@
+#!/usr/bin/env python3
+"""
+build-photo-variants.py
+
+Generate responsive image variants for the photo manifests:
+- assets/json-data/photos.json
+- assets/json-data/flicker-rotating-photos.json
+
+For every image entry ("fullsize" URL or site path) this writes:
+- assets/img/photos/<hash>-<width>w.webp  for each configured width
+- assets/img/photos/<hash>-<width>w.avif  (when Pillow has AVIF support)
+- a tiny blurred placeholder, inlined as a data URI
+
+and adds a "responsive" object to the entry:
+
+  "responsive": {
+    "source_sha256": "...",
+    "width": 6000,
+    "height": 4000,
+    "placeholder": "data:image/webp;base64,...",
+    "fallback": "/assets/img/photos/<hash>-960w.webp",
+    "srcset": {
+      "avif": "/assets/img/photos/<hash>-320w.avif 320w, ...",
+      "webp": "/assets/img/photos/<hash>-320w.webp 320w, ..."
+    }
+  }
+
+Variant file names start with the source content hash, so they can be served
+with long-lived cache headers. Remote originals are downloaded once into
+aws/.build-cache/photo-originals/. Entries whose source hash matches the
+recorded "source_sha256" and whose variant files exist are skipped.
+
+Requires Pillow (pip install pillow).
+
+Designed to live in: <site-root>/aws/build-photo-variants.py
+Run from anywhere:
+  python3 aws/build-photo-variants.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import hashlib
+import io
+import json
+import logging
+import urllib.request
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    from PIL import Image, ImageFilter, ImageOps, features
+except Exception:
+    Image = None  # type: ignore[assignment]
+
+
+# Begin Configuration
+MANIFEST_RELATIVE_PATHS = [
+    Path("assets/json-data/photos.json"),
+    Path("assets/json-data/flicker-rotating-photos.json"),
+]
+
+OUTPUT_VARIANT_DIRECTORY_RELATIVE_PATH = Path("assets/img/photos")
+ORIGINAL_CACHE_DIRECTORY_RELATIVE_PATH = Path("aws/.build-cache/photo-originals")
+
+SOURCE_FIELD = "fullsize"
+RESPONSIVE_FIELD = "responsive"
+
+VARIANT_WIDTHS = [320, 640, 960, 1600]
+FALLBACK_WIDTH = 960
+
+WEBP_QUALITY = 80
+AVIF_QUALITY = 55
+WRITE_AVIF = True
+
+PLACEHOLDER_WIDTH = 24
+PLACEHOLDER_BLUR_RADIUS = 2
+PLACEHOLDER_QUALITY = 40
+
+DOWNLOAD_TIMEOUT_SECONDS = 60
+DOWNLOAD_USER_AGENT = "rocketgeek-build-photo-variants/1.0"
+
+HASH_PREFIX_LENGTH = 16
+# End Configuration
+
+
+# Begin Logging Setup
+def configure_logging(verbose: bool) -> None:
+    log_level = logging.DEBUG if verbose else logging.INFO
+    logging.basicConfig(level=log_level, format="%(levelname)s: %(message)s")
+# End Logging Setup
+
+
+# Begin Helpers
+def get_site_root(script_path: Path) -> Path:
+    aws_directory = script_path.resolve().parent
+    site_root = aws_directory.parent
+    return site_root
+
+
+def compute_sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def ensure_directory(directory_path: Path) -> None:
+    directory_path.mkdir(parents=True, exist_ok=True)
+
+
+def is_remote_source(source_value: str) -> bool:
+    return source_value.startswith(("http://", "https://"))
+
+
+def to_site_url(site_root: Path, file_path: Path) -> str:
+    return "/" + file_path.resolve().relative_to(site_root.resolve()).as_posix()
+
+
+def avif_supported() -> bool:
+    if not WRITE_AVIF or Image is None:
+        return False
+    try:
+        return bool(features.check("avif"))
+    except Exception:
+        return False
+# End Helpers
+
+
+# Begin Source Retrieval
+def original_cache_path(cache_directory: Path, source_url: str) -> Path:
+    url_hash = compute_sha256(source_url.encode("utf-8"))[:24]
+    suffix = Path(source_url.split("?", 1)[0]).suffix.lower() or ".img"
+    return cache_directory / f"{url_hash}{suffix}"
+
+
+def download_original(source_url: str, target_path: Path) -> None:
+    request = urllib.request.Request(
+        source_url,
+        headers={"User-Agent": DOWNLOAD_USER_AGENT},
+    )
+    with urllib.request.urlopen(request, timeout=DOWNLOAD_TIMEOUT_SECONDS) as response:
+        data = response.read()
+    ensure_directory(target_path.parent)
+    temporary_path = target_path.with_name(target_path.name + ".part")
+    temporary_path.write_bytes(data)
+    temporary_path.replace(target_path)
+
+
+def read_source_bytes(
+    site_root: Path,
+    cache_directory: Path,
+    source_value: str,
+    refresh_remote: bool,
+) -> Optional[bytes]:
+    if is_remote_source(source_value):
+        cached_path = original_cache_path(cache_directory, source_value)
+        if refresh_remote or not cached_path.exists():
+            logging.info("Downloading: %s", source_value)
+            try:
+                download_original(source_value, cached_path)
+            except Exception as exception_value:
+                logging.warning(
+                    "Failed downloading %s (%s)",
+                    source_value,
+                    exception_value,
+                )
+                return None
+        return cached_path.read_bytes()
+
+    local_path = site_root / source_value.lstrip("/")
+    if not local_path.is_file():
+        logging.warning("Local image not found: %s", local_path)
+        return None
+    return local_path.read_bytes()
+# End Source Retrieval
+
+
+# Begin Variant Generation
+@dataclass(frozen=True)
+class VariantPlan:
+    width: int
+    image_format: str
+    output_path: Path
+
+
+def plan_variants(
+    variant_directory: Path,
+    source_sha256: str,
+    source_width: int,
+    formats: list[str],
+) -> list[VariantPlan]:
+    # Never upscale: widths larger than the original collapse to the original.
+    widths = sorted({min(width, source_width) for width in VARIANT_WIDTHS})
+    name_prefix = source_sha256[:HASH_PREFIX_LENGTH]
+    plans: list[VariantPlan] = []
+    for image_format in formats:
+        for width in widths:
+            output_path = variant_directory / f"{name_prefix}-{width}w.{image_format}"
+            plans.append(VariantPlan(width, image_format, output_path))
+    return plans
+
+
+def encode_variant(source_image: Any, plan: VariantPlan) -> bytes:
+    target_height = max(1, round(source_image.height * plan.width / source_image.width))
+    resized_image = source_image.resize(
+        (plan.width, target_height),
+        Image.Resampling.LANCZOS,
+    )
+    output_buffer = io.BytesIO()
+    if plan.image_format == "avif":
+        resized_image.save(output_buffer, format="AVIF", quality=AVIF_QUALITY)
+    else:
+        resized_image.save(output_buffer, format="WEBP", quality=WEBP_QUALITY, method=6)
+    return output_buffer.getvalue()
+
+
+def build_placeholder(source_image: Any) -> str:
+    placeholder_height = max(
+        1,
+        round(source_image.height * PLACEHOLDER_WIDTH / source_image.width),
+    )
+    tiny_image = source_image.resize(
+        (PLACEHOLDER_WIDTH, placeholder_height),
+        Image.Resampling.BILINEAR,
+    ).filter(ImageFilter.GaussianBlur(PLACEHOLDER_BLUR_RADIUS))
+    output_buffer = io.BytesIO()
+    tiny_image.save(output_buffer, format="WEBP", quality=PLACEHOLDER_QUALITY)
+    encoded = base64.b64encode(output_buffer.getvalue()).decode("ascii")
+    return "data:image/webp;base64," + encoded
+
+
+def open_source_image(source_bytes: bytes) -> Any:
+    source_image = Image.open(io.BytesIO(source_bytes))
+    # Apply camera orientation so variants are not rotated incorrectly.
+    source_image = ImageOps.exif_transpose(source_image)
+    if source_image.mode not in ("RGB", "RGBA"):
+        source_image = source_image.convert("RGB")
+    return source_image
+
+
+def build_responsive_entry(
+    site_root: Path,
+    source_image: Any,
+    source_sha256: str,
+    plans: list[VariantPlan],
+    dry_run: bool,
+) -> dict[str, Any]:
+    srcset_parts: dict[str, list[str]] = {}
+    for plan in plans:
+        if not dry_run and not plan.output_path.exists():
+            plan.output_path.write_bytes(encode_variant(source_image, plan))
+            logging.debug("Wrote variant: %s", plan.output_path)
+        variant_url = to_site_url(site_root, plan.output_path)
+        srcset_parts.setdefault(plan.image_format, []).append(
+            f"{variant_url} {plan.width}w"
+        )
+
+    webp_plans = [plan for plan in plans if plan.image_format == "webp"]
+    fallback_plan = min(
+        webp_plans,
+        key=lambda plan: (abs(plan.width - FALLBACK_WIDTH), plan.width),
+    )
+
+    return {
+        "source_sha256": source_sha256,
+        "width": source_image.width,
+        "height": source_image.height,
+        "placeholder": build_placeholder(source_image),
+        "fallback": to_site_url(site_root, fallback_plan.output_path),
+        "srcset": {
+            image_format: ", ".join(parts)
+            for image_format, parts in sorted(srcset_parts.items())
+        },
+    }
+
+
+def is_entry_current(
+    site_root: Path,
+    responsive_entry: Any,
+    source_sha256: str,
+) -> bool:
+    if not isinstance(responsive_entry, dict):
+        return False
+    if responsive_entry.get("source_sha256") != source_sha256:
+        return False
+    for srcset_value in (responsive_entry.get("srcset") or {}).values():
+        for candidate in str(srcset_value).split(","):
+            variant_url = candidate.strip().split(" ", 1)[0]
+            if not (site_root / variant_url.lstrip("/")).is_file():
+                return False
+    return True
+# End Variant Generation
+
+
+# Begin Manifest Processing
+def process_manifest(
+    site_root: Path,
+    manifest_path: Path,
+    variant_directory: Path,
+    cache_directory: Path,
+    formats: list[str],
+    refresh_remote: bool,
+    dry_run: bool,
+    responsive_by_source: dict[str, dict[str, Any]],
+) -> tuple[int, int, int]:
+    """
+    Update one manifest in place. Returns (processed, skipped, failed) counts.
+    responsive_by_source shares results between manifests that list the same
+    image, so each source is decoded at most once per run.
+    """
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    images = manifest.get("images") if isinstance(manifest, dict) else None
+    if not isinstance(images, list):
+        logging.warning("No images array in %s", manifest_path)
+        return 0, 0, 0
+
+    processed_count = 0
+    skipped_count = 0
+    failed_count = 0
+
+    for image_entry in images:
+        source_value = image_entry.get(SOURCE_FIELD)
+        if not isinstance(source_value, str) or not source_value:
+            continue
+
+        if source_value in responsive_by_source:
+            image_entry[RESPONSIVE_FIELD] = responsive_by_source[source_value]
+            skipped_count += 1
+            continue
+
+        if dry_run and is_remote_source(source_value) and (
+            refresh_remote
+            or not original_cache_path(cache_directory, source_value).exists()
+        ):
+            # Only a download could tell whether it is current; assume not.
+            logging.info("Would download and process: %s", source_value)
+            processed_count += 1
+            continue
+
+        source_bytes = read_source_bytes(
+            site_root,
+            cache_directory,
+            source_value,
+            refresh_remote,
+        )
+        if source_bytes is None:
+            failed_count += 1
+            continue
+
+        source_sha256 = compute_sha256(source_bytes)
+        existing_entry = image_entry.get(RESPONSIVE_FIELD)
+        if is_entry_current(site_root, existing_entry, source_sha256):
+            responsive_by_source[source_value] = existing_entry
+            skipped_count += 1
+            continue
+
+        try:
+            source_image = open_source_image(source_bytes)
+            plans = plan_variants(
+                variant_directory,
+                source_sha256,
+                source_image.width,
+                formats,
+            )
+            responsive_entry = build_responsive_entry(
+                site_root,
+                source_image,
+                source_sha256,
+                plans,
+                dry_run,
+            )
+        except Exception as exception_value:
+            logging.warning(
+                "Failed processing image %s (%s)",
+                source_value,
+                exception_value,
+            )
+            failed_count += 1
+            continue
+
+        image_entry[RESPONSIVE_FIELD] = responsive_entry
+        responsive_by_source[source_value] = responsive_entry
+        processed_count += 1
+        logging.info("Processed: %s", source_value)
+
+    if not dry_run:
+        json_text = json.dumps(manifest, indent=2, ensure_ascii=False) + "\n"
+        if manifest_path.read_text(encoding="utf-8") != json_text:
+            manifest_path.write_text(json_text, encoding="utf-8")
+            logging.info("Updated manifest: %s", manifest_path)
+
+    return processed_count, skipped_count, failed_count
+# End Manifest Processing
+
+
+# Begin Main
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Generate responsive WebP/AVIF variants for the photo manifests.",
+    )
+    parser.add_argument(
+        "--site-root",
+        default="",
+        help="Optional explicit site root. Defaults to parent of aws/ directory.",
+    )
+    parser.add_argument(
+        "--refresh-remote",
+        action="store_true",
+        help="Re-download remote originals even if a cached copy exists.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help=(
+            "Report work without writing files or downloading remote "
+            "originals; uncached remote sources are counted as processed."
+        ),
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Enable debug logging.",
+    )
+    args = parser.parse_args()
+
+    configure_logging(args.verbose)
+
+    if Image is None:
+        logging.error("Pillow is required: pip install pillow")
+        return 2
+
+    script_path = Path(__file__)
+    if args.site_root:
+        site_root = Path(args.site_root).resolve()
+    else:
+        site_root = get_site_root(script_path)
+
+    if not site_root.exists():
+        logging.error("Site root does not exist: %s", site_root)
+        return 2
+
+    variant_directory = site_root / OUTPUT_VARIANT_DIRECTORY_RELATIVE_PATH
+    cache_directory = site_root / ORIGINAL_CACHE_DIRECTORY_RELATIVE_PATH
+
+    formats = ["webp"]
+    if avif_supported():
+        formats.insert(0, "avif")
+    else:
+        logging.info("AVIF encoding not available in Pillow; writing WebP only.")
+
+    logging.info("Site root: %s", site_root)
+    logging.info("Variant directory: %s", variant_directory)
+
+    if not args.dry_run:
+        ensure_directory(variant_directory)
+
+    responsive_by_source: dict[str, dict[str, Any]] = {}
+    total_failed = 0
+    for manifest_relative_path in MANIFEST_RELATIVE_PATHS:
+        manifest_path = site_root / manifest_relative_path
+        if not manifest_path.exists():
+            logging.warning("Manifest not found: %s", manifest_path)
+            continue
+
+        processed_count, skipped_count, failed_count = process_manifest(
+            site_root=site_root,
+            manifest_path=manifest_path,
+            variant_directory=variant_directory,
+            cache_directory=cache_directory,
+            formats=formats,
+            refresh_remote=args.refresh_remote,
+            dry_run=args.dry_run,
+            responsive_by_source=responsive_by_source,
+        )
+        total_failed += failed_count
+        logging.info(
+            "%s: processed %d, unchanged %d, failed %d",
+            manifest_relative_path,
+            processed_count,
+            skipped_count,
+            failed_count,
+        )
+
+    if args.dry_run:
+        logging.info("Dry run enabled; no files written.")
+
+    logging.info("Done.")
+    return 1 if total_failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
+# End Main
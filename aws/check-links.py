@@ -0,0 +1,632 @@
+#!/usr/bin/env python3
+"""
+check-links.py
+
+Build the internal link graph of the site and report broken references:
+- every HTML page (a/link/script/img/source/iframe/video/audio/embed URLs)
+- JSON data files under assets/json-data with url/href-style fields, such as
+  motor-formulas.json, side-nav-data.json and master-chemical-list.json
+
+Internal links are resolved against the local tree: absolute paths from the
+site root, relative paths from the referencing page's directory (or from the
+site root for JSON data, see JSON_RELATIVE_LINKS_FROM_SITE_ROOT), and
+directory URLs through index.html (USE_DIRECTORY_INDEX_URLS). Links to the
+production or test domains are treated as internal.
+
+External links are only checked with --check-external, concurrently through
+a thread pool.
+
+Results are cached between runs in aws/.build-cache/link-check-cache.json:
+- extracted links per source file, keyed by the file's sha256, so unchanged
+  files are not re-parsed
+- external URL results, reused until EXTERNAL_RESULT_TTL_HOURS expire
+
+The script exits with status 1 when any internal link is broken, so it can
+gate CI. Use --report to write a machine-readable JSON report.
+
+Designed to live in: <site-root>/aws/check-links.py
+Run from anywhere:
+  python3 aws/check-links.py
+  python3 aws/check-links.py --check-external --report link-report.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import hashlib
+import json
+import logging
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any, Iterable, Optional
+from urllib.parse import unquote, urlsplit
+
+
+# Begin Configuration
+CACHE_FORMAT_VERSION = 1
+CACHE_FILE_RELATIVE_PATH = Path("aws/.build-cache/link-check-cache.json")
+
+# Keep in sync with USE_DIRECTORY_INDEX_URLS in build-search-index.py.
+USE_DIRECTORY_INDEX_URLS = True
+DIRECTORY_INDEX_FILE_NAME = "index.html"
+
+INTERNAL_HOSTS = [
+    "rocketgeek.org",
+    "www.rocketgeek.org",
+    "test.rocketgeek.org",
+]
+
+JSON_DATA_DIRECTORY_RELATIVE_PATH = Path("assets/json-data")
+JSON_LINK_KEYS = ["url", "href", "details_url", "link", "src"]
+# JSON links are rendered into top-level pages by the loaders in assets/js,
+# so a relative link such as "club-info.html" is relative to the site root.
+JSON_RELATIVE_LINKS_FROM_SITE_ROOT = True
+
+EXCLUDE_PREFIXES = [
+    ".git/",
+    ".idea/",
+    ".venv/",
+    "aws/",
+    "node_modules/",
+]
+
+EXCLUDE_PATTERNS = [
+    # Archived snapshots and generated bundles duplicate other sources.
+    "assets/json-data/search-index-*.json",
+    "assets/json-data/*-bundle*.json",
+]
+
+HTML_LINK_ATTRIBUTES = {
+    "a": ["href"],
+    "area": ["href"],
+    "link": ["href"],
+    "script": ["src"],
+    "img": ["src", "srcset"],
+    "source": ["src", "srcset"],
+    "iframe": ["src"],
+    "video": ["src", "poster"],
+    "audio": ["src"],
+    "embed": ["src"],
+}
+
+IGNORED_SCHEMES = ["mailto:", "tel:", "javascript:", "data:", "sms:"]
+TEMPLATE_MARKERS = ["${", "{{", "<%"]
+
+EXTERNAL_CHECK_WORKERS = 16
+EXTERNAL_TIMEOUT_SECONDS = 15
+EXTERNAL_RESULT_TTL_HOURS = 24
+EXTERNAL_USER_AGENT = "rocketgeek-check-links/1.0"
+# End Configuration
+
+
+# Begin Logging Setup
+def configure_logging(verbose: bool) -> None:
+    log_level = logging.DEBUG if verbose else logging.INFO
+    logging.basicConfig(level=log_level, format="%(levelname)s: %(message)s")
+# End Logging Setup
+
+
+# Begin Helpers
+def get_site_root(script_path: Path) -> Path:
+    aws_directory = script_path.resolve().parent
+    site_root = aws_directory.parent
+    return site_root
+
+
+def posix_relative_path(site_root: Path, file_path: Path) -> str:
+    return file_path.resolve().relative_to(site_root.resolve()).as_posix()
+
+
+def compute_sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def normalize_prefix(prefix_value: str) -> str:
+    normalized = prefix_value.replace("\\", "/")
+    if normalized and not normalized.endswith("/"):
+        normalized = normalized + "/"
+    return normalized
+
+
+def is_excluded_path(posix_path: str) -> bool:
+    for prefix_value in EXCLUDE_PREFIXES:
+        if posix_path.startswith(normalize_prefix(prefix_value)):
+            return True
+    for pattern_value in EXCLUDE_PATTERNS:
+        if fnmatch.fnmatchcase(posix_path, pattern_value):
+            return True
+    return False
+
+
+def ensure_parent_directory(file_path: Path) -> None:
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+
+
+def split_srcset(srcset_value: str) -> list[str]:
+    candidates: list[str] = []
+    for candidate in srcset_value.split(","):
+        url_part = candidate.strip().split(" ", 1)[0]
+        if url_part:
+            candidates.append(url_part)
+    return candidates
+# End Helpers
+
+
+# Begin Link Extraction
+class LinkExtractingParser(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__()
+        self.links: list[str] = []
+
+    def handle_starttag(
+        self,
+        tag: str,
+        attrs: list[tuple[str, Optional[str]]],
+    ) -> None:
+        attribute_names = HTML_LINK_ATTRIBUTES.get(tag.lower())
+        if not attribute_names:
+            return
+        for attribute_name, attribute_value in attrs:
+            if attribute_name.lower() not in attribute_names or not attribute_value:
+                continue
+            if attribute_name.lower() == "srcset":
+                self.links.extend(split_srcset(attribute_value))
+            else:
+                self.links.append(attribute_value.strip())
+
+
+def extract_html_links(text_value: str) -> list[str]:
+    parser = LinkExtractingParser()
+    parser.feed(text_value)
+    return parser.links
+
+
+def extract_json_links(payload: Any) -> list[str]:
+    links: list[str] = []
+    pending: list[Any] = [payload]
+    while pending:
+        current_value = pending.pop()
+        if isinstance(current_value, dict):
+            for key, value in current_value.items():
+                if isinstance(value, str) and key.lower() in JSON_LINK_KEYS:
+                    if value.strip():
+                        links.append(value.strip())
+                elif isinstance(value, (dict, list)):
+                    pending.append(value)
+        elif isinstance(current_value, list):
+            pending.extend(current_value)
+    return links
+
+
+def extract_links(file_path: Path, raw_bytes: bytes) -> list[str]:
+    text_value = raw_bytes.decode("utf-8", errors="replace")
+    if file_path.suffix.lower() == ".json":
+        try:
+            return extract_json_links(json.loads(text_value))
+        except Exception as exception_value:
+            logging.warning("Invalid JSON: %s (%s)", file_path, exception_value)
+            return []
+    return extract_html_links(text_value)
+# End Link Extraction
+
+
+# Begin Link Resolution
+@dataclass(frozen=True)
+class LinkIssue:
+    source: str
+    target: str
+    reason: str
+
+
+def classify_link(link_value: str) -> str:
+    """Return 'ignore', 'external' or 'internal'."""
+    lowered = link_value.lower()
+    if not link_value or link_value.startswith("#"):
+        return "ignore"
+    if any(lowered.startswith(scheme) for scheme in IGNORED_SCHEMES):
+        return "ignore"
+    if any(marker in link_value for marker in TEMPLATE_MARKERS):
+        return "ignore"
+
+    split_result = urlsplit(link_value)
+    if split_result.scheme in ("http", "https") or link_value.startswith("//"):
+        host_value = (split_result.hostname or "").lower()
+        return "internal" if host_value in INTERNAL_HOSTS else "external"
+    if split_result.scheme:
+        return "ignore"
+    return "internal"
+
+
+def resolve_internal_link(
+    site_root: Path,
+    source_path: Path,
+    link_value: str,
+) -> tuple[Optional[str], Optional[str]]:
+    """
+    Return (target_relative_posix, problem). A problem is None when the
+    target exists in the tree.
+    """
+    url_path = unquote(urlsplit(link_value).path)
+    if not url_path:
+        # Query-only or fragment-only link; points at the source itself.
+        return posix_relative_path(site_root, source_path), None
+
+    if url_path.startswith("/"):
+        candidate_path = site_root / url_path.lstrip("/")
+    elif source_path.suffix.lower() == ".json" and JSON_RELATIVE_LINKS_FROM_SITE_ROOT:
+        candidate_path = site_root / url_path
+    else:
+        candidate_path = source_path.parent / url_path
+
+    resolved_path = candidate_path.resolve()
+    try:
+        target_posix = resolved_path.relative_to(site_root.resolve()).as_posix()
+    except ValueError:
+        return None, "resolves outside the site root"
+
+    if resolved_path.is_dir():
+        if not USE_DIRECTORY_INDEX_URLS:
+            return target_posix, "directory URL but USE_DIRECTORY_INDEX_URLS is off"
+        index_path = resolved_path / DIRECTORY_INDEX_FILE_NAME
+        index_posix = index_path.relative_to(site_root.resolve()).as_posix()
+        if index_path.is_file():
+            return index_posix, None
+        return index_posix, "directory has no index.html"
+
+    if resolved_path.is_file():
+        return target_posix, None
+    return target_posix, "file not found"
+# End Link Resolution
+
+
+# Begin External Checks
+def check_external_url(url_value: str) -> dict[str, Any]:
+    request_url = "https:" + url_value if url_value.startswith("//") else url_value
+    last_error = ""
+    for method_name in ("HEAD", "GET"):
+        request = urllib.request.Request(
+            request_url,
+            method=method_name,
+            headers={"User-Agent": EXTERNAL_USER_AGENT},
+        )
+        try:
+            with urllib.request.urlopen(
+                request,
+                timeout=EXTERNAL_TIMEOUT_SECONDS,
+            ) as response:
+                return {
+                    "ok": True,
+                    "status": response.status,
+                    "checked_at": time.time(),
+                }
+        except urllib.error.HTTPError as http_error:
+            last_error = f"HTTP {http_error.code}"
+            # Some servers reject HEAD; retry those with GET.
+            if method_name == "HEAD" and http_error.code in (403, 405, 501):
+                continue
+            return {
+                "ok": False,
+                "status": http_error.code,
+                "error": last_error,
+                "checked_at": time.time(),
+            }
+        except Exception as exception_value:
+            last_error = str(exception_value)
+    return {
+        "ok": False,
+        "status": None,
+        "error": last_error,
+        "checked_at": time.time(),
+    }
+
+
+def check_external_urls(
+    url_values: Iterable[str],
+    cached_results: dict[str, dict[str, Any]],
+    workers: int,
+) -> dict[str, dict[str, Any]]:
+    now_value = time.time()
+    ttl_seconds = EXTERNAL_RESULT_TTL_HOURS * 3600
+    results: dict[str, dict[str, Any]] = {}
+    pending_urls: list[str] = []
+
+    for url_value in sorted(set(url_values)):
+        cached_result = cached_results.get(url_value)
+        checked_at = (cached_result or {}).get("checked_at", 0)
+        if cached_result and now_value - checked_at < ttl_seconds:
+            results[url_value] = cached_result
+        else:
+            pending_urls.append(url_value)
+
+    logging.info(
+        "External URLs: %d (cached %d, checking %d)",
+        len(results) + len(pending_urls),
+        len(results),
+        len(pending_urls),
+    )
+    if pending_urls:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            for url_value, result in zip(
+                pending_urls,
+                executor.map(check_external_url, pending_urls),
+            ):
+                results[url_value] = result
+    return results
+# End External Checks
+
+
+# Begin Cache Handling
+def load_cache(cache_path: Path) -> dict[str, Any]:
+    try:
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    except Exception:
+        return {"files": {}, "external": {}}
+    if not isinstance(cache, dict) or cache.get("version") != CACHE_FORMAT_VERSION:
+        return {"files": {}, "external": {}}
+    return {
+        "files": cache.get("files") or {},
+        "external": cache.get("external") or {},
+    }
+
+
+def write_cache(
+    cache_path: Path,
+    files_cache: dict[str, Any],
+    external_cache: dict[str, Any],
+) -> None:
+    ensure_parent_directory(cache_path)
+    cache = {
+        "version": CACHE_FORMAT_VERSION,
+        "files": files_cache,
+        "external": external_cache,
+    }
+    cache_path.write_text(
+        json.dumps(cache, indent=1, sort_keys=True) + "\n",
+        encoding="utf-8",
+    )
+# End Cache Handling
+
+
+# Begin Source Discovery
+def gather_source_files(site_root: Path) -> list[Path]:
+    discovered_files: list[Path] = []
+    for found_path in site_root.rglob("*.html"):
+        if found_path.is_file() and not is_excluded_path(
+            posix_relative_path(site_root, found_path)
+        ):
+            discovered_files.append(found_path)
+
+    json_directory = site_root / JSON_DATA_DIRECTORY_RELATIVE_PATH
+    for found_path in json_directory.rglob("*.json"):
+        if found_path.is_file() and not is_excluded_path(
+            posix_relative_path(site_root, found_path)
+        ):
+            discovered_files.append(found_path)
+
+    return sorted(set(discovered_files))
+
+
+def collect_links(
+    site_root: Path,
+    source_files: list[Path],
+    files_cache: dict[str, Any],
+) -> tuple[dict[str, list[str]], dict[str, Any], int]:
+    """
+    Return (links per source, new files cache, number of files parsed).
+    """
+    links_by_source: dict[str, list[str]] = {}
+    new_files_cache: dict[str, Any] = {}
+    parsed_count = 0
+
+    for source_path in source_files:
+        source_posix = posix_relative_path(site_root, source_path)
+        raw_bytes = source_path.read_bytes()
+        source_sha256 = compute_sha256(raw_bytes)
+
+        cached_entry = files_cache.get(source_posix)
+        if cached_entry and cached_entry.get("sha256") == source_sha256:
+            links = cached_entry.get("links") or []
+        else:
+            links = extract_links(source_path, raw_bytes)
+            parsed_count += 1
+
+        links_by_source[source_posix] = links
+        new_files_cache[source_posix] = {"sha256": source_sha256, "links": links}
+
+    return links_by_source, new_files_cache, parsed_count
+# End Source Discovery
+
+
+# Begin Report
+def build_report(
+    site_root: Path,
+    links_by_source: dict[str, list[str]],
+    external_results: Optional[dict[str, dict[str, Any]]],
+) -> dict[str, Any]:
+    graph: dict[str, list[str]] = {}
+    issues: list[LinkIssue] = []
+    external_by_source: dict[str, set[str]] = {}
+    incoming_counts: dict[str, int] = {}
+    link_count = 0
+
+    for source_posix, links in links_by_source.items():
+        source_path = site_root / source_posix
+        targets: set[str] = set()
+        for link_value in links:
+            link_kind = classify_link(link_value)
+            if link_kind == "ignore":
+                continue
+            link_count += 1
+            if link_kind == "external":
+                external_by_source.setdefault(link_value, set()).add(source_posix)
+                continue
+
+            target_posix, problem = resolve_internal_link(
+                site_root,
+                source_path,
+                link_value,
+            )
+            if problem:
+                issues.append(LinkIssue(source_posix, link_value, problem))
+                continue
+            if target_posix and target_posix != source_posix:
+                targets.add(target_posix)
+                incoming_counts[target_posix] = (
+                    incoming_counts.get(target_posix, 0) + 1
+                )
+        graph[source_posix] = sorted(targets)
+
+    if external_results is not None:
+        for url_value, result in external_results.items():
+            if result.get("ok"):
+                continue
+            failure_text = result.get("error") or result.get("status")
+            reason = f"external check failed: {failure_text}"
+            for source_posix in sorted(external_by_source.get(url_value, ())):
+                issues.append(LinkIssue(source_posix, url_value, reason))
+
+    html_pages = [source for source in graph if source.endswith(".html")]
+    orphan_pages = sorted(
+        page for page in html_pages
+        if page != "index.html" and not incoming_counts.get(page)
+    )
+
+    issues.sort(key=lambda issue: (issue.source, issue.target))
+    return {
+        "source_files": len(links_by_source),
+        "links_checked": link_count,
+        "broken_count": len(issues),
+        "broken": [
+            {"source": issue.source, "target": issue.target, "reason": issue.reason}
+            for issue in issues
+        ],
+        "external_urls": sorted(external_by_source),
+        "orphan_pages": orphan_pages,
+        "graph": graph,
+    }
+# End Report
+
+
+# Begin Main
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Check internal links and asset references across HTML and JSON data.",
+    )
+    parser.add_argument(
+        "--site-root",
+        default="",
+        help="Optional explicit site root. Defaults to parent of aws/ directory.",
+    )
+    parser.add_argument(
+        "--check-external",
+        action="store_true",
+        help="Also request external URLs (concurrently, with cached results).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=EXTERNAL_CHECK_WORKERS,
+        help="Thread pool size for external checks.",
+    )
+    parser.add_argument(
+        "--report",
+        default="",
+        help="Optional path for a JSON report (broken links, orphans, link graph).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore and do not update the result cache.",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Enable debug logging.",
+    )
+    args = parser.parse_args()
+
+    configure_logging(args.verbose)
+
+    script_path = Path(__file__)
+    if args.site_root:
+        site_root = Path(args.site_root).resolve()
+    else:
+        site_root = get_site_root(script_path)
+
+    if not site_root.exists():
+        logging.error("Site root does not exist: %s", site_root)
+        return 2
+
+    cache_path = site_root / CACHE_FILE_RELATIVE_PATH
+    cache = {"files": {}, "external": {}} if args.no_cache else load_cache(cache_path)
+
+    logging.info("Site root: %s", site_root)
+
+    source_files = gather_source_files(site_root)
+    links_by_source, files_cache, parsed_count = collect_links(
+        site_root,
+        source_files,
+        cache["files"],
+    )
+    logging.info(
+        "Source files: %d (parsed this run: %d)",
+        len(source_files),
+        parsed_count,
+    )
+
+    external_results: Optional[dict[str, dict[str, Any]]] = None
+    external_cache = cache["external"]
+    if args.check_external:
+        external_urls = [
+            link_value
+            for links in links_by_source.values()
+            for link_value in links
+            if classify_link(link_value) == "external"
+        ]
+        external_results = check_external_urls(
+            external_urls,
+            external_cache,
+            args.workers,
+        )
+        external_cache = {**external_cache, **external_results}
+
+    report = build_report(site_root, links_by_source, external_results)
+
+    for broken_entry in report["broken"]:
+        logging.warning(
+            "Broken: %s -> %s (%s)",
+            broken_entry["source"],
+            broken_entry["target"],
+            broken_entry["reason"],
+        )
+    logging.info(
+        "Links checked: %d, broken: %d, orphan pages: %d",
+        report["links_checked"],
+        report["broken_count"],
+        len(report["orphan_pages"]),
+    )
+
+    if args.report:
+        report_path = Path(args.report).resolve()
+        ensure_parent_directory(report_path)
+        report_path.write_text(
+            json.dumps(report, indent=2, ensure_ascii=False) + "\n",
+            encoding="utf-8",
+        )
+        logging.info("Wrote report: %s", report_path)
+
+    if not args.no_cache:
+        write_cache(cache_path, files_cache, external_cache)
+
+    return 1 if report["broken_count"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
+# End Main
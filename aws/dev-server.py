@@ -0,0 +1,518 @@
+#!/usr/bin/env python3
+"""
+dev-server.py
+
+Local static web server for the site root that behaves like the CloudFront
+distribution closely enough to benchmark page-load waterfalls offline:
+- serves precompressed siblings (file.br / file.gz) based on Accept-Encoding
+- strong ETags and If-None-Match (304 Not Modified)
+- single byte-range requests (206 Partial Content / 416)
+- directory-index URLs ("/formulas/" -> formulas/index.html) when
+  USE_DIRECTORY_INDEX_URLS is enabled, mirroring build-search-index.py
+- Cache-Control headers from CACHE_CONTROL_RULES
+- configurable per-request latency with optional jitter and per-path rules
+
+Designed to live in: <site-root>/aws/dev-server.py
+Run from anywhere:
+  python3 aws/dev-server.py --port 8080 --latency-ms 40 --jitter-ms 20
+  python3 aws/dev-server.py --latency-rule "/assets/json-data/*=150"
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import hashlib
+import logging
+import mimetypes
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import formatdate
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+from urllib.parse import unquote, urlsplit
+
+
+# Begin Configuration
+DEFAULT_BIND_ADDRESS = "127.0.0.1"
+DEFAULT_PORT = 8080
+
+# Keep in sync with USE_DIRECTORY_INDEX_URLS in build-search-index.py.
+USE_DIRECTORY_INDEX_URLS = True
+DIRECTORY_INDEX_FILE_NAME = "index.html"
+NOT_FOUND_PAGE_RELATIVE_PATH = Path("404.html")
+
+# Order matters: the first encoding the client accepts and that exists wins.
+PRECOMPRESSED_ENCODINGS = [
+    ("br", ".br"),
+    ("gzip", ".gz"),
+]
+
+# First matching pattern wins (fnmatch against the URL path).
+CACHE_CONTROL_RULES = [
+    ("*.html", "no-cache"),
+    ("/", "no-cache"),
+    ("*/", "no-cache"),
+    ("/assets/json-data/*", "max-age=300"),
+    ("/assets/*", "max-age=86400"),
+]
+DEFAULT_CACHE_CONTROL = "max-age=3600"
+
+HIDDEN_PATH_PREFIXES = [
+    "/.git/",
+    "/.idea/",
+    "/aws/",
+    "/secure/lambda-code/",
+]
+
+EXTRA_MIME_TYPES = {
+    ".avif": "image/avif",
+    ".json": "application/json",
+    ".webp": "image/webp",
+    ".woff2": "font/woff2",
+}
+# End Configuration
+
+
+# Begin Logging Setup
+def configure_logging(verbose: bool) -> None:
+    log_level = logging.DEBUG if verbose else logging.INFO
+    logging.basicConfig(level=log_level, format="%(levelname)s: %(message)s")
+# End Logging Setup
+
+
+# Begin Helpers
+def get_site_root(script_path: Path) -> Path:
+    aws_directory = script_path.resolve().parent
+    site_root = aws_directory.parent
+    return site_root
+
+
+def guess_content_type(file_path: Path) -> str:
+    extra_type = EXTRA_MIME_TYPES.get(file_path.suffix.lower())
+    if extra_type:
+        return extra_type
+    guessed_type, _ = mimetypes.guess_type(file_path.name)
+    content_type = guessed_type or "application/octet-stream"
+    if content_type.startswith("text/") or content_type in (
+        "application/javascript",
+        "application/json",
+    ):
+        content_type += "; charset=utf-8"
+    return content_type
+
+
+def cache_control_for(url_path: str) -> str:
+    for pattern_value, header_value in CACHE_CONTROL_RULES:
+        if fnmatch.fnmatchcase(url_path, pattern_value):
+            return header_value
+    return DEFAULT_CACHE_CONTROL
+
+
+def parse_accept_encoding(header_value: str) -> set[str]:
+    accepted: set[str] = set()
+    for item in header_value.split(","):
+        parts = [part.strip() for part in item.split(";")]
+        if not parts[0]:
+            continue
+        quality = 1.0
+        for parameter in parts[1:]:
+            if parameter.startswith("q="):
+                try:
+                    quality = float(parameter[2:])
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            accepted.add(parts[0].lower())
+    return accepted
+
+
+def parse_range_header(
+    header_value: str,
+    content_length: int,
+) -> Optional[tuple[int, int]]:
+    """
+    Parse a single 'bytes=' range. Returns (start, end) inclusive, or None
+    when the range cannot be satisfied. Multiple ranges are not supported.
+    """
+    match = re.fullmatch(r"\s*bytes=(\d*)-(\d*)\s*", header_value)
+    if not match or (not match.group(1) and not match.group(2)):
+        return None
+
+    start_text, end_text = match.group(1), match.group(2)
+    if not start_text:
+        suffix_length = int(end_text)
+        if suffix_length == 0:
+            return None
+        start = max(0, content_length - suffix_length)
+        return start, content_length - 1
+
+    start = int(start_text)
+    end = int(end_text) if end_text else content_length - 1
+    if start >= content_length or end < start:
+        return None
+    return start, min(end, content_length - 1)
+
+
+def etag_matches(if_none_match: str, etag_value: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    weak_stripped = [
+        candidate[2:] if candidate.startswith("W/") else candidate
+        for candidate in candidates
+    ]
+    return etag_value in weak_stripped
+# End Helpers
+
+
+# Begin Latency
+@dataclass(frozen=True)
+class LatencyRule:
+    pattern: str
+    latency_ms: float
+
+
+@dataclass(frozen=True)
+class LatencyConfig:
+    base_latency_ms: float
+    jitter_ms: float
+    rules: tuple[LatencyRule, ...]
+
+    def delay_seconds(self, url_path: str) -> float:
+        latency_ms = self.base_latency_ms
+        for rule in self.rules:
+            if fnmatch.fnmatchcase(url_path, rule.pattern):
+                latency_ms = rule.latency_ms
+                break
+        if self.jitter_ms > 0:
+            latency_ms += random.uniform(0, self.jitter_ms)
+        return max(0.0, latency_ms) / 1000.0
+
+
+def parse_latency_rule(rule_text: str) -> LatencyRule:
+    pattern_value, separator, latency_text = rule_text.rpartition("=")
+    if not separator or not pattern_value:
+        raise argparse.ArgumentTypeError(
+            f"Latency rule must look like PATTERN=MS: {rule_text!r}"
+        )
+    try:
+        return LatencyRule(pattern_value, float(latency_text))
+    except ValueError as exception_value:
+        raise argparse.ArgumentTypeError(
+            f"Invalid latency in rule {rule_text!r}"
+        ) from exception_value
+# End Latency
+
+
+# Begin File Resolution
+@dataclass(frozen=True)
+class ResolvedFile:
+    file_path: Path
+    content_encoding: str
+    content_type: str
+
+
+class ETagCache:
+    """
+    Remembers the MD5 ETag of each served file keyed by (path, mtime, size),
+    like the S3 origin, without re-hashing unchanged files on every request.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[Path, tuple[int, int, str]] = {}
+
+    def get(self, file_path: Path) -> str:
+        stat_result = file_path.stat()
+        with self._lock:
+            cached = self._entries.get(file_path)
+            if (
+                cached
+                and cached[0] == stat_result.st_mtime_ns
+                and cached[1] == stat_result.st_size
+            ):
+                return cached[2]
+
+        digest = hashlib.md5()
+        with file_path.open("rb") as input_file:
+            for chunk in iter(lambda: input_file.read(1024 * 1024), b""):
+                digest.update(chunk)
+        etag_value = f'"{digest.hexdigest()}"'
+
+        with self._lock:
+            self._entries[file_path] = (
+                stat_result.st_mtime_ns,
+                stat_result.st_size,
+                etag_value,
+            )
+        return etag_value
+
+
+def resolve_url_path(
+    site_root: Path,
+    url_path: str,
+) -> tuple[Optional[Path], Optional[str]]:
+    """
+    Map a URL path onto a file under site_root.
+
+    Returns (file_path, redirect_location). Exactly one is set when the URL
+    resolves, both are None when it does not.
+    """
+    relative_text = url_path.lstrip("/")
+    candidate_path = (site_root / relative_text).resolve()
+    try:
+        relative_path = candidate_path.relative_to(site_root)
+    except ValueError:
+        return None, None
+
+    # Check hidden prefixes against the resolved path so "..", "." and
+    # symlinks cannot reach them.
+    resolved_url_path = "/" + relative_path.as_posix() + "/"
+    for prefix_value in HIDDEN_PATH_PREFIXES:
+        if resolved_url_path.startswith(prefix_value):
+            return None, None
+
+    if candidate_path.is_dir():
+        if not USE_DIRECTORY_INDEX_URLS and url_path != "/":
+            return None, None
+        if not url_path.endswith("/"):
+            return None, url_path + "/"
+        index_path = candidate_path / DIRECTORY_INDEX_FILE_NAME
+        return (index_path, None) if index_path.is_file() else (None, None)
+
+    if candidate_path.is_file():
+        return candidate_path, None
+    return None, None
+
+
+def choose_representation(file_path: Path, accept_encoding: str) -> ResolvedFile:
+    content_type = guess_content_type(file_path)
+    accepted = parse_accept_encoding(accept_encoding)
+    for encoding_name, suffix in PRECOMPRESSED_ENCODINGS:
+        if encoding_name not in accepted:
+            continue
+        sibling_path = file_path.with_name(file_path.name + suffix)
+        if sibling_path.is_file():
+            return ResolvedFile(sibling_path, encoding_name, content_type)
+    return ResolvedFile(file_path, "", content_type)
+# End File Resolution
+
+
+# Begin Request Handling
+class DevRequestHandler(BaseHTTPRequestHandler):
+    server_version = "RocketGeekDev/1.0"
+    protocol_version = "HTTP/1.1"
+
+    site_root: Path = Path(".")
+    latency_config = LatencyConfig(0.0, 0.0, ())
+    etag_cache = ETagCache()
+
+    def do_GET(self) -> None:
+        self.handle_file_request(send_body=True)
+
+    def do_HEAD(self) -> None:
+        self.handle_file_request(send_body=False)
+
+    def log_message(self, format: str, *args: object) -> None:
+        logging.debug("%s - %s", self.address_string(), format % args)
+
+    def handle_file_request(self, send_body: bool) -> None:
+        started_at = time.perf_counter()
+        url_path = unquote(urlsplit(self.path).path) or "/"
+
+        delay_seconds = self.latency_config.delay_seconds(url_path)
+        if delay_seconds:
+            time.sleep(delay_seconds)
+
+        file_path, redirect_location = resolve_url_path(self.site_root, url_path)
+        if redirect_location:
+            self.send_redirect(redirect_location)
+            status_code = HTTPStatus.MOVED_PERMANENTLY
+        elif file_path is None:
+            status_code = self.send_not_found(send_body)
+        else:
+            status_code = self.send_file(url_path, file_path, send_body)
+
+        elapsed_ms = (time.perf_counter() - started_at) * 1000.0
+        logging.info(
+            "%s %s -> %d (%.1f ms, latency %.1f ms)",
+            self.command,
+            self.path,
+            status_code,
+            elapsed_ms,
+            delay_seconds * 1000.0,
+        )
+
+    def send_redirect(self, location: str) -> None:
+        self.send_response(HTTPStatus.MOVED_PERMANENTLY)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def send_not_found(self, send_body: bool) -> int:
+        not_found_path = self.site_root / NOT_FOUND_PAGE_RELATIVE_PATH
+        body = not_found_path.read_bytes() if not_found_path.is_file() else b"Not Found"
+        self.send_response(HTTPStatus.NOT_FOUND)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+        return HTTPStatus.NOT_FOUND
+
+    def send_file(self, url_path: str, file_path: Path, send_body: bool) -> int:
+        representation = choose_representation(
+            file_path,
+            self.headers.get("Accept-Encoding", ""),
+        )
+        served_path = representation.file_path
+        etag_value = self.etag_cache.get(served_path)
+        stat_result = served_path.stat()
+
+        common_headers = [
+            ("ETag", etag_value),
+            ("Last-Modified", formatdate(stat_result.st_mtime, usegmt=True)),
+            ("Cache-Control", cache_control_for(url_path)),
+            ("Vary", "Accept-Encoding"),
+            ("Accept-Ranges", "bytes"),
+        ]
+
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match and etag_matches(if_none_match, etag_value):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            for header_name, header_value in common_headers:
+                self.send_header(header_name, header_value)
+            self.end_headers()
+            return HTTPStatus.NOT_MODIFIED
+
+        content_length = stat_result.st_size
+        start, end = 0, content_length - 1
+        status_code = HTTPStatus.OK
+
+        range_header = self.headers.get("Range")
+        if range_header and content_length > 0:
+            parsed_range = parse_range_header(range_header, content_length)
+            if parsed_range is None:
+                self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                self.send_header("Content-Range", f"bytes */{content_length}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE
+            start, end = parsed_range
+            status_code = HTTPStatus.PARTIAL_CONTENT
+
+        body_length = max(0, end - start + 1)
+        self.send_response(status_code)
+        self.send_header("Content-Type", representation.content_type)
+        if representation.content_encoding:
+            self.send_header("Content-Encoding", representation.content_encoding)
+        if status_code == HTTPStatus.PARTIAL_CONTENT:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{content_length}")
+        self.send_header("Content-Length", str(body_length))
+        for header_name, header_value in common_headers:
+            self.send_header(header_name, header_value)
+        self.end_headers()
+
+        if send_body and body_length:
+            with served_path.open("rb") as input_file:
+                input_file.seek(start)
+                remaining = body_length
+                while remaining > 0:
+                    chunk = input_file.read(min(remaining, 64 * 1024))
+                    if not chunk:
+                        break
+                    self.wfile.write(chunk)
+                    remaining -= len(chunk)
+        return status_code
+# End Request Handling
+
+
+# Begin Main
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Serve the site root locally with CloudFront-like behavior.",
+    )
+    parser.add_argument(
+        "--site-root",
+        default="",
+        help="Optional explicit site root. Defaults to parent of aws/ directory.",
+    )
+    parser.add_argument(
+        "--bind",
+        default=DEFAULT_BIND_ADDRESS,
+        help="Address to bind to.",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=DEFAULT_PORT,
+        help="Port to listen on.",
+    )
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=0.0,
+        help="Fixed latency added to every request, in milliseconds.",
+    )
+    parser.add_argument(
+        "--jitter-ms",
+        type=float,
+        default=0.0,
+        help="Random extra latency of up to this many milliseconds per request.",
+    )
+    parser.add_argument(
+        "--latency-rule",
+        action="append",
+        type=parse_latency_rule,
+        default=[],
+        help="Override latency for matching URL paths, e.g. '/assets/json-data/*=150'. Repeatable.",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Enable debug logging.",
+    )
+    args = parser.parse_args()
+
+    configure_logging(args.verbose)
+
+    script_path = Path(__file__)
+    if args.site_root:
+        site_root = Path(args.site_root).resolve()
+    else:
+        site_root = get_site_root(script_path)
+
+    if not site_root.exists():
+        logging.error("Site root does not exist: %s", site_root)
+        return 2
+
+    DevRequestHandler.site_root = site_root
+    DevRequestHandler.latency_config = LatencyConfig(
+        base_latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rules=tuple(args.latency_rule),
+    )
+
+    http_server = ThreadingHTTPServer((args.bind, args.port), DevRequestHandler)
+    logging.info("Site root: %s", site_root)
+    logging.info("Serving on http://%s:%d/", args.bind, args.port)
+
+    try:
+        http_server.serve_forever()
+    except KeyboardInterrupt:
+        logging.info("Shutting down.")
+    finally:
+        http_server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
+# End Main
@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+"""
+minify-html.py
+
+Minify the site's HTML pages for deployment:
+- collapses whitespace in text and inside tags, but never inside
+  <pre>, <textarea> or <script> bodies
+- drops HTML comments, except conditional comments (<!--[if ...]>) and
+  marker comments listed in KEEP_COMMENT_PREFIXES
+- compacts inline JSON (<script type="application/json"> and
+  application/ld+json / importmap) and inline <style> blocks
+- reports bytes saved per page and in total
+
+By default minified pages are written to <site-root>/dist/ with the same
+relative paths, leaving the hand-edited sources untouched. Use --in-place
+to overwrite the sources (for example inside a CI checkout before upload).
+
+Designed to live in: <site-root>/aws/minify-html.py
+Run from anywhere:
+  python3 aws/minify-html.py
+  python3 aws/minify-html.py --report minify-report.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import logging
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+
+# Begin Configuration
+DEFAULT_OUTPUT_DIRECTORY_RELATIVE_PATH = Path("dist")
+
+EXCLUDE_PREFIXES = [
+    ".git/",
+    ".idea/",
+    ".venv/",
+    "aws/",
+    "dist/",
+    "node_modules/",
+]
+
+EXCLUDE_PATTERNS = [
+    # Example:
+    # "assets/testhtml/**",
+]
+
+# Comments starting with one of these prefixes (after "<!--") are kept.
+KEEP_COMMENT_PREFIXES = [
+    "[if",
+    "<![endif]",
+    "!",
+    "#",
+]
+
+JSON_SCRIPT_TYPES = [
+    "application/json",
+    "application/ld+json",
+    "importmap",
+]
+
+# Whitespace-only text next to these tags is dropped entirely.
+BLOCK_LEVEL_TAGS = {
+    "address", "article", "aside", "base", "blockquote", "body", "br",
+    "caption", "col", "colgroup", "dd", "details", "dialog", "div", "dl",
+    "dt", "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2",
+    "h3", "h4", "h5", "h6", "head", "header", "hr", "html", "legend", "li",
+    "link", "main", "meta", "nav", "noscript", "ol", "optgroup", "option",
+    "p", "pre", "section", "source", "summary", "table", "tbody", "td",
+    "tfoot", "th", "thead", "title", "tr", "ul",
+}
+# End Configuration
+
+
+# Begin Logging Setup
+def configure_logging(verbose: bool) -> None:
+    log_level = logging.DEBUG if verbose else logging.INFO
+    logging.basicConfig(level=log_level, format="%(levelname)s: %(message)s")
+# End Logging Setup
+
+
+# Begin Helpers
+def get_site_root(script_path: Path) -> Path:
+    aws_directory = script_path.resolve().parent
+    site_root = aws_directory.parent
+    return site_root
+
+
+def posix_relative_path(site_root: Path, file_path: Path) -> str:
+    return file_path.resolve().relative_to(site_root.resolve()).as_posix()
+
+
+def normalize_prefix(prefix_value: str) -> str:
+    normalized = prefix_value.replace("\\", "/")
+    if normalized and not normalized.endswith("/"):
+        normalized = normalized + "/"
+    return normalized
+
+
+def is_excluded_path(posix_path: str) -> bool:
+    for prefix_value in EXCLUDE_PREFIXES:
+        if posix_path.startswith(normalize_prefix(prefix_value)):
+            return True
+    for pattern_value in EXCLUDE_PATTERNS:
+        if fnmatch.fnmatchcase(posix_path, pattern_value):
+            return True
+    return False
+
+
+def safe_read_text(file_path: Path) -> str:
+    try:
+        return file_path.read_text(encoding="utf-8", errors="strict")
+    except Exception:
+        return file_path.read_text(encoding="latin-1", errors="replace")
+
+
+def ensure_parent_directory(file_path: Path) -> None:
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+# End Helpers
+
+
+# Begin Minification
+# Tag bodies skip over quoted attribute values, so a ">" inside one (for
+# example onclick="if (a > b) ...") does not end the tag.
+TAG_BODY = r"(?:[^>\"']|\"[^\"]*\"|'[^']*')*"
+TOKEN_PATTERN = re.compile(
+    r"(?P<comment><!--.*?-->)"
+    r"|(?P<raw><(?P<raw_tag>pre|textarea|script|style)\b" + TAG_BODY + r">.*?</(?P=raw_tag)\s*>)"
+    r"|(?P<doctype><!doctype[^>]*>)"
+    r"|(?P<tag></?[a-zA-Z]" + TAG_BODY + r">)",
+    re.IGNORECASE | re.DOTALL,
+)
+TAG_NAME_PATTERN = re.compile(r"</?([a-zA-Z][a-zA-Z0-9-]*)")
+# A lone quote falls into the second group, so nothing is ever dropped.
+QUOTED_OR_OTHER_PATTERN = re.compile(r"(\"[^\"]*\"|'[^']*')|([^\"']+|[\"'])")
+RAW_BLOCK_PATTERN = re.compile(r"(<" + TAG_BODY + r">)(.*)(</[^>]*>)\s*\Z", re.DOTALL)
+SCRIPT_TYPE_PATTERN = re.compile(r"\btype\s*=\s*[\"']?([^\"'\s>]+)", re.IGNORECASE)
+CSS_STRING_OR_COMMENT_PATTERN = re.compile(
+    r"(\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*')|/\*.*?\*/",
+    re.DOTALL,
+)
+
+
+def compact_tag(tag_text: str) -> str:
+    """
+    Collapse whitespace inside a start or end tag, outside quoted attribute
+    values: '<html lang = "en" >' becomes '<html lang="en">'.
+    """
+    pieces: list[str] = []
+    for match in QUOTED_OR_OTHER_PATTERN.finditer(tag_text):
+        quoted_text, other_text = match.group(1), match.group(2)
+        if quoted_text is not None:
+            pieces.append(quoted_text)
+            continue
+        other_text = re.sub(r"\s+", " ", other_text)
+        other_text = re.sub(r" ?= ?", "=", other_text)
+        other_text = re.sub(r" ?(/?>)$", r"\1", other_text)
+        pieces.append(other_text)
+    return "".join(pieces)
+
+
+def minify_css(css_text: str) -> str:
+    # Comments are removed only outside strings: content: "/* */" survives.
+    without_comments = CSS_STRING_OR_COMMENT_PATTERN.sub(
+        lambda match: match.group(1) or "",
+        css_text,
+    )
+    pieces: list[str] = []
+    for match in QUOTED_OR_OTHER_PATTERN.finditer(without_comments):
+        quoted_text, other_text = match.group(1), match.group(2)
+        if quoted_text is not None:
+            pieces.append(quoted_text)
+            continue
+        other_text = re.sub(r"\s+", " ", other_text)
+        other_text = re.sub(r" ?([{};,>]) ?", r"\1", other_text)
+        other_text = re.sub(r": ", ":", other_text)
+        other_text = other_text.replace(";}", "}")
+        pieces.append(other_text)
+    return "".join(pieces).strip()
+
+
+def minify_raw_block(raw_tag: str, block_text: str) -> str:
+    block_match = RAW_BLOCK_PATTERN.match(block_text)
+    if not block_match:
+        return block_text
+    start_tag, body_text, end_tag = block_match.groups()
+    start_tag = compact_tag(start_tag)
+    end_tag = compact_tag(end_tag)
+
+    if raw_tag in ("pre", "textarea"):
+        return start_tag + body_text + end_tag
+
+    if raw_tag == "style":
+        return start_tag + minify_css(body_text) + end_tag
+
+    type_match = SCRIPT_TYPE_PATTERN.search(start_tag)
+    script_type = type_match.group(1).lower() if type_match else ""
+    if script_type in JSON_SCRIPT_TYPES and body_text.strip():
+        try:
+            compact_body = json.dumps(
+                json.loads(body_text),
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+            # Keep "</script" sequences from terminating the block early.
+            compact_body = compact_body.replace("</", "<\\/")
+            return start_tag + compact_body + end_tag
+        except ValueError:
+            logging.debug("Inline JSON did not parse; left as-is.")
+
+    # JavaScript bodies are left intact apart from outer whitespace.
+    return start_tag + body_text.strip() + end_tag
+
+
+def is_kept_comment(comment_text: str) -> bool:
+    inner_text = comment_text[4:].lstrip()
+    return any(inner_text.startswith(prefix) for prefix in KEEP_COMMENT_PREFIXES)
+
+
+@dataclass
+class MinifyToken:
+    kind: str
+    text: str
+    tag_name: str = ""
+
+    @property
+    def is_block_boundary(self) -> bool:
+        return self.kind in ("doctype", "comment") or self.tag_name in BLOCK_LEVEL_TAGS
+
+
+def tokenize_html(html_text: str) -> list[MinifyToken]:
+    tokens: list[MinifyToken] = []
+    position = 0
+    for match in TOKEN_PATTERN.finditer(html_text):
+        if match.start() > position:
+            tokens.append(MinifyToken("text", html_text[position:match.start()]))
+        kind = match.lastgroup or "tag"
+        if kind == "raw_tag":
+            kind = "raw"
+        token_text = match.group(0)
+        tag_name = ""
+        if kind == "raw":
+            tag_name = match.group("raw_tag").lower()
+        elif kind == "tag":
+            name_match = TAG_NAME_PATTERN.match(token_text)
+            tag_name = name_match.group(1).lower() if name_match else ""
+        tokens.append(MinifyToken(kind, token_text, tag_name))
+        position = match.end()
+    if position < len(html_text):
+        tokens.append(MinifyToken("text", html_text[position:]))
+    return tokens
+
+
+def minify_html(html_text: str) -> str:
+    tokens = tokenize_html(html_text)
+
+    # Drop removable comments first so whitespace around them can merge.
+    kept_tokens: list[MinifyToken] = []
+    for token in tokens:
+        if token.kind == "comment" and not is_kept_comment(token.text):
+            if kept_tokens and kept_tokens[-1].kind == "text":
+                continue
+            kept_tokens.append(MinifyToken("text", ""))
+            continue
+        if token.kind == "text" and kept_tokens and kept_tokens[-1].kind == "text":
+            kept_tokens[-1].text += token.text
+            continue
+        kept_tokens.append(token)
+
+    output_parts: list[str] = []
+    for index, token in enumerate(kept_tokens):
+        if token.kind == "text":
+            collapsed_text = re.sub(r"\s+", " ", token.text)
+            if collapsed_text == " ":
+                previous_token: Optional[MinifyToken] = (
+                    kept_tokens[index - 1] if index > 0 else None
+                )
+                next_token: Optional[MinifyToken] = (
+                    kept_tokens[index + 1] if index + 1 < len(kept_tokens) else None
+                )
+                if (
+                    previous_token is None
+                    or next_token is None
+                    or previous_token.is_block_boundary
+                    or next_token.is_block_boundary
+                ):
+                    collapsed_text = ""
+            output_parts.append(collapsed_text)
+        elif token.kind == "raw":
+            output_parts.append(minify_raw_block(token.tag_name, token.text))
+        elif token.kind == "tag":
+            output_parts.append(compact_tag(token.text))
+        else:
+            output_parts.append(token.text)
+
+    return "".join(output_parts).strip() + "\n"
+# End Minification
+
+
+# Begin Page Processing
+@dataclass(frozen=True)
+class MinifyResult:
+    relative_path: str
+    original_bytes: int
+    minified_bytes: int
+
+    @property
+    def saved_bytes(self) -> int:
+        return self.original_bytes - self.minified_bytes
+
+    @property
+    def saved_percent(self) -> float:
+        if not self.original_bytes:
+            return 0.0
+        return 100.0 * self.saved_bytes / self.original_bytes
+
+
+def gather_html_files(site_root: Path) -> list[Path]:
+    discovered_files: list[Path] = []
+    for found_path in site_root.rglob("*.html"):
+        if not found_path.is_file():
+            continue
+        if is_excluded_path(posix_relative_path(site_root, found_path)):
+            continue
+        discovered_files.append(found_path)
+    return sorted(set(discovered_files))
+
+
+def process_page(
+    site_root: Path,
+    file_path: Path,
+    output_root: Optional[Path],
+    dry_run: bool,
+) -> MinifyResult:
+    relative_path = posix_relative_path(site_root, file_path)
+    original_text = safe_read_text(file_path)
+    minified_text = minify_html(original_text)
+
+    result = MinifyResult(
+        relative_path=relative_path,
+        original_bytes=len(original_text.encode("utf-8")),
+        minified_bytes=len(minified_text.encode("utf-8")),
+    )
+
+    if not dry_run:
+        target_path = file_path if output_root is None else output_root / relative_path
+        ensure_parent_directory(target_path)
+        target_path.write_text(minified_text, encoding="utf-8")
+
+    return result
+# End Page Processing
+
+
+# Begin Main
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Minify the site's HTML pages and report bytes saved.",
+    )
+    parser.add_argument(
+        "--site-root",
+        default="",
+        help="Optional explicit site root. Defaults to parent of aws/ directory.",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default="",
+        help="Directory for minified pages. Defaults to <site-root>/dist.",
+    )
+    parser.add_argument(
+        "--in-place",
+        action="store_true",
+        help="Overwrite the source pages instead of writing to --output-dir.",
+    )
+    parser.add_argument(
+        "--report",
+        default="",
+        help="Optional path for a JSON report of bytes saved per page.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Minify in memory and report savings, but do not write files.",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Enable debug logging.",
+    )
+    args = parser.parse_args()
+
+    configure_logging(args.verbose)
+
+    script_path = Path(__file__)
+    if args.site_root:
+        site_root = Path(args.site_root).resolve()
+    else:
+        site_root = get_site_root(script_path)
+
+    if not site_root.exists():
+        logging.error("Site root does not exist: %s", site_root)
+        return 2
+
+    output_root: Optional[Path] = None
+    if not args.in_place:
+        if args.output_dir:
+            output_root = Path(args.output_dir).resolve()
+        else:
+            output_root = site_root / DEFAULT_OUTPUT_DIRECTORY_RELATIVE_PATH
+
+    logging.info("Site root: %s", site_root)
+    logging.info("Output: %s", "in place" if output_root is None else output_root)
+
+    html_files = gather_html_files(site_root)
+    logging.info("HTML files discovered (post-exclude): %d", len(html_files))
+
+    results: list[MinifyResult] = []
+    for file_path in html_files:
+        result = process_page(site_root, file_path, output_root, args.dry_run)
+        results.append(result)
+        logging.info(
+            "%-60s %8d -> %8d bytes (saved %6d, %5.1f%%)",
+            result.relative_path,
+            result.original_bytes,
+            result.minified_bytes,
+            result.saved_bytes,
+            result.saved_percent,
+        )
+
+    total_original = sum(result.original_bytes for result in results)
+    total_minified = sum(result.minified_bytes for result in results)
+    total_saved = total_original - total_minified
+    total_percent = 100.0 * total_saved / total_original if total_original else 0.0
+    logging.info(
+        "Total: %d -> %d bytes (saved %d, %.1f%%)",
+        total_original,
+        total_minified,
+        total_saved,
+        total_percent,
+    )
+
+    if args.report:
+        report_path = Path(args.report).resolve()
+        ensure_parent_directory(report_path)
+        report_payload = {
+            "total_original_bytes": total_original,
+            "total_minified_bytes": total_minified,
+            "total_saved_bytes": total_saved,
+            "pages": [
+                {
+                    "path": result.relative_path,
+                    "original_bytes": result.original_bytes,
+                    "minified_bytes": result.minified_bytes,
+                    "saved_bytes": result.saved_bytes,
+                }
+                for result in results
+            ],
+        }
+        report_path.write_text(
+            json.dumps(report_payload, indent=2) + "\n",
+            encoding="utf-8",
+        )
+        logging.info("Wrote report: %s", report_path)
+
+    if args.dry_run:
+        logging.info("Dry run enabled; no files written.")
+
+    logging.info("Done.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
+# End Main